@@ -0,0 +1,79 @@
+"""
+백업 내구성 수준(none / set / paranoid)별 백업 처리량을 비교하는 벤치마크입니다.
+
+같은 세이브 파일들로 수준마다 새 백업 폴더에 백업 세트를 여러 개 만들고,
+초당 세트 수, 초당 파일 수, MB/s와 none 대비 처리량 비율을 출력합니다.
+fsync 비용은 저장 장치에 따라 크게 다르므로 실제 백업 폴더가 있는 디스크에서 실행하세요. (--dir)
+
+사용법:
+    python bench_durability.py [--sets 30] [--files 20] [--file-kb 256] [--dir 임시폴더] [--output 결과.json]
+"""
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+
+from file_manager import allocate_set_id, backup_save_file, save_backup_set, DURABILITY_MODES
+
+def run_mode(durability, save_paths, save_folder, backup_folder, set_count):
+    """한 내구성 수준으로 백업 세트를 set_count개 만들고 소요 시간(초)을 반환합니다."""
+    os.makedirs(backup_folder)
+    start = time.perf_counter()
+    for _ in range(set_count):
+        set_id = allocate_set_id(backup_folder)
+        backup_paths = [backup_save_file(path, backup_folder, set_id, durability=durability) for path in save_paths]
+        save_backup_set(backup_folder, set_id, backup_paths, "내구성 벤치마크",
+                        source_paths=save_paths, source_root=save_folder, durability=durability)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="백업 내구성 수준별 처리량 비교")
+    parser.add_argument("--sets", type=int, default=30, help="수준마다 만들 백업 세트 수")
+    parser.add_argument("--files", type=int, default=20, help="세트당 파일 수")
+    parser.add_argument("--file-kb", type=int, default=256, help="파일 하나의 크기 (KB)")
+    parser.add_argument("--dir", default=None, help="작업 폴더 (백업 폴더가 있는 디스크 권장)")
+    parser.add_argument("--output", default=None, help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="durability_bench_", dir=args.dir)
+    try:
+        save_folder = os.path.join(work_dir, "save")
+        os.makedirs(save_folder)
+        save_paths = []
+        for i in range(args.files):
+            path = os.path.join(save_folder, f"slot{i + 1}.sav")
+            with open(path, 'wb') as f:
+                f.write(os.urandom(args.file_kb * 1024))
+            save_paths.append(path)
+
+        total_files = args.sets * args.files
+        total_mb = total_files * args.file_kb / 1024
+        results = {}
+        for durability in DURABILITY_MODES:
+            elapsed = run_mode(durability, save_paths, save_folder,
+                               os.path.join(work_dir, f"backup_{durability}"), args.sets)
+            results[durability] = {
+                "seconds": round(elapsed, 3),
+                "sets_per_s": round(args.sets / elapsed, 2),
+                "files_per_s": round(total_files / elapsed, 1),
+                "mb_per_s": round(total_mb / elapsed, 2),
+            }
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    baseline = results[DURABILITY_MODES[0]]["seconds"]
+    print(f"세트 {args.sets}개 x 파일 {args.files}개 x {args.file_kb} KB")
+    print(f"{'수준':<10} {'소요(초)':>9} {'세트/초':>8} {'파일/초':>9} {'MB/s':>8} {'처리량 비율':>10}")
+    for durability, result in results.items():
+        result["relative_throughput"] = round(baseline / result["seconds"], 3)
+        print(f"{durability:<10} {result['seconds']:>9.2f} {result['sets_per_s']:>8.1f} "
+              f"{result['files_per_s']:>9.0f} {result['mb_per_s']:>8.1f} {result['relative_throughput']:>10.2f}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({"sets": args.sets, "files": args.files, "file_kb": args.file_kb, "results": results},
+                      f, ensure_ascii=False, indent=2)
+
+if __name__ == "__main__":
+    main()
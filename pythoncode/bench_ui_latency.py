@@ -0,0 +1,276 @@
+"""
+백업/복원/목록 새로고침 작업이 Tk 이벤트 루프를 얼마나 오래 막는지 측정하는 벤치마크입니다.
+
+임시 폴더에 가상의 프로필(세이브 파일, 기존 백업 세트)을 만들고 SaveManagerGUI를 띄운 뒤,
+root.after로 일정 간격의 탐침(probe)을 걸어 두고 각 작업을 실행합니다.
+탐침이 예정 시각보다 늦게 실행된 시간이 이벤트 루프 지연이며, 작업별로 p50/p99/최대값을 JSON으로 저장합니다.
+
+대화상자(messagebox)는 자동으로 응답하며, 설정 파일과 백업 폴더는 모두 임시 폴더에 만들어집니다.
+화면이 없는 환경에서는 Xvfb가 설치되어 있으면 가상 화면을 띄워 실행합니다.
+
+사용법:
+    python bench_ui_latency.py [--profiles 3] [--sets 200] [--files 20] [--file-kb 256]
+                               [--repeat 3] [--interval-ms 5] [--output ui_latency.json]
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+# 측정하는 작업 (이름, SaveManagerGUI에서 실행할 함수)
+OPERATIONS = [
+    ("switch_profile", lambda app, name: _switch_profile(app, name)),
+    ("load_backup_sets", lambda app, name: app.load_backup_sets()),
+    ("_refresh_file_list", lambda app, name: app._refresh_file_list()),
+    ("backup_files", lambda app, name: _backup_all(app)),
+    ("restore_backup_set", lambda app, name: _restore_latest(app)),
+]
+
+def _switch_profile(app, profile_name):
+    app.profile_combobox.set(profile_name)
+    app._on_profile_selected(None)
+
+def _backup_all(app):
+    for var in app.checkbox_vars.values():
+        var.set(True)
+    app.backup_files()
+
+def _restore_latest(app):
+    items = app.sets_tree.get_children()
+    if items:
+        app.sets_tree.selection_set(items[0])
+    app.restore_backup_set()
+
+def percentile(values, pct):
+    """정렬된 값 목록에서 백분위수(최근접 순위)를 반환합니다."""
+    if not values:
+        return 0.0
+    rank = max(1, math.ceil(len(values) * pct / 100))
+    return values[rank - 1]
+
+def summarize(values):
+    values = sorted(values)
+    return {
+        "p50": round(percentile(values, 50), 3),
+        "p99": round(percentile(values, 99), 3),
+        "max": round(values[-1], 3) if values else 0.0,
+    }
+
+class LatencyProbe:
+    """일정 간격으로 root.after 콜백을 예약하고, 예정보다 늦게 실행된 시간(ms)을 기록합니다."""
+
+    def __init__(self, root, interval_ms):
+        self.root = root
+        self.interval_ms = interval_ms
+        self.samples = []
+        self._job = None
+        self._expected = 0.0
+
+    def start(self):
+        self.samples = []
+        self._schedule()
+
+    def stop(self):
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+        return self.samples
+
+    def _schedule(self):
+        self._expected = time.perf_counter() + self.interval_ms / 1000
+        self._job = self.root.after(self.interval_ms, self._tick)
+
+    def _tick(self):
+        self.samples.append(max(0.0, (time.perf_counter() - self._expected) * 1000))
+        self._schedule()
+
+def create_profiles(work_dir, profile_count, set_count, file_count, file_kb):
+    """가상의 세이브 폴더와 기존 백업 세트를 만들고 GUI 설정 데이터를 반환합니다."""
+    from file_manager import allocate_set_id, backup_save_file, save_backup_set
+
+    config = {"active_profile": None, "profiles": {}}
+    for p in range(profile_count):
+        profile_name = f"bench_{p + 1}"
+        save_folder = os.path.join(work_dir, "saves", profile_name)
+        backup_folder = os.path.join(work_dir, "backups", profile_name)
+        os.makedirs(save_folder)
+        os.makedirs(backup_folder)
+        save_paths = []
+        for i in range(file_count):
+            path = os.path.join(save_folder, f"slot{i + 1}.sav")
+            with open(path, 'wb') as f:
+                f.write(os.urandom(file_kb * 1024))
+            save_paths.append(path)
+        for s in range(set_count):
+            # 세트마다 파일 하나씩만 새로 백업하여 준비 시간을 줄임
+            source = save_paths[s % file_count]
+            set_id = allocate_set_id(backup_folder)
+            backup_path = backup_save_file(source, backup_folder, set_id)
+            save_backup_set(backup_folder, set_id, [backup_path], f"벤치마크 세트 {s + 1}",
+                            source_paths=[source], source_root=save_folder)
+        config["profiles"][profile_name] = {"save_folder": save_folder}
+        print(f"프로필 준비: {profile_name} (세트 {set_count}개, 파일 {file_count}개)")
+    config["active_profile"] = "bench_1" if profile_count else None
+    return config
+
+def _ensure_display():
+    """화면이 없으면 Xvfb를 띄우고 프로세스를 반환합니다. 필요 없으면 None."""
+    if os.name == "nt" or sys.platform == "darwin" or os.environ.get("DISPLAY"):
+        return None
+    if not shutil.which("Xvfb"):
+        sys.exit("화면(DISPLAY)이 없고 Xvfb도 찾을 수 없습니다. Xvfb를 설치하거나 xvfb-run으로 실행하세요.")
+    display = f":{os.getpid() % 500 + 100}"
+    process = subprocess.Popen(["Xvfb", display, "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(1.0)
+    if process.poll() is not None:
+        sys.exit("Xvfb를 시작하지 못했습니다.")
+    os.environ["DISPLAY"] = display
+    return process
+
+def _auto_answer_dialogs():
+    """벤치마크 중에는 대화상자를 띄우지 않고 바로 응답합니다. (확인 질문은 '예')"""
+    from tkinter import messagebox
+    for name in ("showinfo", "showwarning", "showerror"):
+        setattr(messagebox, name, lambda *args, **kwargs: "ok")
+    messagebox.askyesno = lambda *args, **kwargs: True
+
+# 백업 폴더 경로를 찾는 함수를 가져다 쓰는 모듈 (from file_manager import로 이름을 복사하므로 모듈마다 바꿔야 함)
+BACKUP_FOLDER_LOOKUP_MODULES = ("file_manager", "gui", "daemon", "bundle")
+
+def _redirect_backup_folders(work_dir):
+    """백업 폴더 경로 조회를 임시 폴더 아래로 돌립니다. (file_manager.backup_profile 등이 직접 조회하는 경로 포함)"""
+    def lookup(profile_name):
+        return os.path.join(work_dir, "backups", profile_name)
+    for module_name in BACKUP_FOLDER_LOOKUP_MODULES:
+        module = sys.modules.get(module_name)
+        if module is not None and hasattr(module, "get_backup_folder_path"):
+            module.get_backup_folder_path = lookup
+
+def run(args, work_dir):
+    import tkinter as tk
+    import gui
+
+    config = create_profiles(work_dir, args.profiles, args.sets, args.files, args.file_kb)
+    with open(os.path.join(work_dir, gui.CONFIG_FILE), 'w', encoding='utf-8') as f:
+        json.dump(config, f, ensure_ascii=False)
+    # GUI가 임시 폴더의 설정 파일과 백업 폴더를 사용하도록 함
+    os.chdir(work_dir)
+    _redirect_backup_folders(work_dir)
+    # 실행 중인 백그라운드 서비스가 있어도 연결하지 않음 (서비스는 실제 백업 폴더를 사용)
+    gui.DaemonClient.attach = staticmethod(lambda *args, **kwargs: None)
+    _auto_answer_dialogs()
+
+    root = tk.Tk()
+    app = gui.SaveManagerGUI(root)
+    probe = LatencyProbe(root, args.interval_ms)
+    profile_names = list(config["profiles"])
+    steps = [
+        (op_name, func, profile_name)
+        for _ in range(args.repeat)
+        for profile_name in profile_names
+        for op_name, func in OPERATIONS
+    ]
+    results = {op_name: {"latency": [], "duration": []} for op_name, _ in OPERATIONS}
+    settle_ms = args.settle_ms
+
+    def next_step():
+        if not steps:
+            app._on_close() # 예약된 설정 저장을 마치고 창을 닫으면 mainloop 종료
+            return
+        op_name, func, profile_name = steps.pop(0)
+        probe.start()
+        # 작업 전 잠시 탐침을 돌려 이전 작업이 남긴 콜백을 흘려보냄
+        root.after(settle_ms, lambda: run_operation(op_name, func, profile_name))
+
+    def run_operation(op_name, func, profile_name):
+        first_sample = len(probe.samples)
+        start = time.perf_counter()
+        try:
+            func(app, profile_name)
+        except Exception as e:
+            # 오류가 나도 다음 작업으로 진행 (콜백에서 예외가 나면 측정 순서가 끊김)
+            print(f"{op_name} 실행 중 오류 ({profile_name}): {e}")
+        duration = (time.perf_counter() - start) * 1000
+        # 작업이 예약한 후속 콜백(after, 스레드 결과 반영)까지 포함하여 측정
+        root.after(settle_ms, lambda: finish(op_name, first_sample, duration))
+
+    def finish(op_name, first_sample, duration):
+        if app.transfer_thread is not None and app.transfer_thread.is_alive():
+            # 백업/복원 복사는 작업 스레드에서 진행되므로 끝날 때까지 탐침을 계속 돌림
+            root.after(settle_ms, lambda: finish(op_name, first_sample, duration))
+            return
+        samples = probe.stop()[first_sample:]
+        results[op_name]["latency"].extend(samples)
+        results[op_name]["duration"].append(duration)
+        root.after(0, next_step)
+
+    root.after(500, next_step) # 프로필 로드 직후의 초기화 작업이 끝날 때까지 대기
+    root.mainloop()
+
+    return {
+        "meta": {
+            "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(),
+            "tk": tk.TkVersion,
+            "platform": platform.platform(),
+            "profiles": args.profiles,
+            "sets": args.sets,
+            "files": args.files,
+            "file_kb": args.file_kb,
+            "repeat": args.repeat,
+            "interval_ms": args.interval_ms,
+        },
+        "operations": {
+            op_name: {
+                "runs": len(data["duration"]),
+                "samples": len(data["latency"]),
+                "latency_ms": summarize(data["latency"]),
+                "duration_ms": summarize(data["duration"]),
+            }
+            for op_name, data in results.items()
+        },
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Tk 이벤트 루프 지연 벤치마크")
+    parser.add_argument("--profiles", type=int, default=3, help="가상 프로필 수")
+    parser.add_argument("--sets", type=int, default=200, help="프로필마다 미리 만들 백업 세트 수")
+    parser.add_argument("--files", type=int, default=20, help="프로필마다 세이브 파일 수")
+    parser.add_argument("--file-kb", type=int, default=256, help="세이브 파일 하나의 크기 (KB)")
+    parser.add_argument("--repeat", type=int, default=3, help="작업 반복 횟수")
+    parser.add_argument("--interval-ms", type=int, default=5, help="탐침 간격 (ms)")
+    parser.add_argument("--settle-ms", type=int, default=200, help="작업 전후로 탐침을 더 돌리는 시간 (ms)")
+    parser.add_argument("--output", default="ui_latency.json", help="결과 JSON 파일 경로")
+    args = parser.parse_args()
+    output = os.path.abspath(args.output)
+
+    xvfb = _ensure_display()
+    work_dir = tempfile.mkdtemp(prefix="ui_latency_")
+    cwd = os.getcwd()
+    try:
+        report = run(args, work_dir)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(work_dir, ignore_errors=True)
+        if xvfb is not None:
+            xvfb.terminate()
+
+    print(f"{'작업':<20} {'횟수':>4} {'p50(ms)':>9} {'p99(ms)':>9} {'최대(ms)':>9} {'소요 p50(ms)':>12}")
+    for op_name, data in report["operations"].items():
+        latency = data["latency_ms"]
+        print(f"{op_name:<20} {data['runs']:>4} {latency['p50']:>9.1f} {latency['p99']:>9.1f} "
+              f"{latency['max']:>9.1f} {data['duration_ms']['p50']:>12.1f}")
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+"""
+백업 세트를 다른 컴퓨터로 옮기기 위한 번들(하나의 tar 파일) 내보내기/가져오기입니다.
+
+번들은 스트리밍 tar(gz 또는 xz 압축)이며, 항목은 다음 순서로 기록됩니다.
+    bundle.json         번들 설명: 세트 레코드(매니페스트 포함)와 백업 파일별 내용 해시 또는 조각 레시피
+    files/<SHA-256>     백업 파일의 원래 내용 (같은 내용은 한 번만, 콜드 보관된 파일은 압축을 풀어서)
+    chunks/<SHA-256>    조각으로 저장된 백업 파일이 참조하는 조각 (저장소에 기록된 형태 그대로, 한 번만)
+
+내보내기와 가져오기 모두 파일을 조금씩 읽고 쓰므로 세트 수, 파일 크기와 관계없이 메모리 사용량이 일정합니다.
+가져오기는 대상 백업 폴더에 이미 있는 세트와 조각을 건너뛰고, 새 세트는 카탈로그에 한 번에 추가합니다.
+
+사용법:
+    python bundle.py export --profile 엘든링 [--sets 250401_152655_000000 ...] [--xz] -o 엘든링.gsbundle
+    python bundle.py import --profile 엘든링 엘든링.gsbundle
+    (--profile 대신 --folder로 백업 폴더를 직접 지정할 수 있음)
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import re
+import shutil
+import sys
+import tarfile
+import time
+from datetime import datetime
+
+from chunk_store import ChunkStore, CHUNKED_SUFFIX, read_recipe, recipe_digests, write_recipe
+from file_manager import (
+    get_backup_folder_path, get_backup_sets, get_set_manifest, get_backup_file_path,
+    backup_file_locations, resolve_backup_file, open_backup_file, merge_backup_sets, is_safe_relative_path,
+    get_original_filename, backup_set_lock, _parse_backup_file_name,
+    CATALOG_SCHEMA_VERSION
+)
+
+BUNDLE_FORMAT = "gamesaver-bundle"
+BUNDLE_VERSION = 1
+BUNDLE_MANIFEST = "bundle.json"
+BUNDLE_EXTENSION = ".gsbundle"
+BUNDLE_COMPRESSIONS = ("gz", "xz")
+
+# 내보낼 때 세트 레코드에서 빼는 값 (이 컴퓨터의 보관 상태)
+_LOCAL_RECORD_KEYS = ("tier", "damaged")
+_HASH_PATTERN = re.compile(r'[0-9a-f]{64}')
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+class _HashingReader:
+    """읽은 내용의 SHA-256 해시를 함께 계산하는 파일 객체 래퍼입니다."""
+
+    def __init__(self, f):
+        self._f = f
+        self._hasher = hashlib.sha256()
+
+    def read(self, size=-1):
+        data = self._f.read(size)
+        self._hasher.update(data)
+        return data
+
+    def hexdigest(self):
+        return self._hasher.hexdigest()
+
+def _content_size(backup_path, stored_path):
+    """백업 파일의 원래 내용 크기를 반환합니다. (콜드 보관된 파일은 압축을 풀어 확인)"""
+    if stored_path == backup_path:
+        return os.path.getsize(backup_path)
+    size = 0
+    with open_backup_file(backup_path) as f:
+        while True:
+            chunk = f.read(_COPY_BUFFER_SIZE)
+            if not chunk:
+                return size
+            size += len(chunk)
+
+def _add_bytes(tar, name, data):
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mtime = int(time.time())
+    tar.addfile(info, io.BytesIO(data))
+
+def export_backup_sets(backup_folder, output_path, set_ids=None, compression="gz", progress_callback=None):
+    """
+    백업 세트들을 번들 파일 하나로 내보냅니다.
+    번들은 '<output_path>.part'에 기록한 뒤 끝까지 기록되면 이름을 바꾸므로, 중간에 실패해도 불완전한 번들이 남지 않습니다.
+
+    Parameters:
+    backup_folder (str): 백업 폴더 경로
+    output_path (str): 번들 파일 경로
+    set_ids (list, optional): 내보낼 세트 ID 목록. 없으면 모든 세트
+    compression (str): 압축 방식 ("gz" 또는 "xz")
+    progress_callback (callable, optional): progress_callback(기록한 항목 수, 전체 항목 수)
+
+    Returns:
+    dict: {"sets": 세트 수, "files": 백업 파일 수, "contents": 기록한 파일 내용 수,
+           "chunks": 기록한 조각 수, "bytes": 번들 크기}
+    """
+    if compression not in BUNDLE_COMPRESSIONS:
+        raise ValueError(f"지원하지 않는 압축 방식입니다: {compression}")
+    backup_sets = get_backup_sets(backup_folder)
+    if set_ids is None:
+        set_ids = sorted(backup_sets)
+    missing = [set_id for set_id in set_ids if set_id not in backup_sets]
+    if missing:
+        raise KeyError(f"백업 세트를 찾을 수 없습니다: {', '.join(missing)}")
+
+    records = {}
+    files = {}       # 백업 파일명 -> {"content": 내용 해시} 또는 {"recipe": 조각 레시피}
+    contents = {}    # 내용 해시 -> (백업 파일명, 원래 크기)
+    chunks = {}      # 조각 해시 (순서를 유지하는 집합)
+    for set_id in set_ids:
+        backup_set = backup_sets[set_id]
+        # 이전 형식의 세트는 매니페스트를 만들어 함께 내보냄 (가져온 쪽에서 해시를 다시 계산하지 않도록)
+        record = {key: value for key, value in backup_set.items() if key not in _LOCAL_RECORD_KEYS}
+        # 세이브 폴더 밖의 원본 경로(이전 버전에서 기록된 "../x" 등)는 가져온 쪽에서 거부되므로 파일명으로 바꿈
+        record["manifest"] = [
+            entry if is_safe_relative_path(entry.get("path"))
+            else dict(entry, path=get_original_filename(entry["file"]))
+            for entry in get_set_manifest(backup_folder, backup_set)
+        ]
+        record["schema"] = CATALOG_SCHEMA_VERSION
+        record["files"] = [entry["file"] for entry in record["manifest"]]
+        for entry in record["manifest"]:
+            # 위치를 찾고 읽는 동안 세트 폴더로 옮겨지거나 콜드 보관 사본으로 바뀌지 않도록 잠금
+            with backup_set_lock(backup_folder, [entry["file"]]):
+                backup_path = get_backup_file_path(backup_folder, entry["file"])
+                stored_path = resolve_backup_file(backup_path)
+                if not os.path.exists(stored_path):
+                    raise FileNotFoundError(f"백업 파일이 없습니다: {entry['file']}")
+                if stored_path.endswith(CHUNKED_SUFFIX):
+                    recipe = read_recipe(stored_path)
+                    files[entry["file"]] = {"recipe": recipe}
+                    chunks.update(dict.fromkeys(recipe_digests(recipe)))
+                    continue
+                file_hash = entry.get("hash")
+                if not file_hash:
+                    raise ValueError(f"백업 파일의 해시가 없습니다: {entry['file']}")
+                files[entry["file"]] = {"content": file_hash}
+                if file_hash not in contents:
+                    # tar 항목 헤더에 크기가 먼저 기록되므로, 매니페스트와 실제 크기가 다르면 실제 크기를 사용
+                    contents[file_hash] = (entry["file"], _content_size(backup_path, stored_path))
+        records[set_id] = record
+
+    manifest = {
+        "format": BUNDLE_FORMAT,
+        "version": BUNDLE_VERSION,
+        "created": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "source": os.path.basename(os.path.normpath(backup_folder)),
+        "members": len(contents) + len(chunks),
+        "sets": records,
+        "files": files,
+    }
+    total = manifest["members"]
+    done = 0
+    store = ChunkStore(backup_folder)
+    tmp_path = output_path + ".part"
+    try:
+        with open(tmp_path, 'wb') as out, tarfile.open(fileobj=out, mode="w|" + compression) as tar:
+            _add_bytes(tar, BUNDLE_MANIFEST, json.dumps(manifest, ensure_ascii=False).encode('utf-8'))
+            for file_hash, (name, size) in contents.items():
+                info = tarfile.TarInfo(f"files/{file_hash}")
+                info.size = size
+                info.mtime = int(time.time())
+                with backup_set_lock(backup_folder, [name]):
+                    with open_backup_file(get_backup_file_path(backup_folder, name)) as f:
+                        reader = _HashingReader(f)
+                        tar.addfile(info, reader)
+                # 손상된 백업 파일을 내보내지 않음 (가져온 쪽에서도 확인하지만 원인을 여기서 알리기 위해)
+                if reader.hexdigest() != file_hash:
+                    raise ValueError(f"백업 파일 내용이 카탈로그와 다릅니다: {name}")
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total)
+            for digest in chunks:
+                chunk_path = store.path(digest)
+                info = tarfile.TarInfo(f"chunks/{digest}")
+                with open(chunk_path, 'rb') as f:
+                    info.size = os.fstat(f.fileno()).st_size
+                    info.mtime = int(time.time())
+                    tar.addfile(info, f)
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    return {
+        "sets": len(records),
+        "files": len(files),
+        "contents": len(contents),
+        "chunks": len(chunks),
+        "bytes": os.path.getsize(output_path),
+    }
+
+def _check_bundle_manifest(manifest):
+    """
+    번들 설명의 형식, 파일명과 원본 경로를 확인합니다.
+    백업 파일은 세트 폴더 밖에, 복원할 파일은 세이브 폴더 밖에 기록되지 않도록 합니다.
+    """
+    if not isinstance(manifest, dict) or manifest.get("format") != BUNDLE_FORMAT:
+        raise ValueError("게임 세이버 번들이 아닙니다.")
+    if manifest.get("version", 0) > BUNDLE_VERSION:
+        raise ValueError(f"지원하지 않는 번들 버전입니다: {manifest.get('version')}")
+    files = manifest.get("files", {})
+    for set_id, record in manifest.get("sets", {}).items():
+        if record.get("id", set_id) != set_id or not isinstance(record.get("files"), list):
+            raise ValueError(f"번들의 세트 정보가 올바르지 않습니다: {set_id}")
+        for name in record["files"]:
+            # 파일명은 이 세트의 ID가 붙은 백업 파일명이어야 하며, 이 세트의 폴더 안에만 기록
+            # (파일은 파일명의 타임스탬프로 세트 폴더를 정하므로 다른 세트의 폴더나 파일을 덮어쓰지 않도록 확인)
+            if (not isinstance(name, str) or os.path.basename(name) != name or "/" in name or "\\" in name
+                    or _parse_backup_file_name(name)[0] != set_id):
+                raise ValueError(f"번들의 백업 파일명이 올바르지 않습니다: {name}")
+            source = files.get(name)
+            if not isinstance(source, dict) or not isinstance(source.get("recipe", {}), dict):
+                raise ValueError(f"번들에 백업 파일 정보가 없습니다: {name}")
+            digests = recipe_digests(source["recipe"]) if "recipe" in source else [source.get("content")]
+            if not all(isinstance(digest, str) and _HASH_PATTERN.fullmatch(digest) for digest in digests):
+                raise ValueError(f"번들의 해시가 올바르지 않습니다: {name}")
+        manifest_entries = record.get("manifest")
+        if not isinstance(manifest_entries, list):
+            raise ValueError(f"번들의 세트에 매니페스트가 없습니다: {set_id}")
+        set_files = set(record["files"])
+        for entry in manifest_entries:
+            if not isinstance(entry, dict) or entry.get("file") not in set_files:
+                raise ValueError(f"번들의 매니페스트 항목이 올바르지 않습니다: {set_id}")
+            if not is_safe_relative_path(entry.get("path")):
+                raise ValueError(f"번들의 원본 경로가 세이브 폴더 밖을 가리킵니다: {entry.get('path')!r}")
+
+def _import_content(backup_folder, fileobj, content_hash, names, created_folders):
+    """
+    번들의 파일 내용 하나를 같은 내용의 백업 파일들로 기록합니다.
+
+    Returns:
+    list: 기록한 백업 파일 경로 목록
+    """
+    paths = []
+    for name in names:
+        path = os.path.join(backup_folder, backup_file_locations(name)[0])
+        folder = os.path.dirname(path)
+        if not os.path.isdir(folder):
+            os.makedirs(folder)
+            created_folders.append(folder)
+        paths.append(path)
+
+    tmp_path = paths[0] + ".part"
+    reader = _HashingReader(fileobj)
+    with open(tmp_path, 'wb') as f:
+        shutil.copyfileobj(reader, f, _COPY_BUFFER_SIZE)
+    if reader.hexdigest() != content_hash:
+        os.remove(tmp_path)
+        raise ValueError(f"번들의 파일 내용이 손상되었습니다: {names[0]}")
+    os.replace(tmp_path, paths[0])
+    for path in paths[1:]:
+        shutil.copyfile(paths[0], path)
+    return paths
+
+def import_bundle(backup_folder, bundle_path, progress_callback=None):
+    """
+    번들의 백업 세트를 백업 폴더로 가져옵니다.
+    백업 폴더에 이미 있는 세트와 조각은 건너뛰며, 새 세트는 파일을 모두 기록한 뒤 카탈로그에 한 번에 추가합니다.
+    중간에 실패하면 가져오면서 만든 세트 폴더를 지웁니다. (이미 기록한 조각은 조각 정리 작업이 정리)
+
+    Parameters:
+    backup_folder (str): 백업 폴더 경로
+    bundle_path (str): 번들 파일 경로
+    progress_callback (callable, optional): progress_callback(읽은 항목 수, 전체 항목 수)
+
+    Returns:
+    dict: {"sets": 가져온 세트 ID 목록, "skipped_sets": 이미 있어 건너뛴 세트 수,
+           "files": 기록한 백업 파일 수, "chunks": 기록한 조각 수, "chunks_skipped": 이미 있던 조각 수}
+    """
+    os.makedirs(backup_folder, exist_ok=True)
+    existing = get_backup_sets(backup_folder)
+    store = ChunkStore(backup_folder)
+    result = {"sets": [], "skipped_sets": 0, "files": 0, "chunks": 0, "chunks_skipped": 0}
+    created_folders = []
+    written = []
+    try:
+        with tarfile.open(bundle_path, mode="r|*") as tar:
+            member = tar.next()
+            if member is None or member.name != BUNDLE_MANIFEST or not member.isfile():
+                raise ValueError("번들 설명(bundle.json)이 없습니다.")
+            manifest = json.loads(tar.extractfile(member).read())
+            _check_bundle_manifest(manifest)
+
+            records = {set_id: record for set_id, record in manifest["sets"].items() if set_id not in existing}
+            result["skipped_sets"] = len(manifest["sets"]) - len(records)
+            targets = {}   # 내용 해시 -> 기록할 백업 파일명 목록
+            recipes = {}   # 백업 파일명 -> 조각 레시피
+            for record in records.values():
+                for name in record["files"]:
+                    source = manifest["files"][name]
+                    if "recipe" in source:
+                        recipes[name] = source["recipe"]
+                    else:
+                        targets.setdefault(source["content"], []).append(name)
+
+            needed_chunks = {digest for recipe in recipes.values() for digest in recipe_digests(recipe)}
+            total = manifest.get("members", 0)
+            done = 0
+            while True:
+                member = tar.next()
+                if member is None:
+                    break
+                kind, _, key = member.name.partition("/")
+                if member.isfile() and kind == "files" and key in targets:
+                    paths = _import_content(backup_folder, tar.extractfile(member), key, targets.pop(key),
+                                            created_folders)
+                    written.extend(paths)
+                elif member.isfile() and kind == "chunks" and key in needed_chunks:
+                    # 이미 있는 조각은 수정 시각만 갱신하여 레시피를 기록하기 전에 정리되지 않도록 보호
+                    if store.touch(key):
+                        result["chunks_skipped"] += 1
+                    else:
+                        # 카탈로그가 참조하기 전에 디스크에 기록 (레시피와 백업 파일은 merge_backup_sets가 기록)
+                        store.put_stored(key, tar.extractfile(member), fsync=True)
+                        result["chunks"] += 1
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total)
+
+            if targets:
+                missing = [name for names in targets.values() for name in names]
+                raise ValueError(f"번들에 백업 파일 내용이 없습니다: {', '.join(missing[:5])}")
+            for name, recipe in recipes.items():
+                if not all(os.path.exists(store.path(digest)) for digest in recipe_digests(recipe)):
+                    raise ValueError(f"번들에 조각이 빠져 있습니다: {name}")
+                path = os.path.join(backup_folder, backup_file_locations(name)[0])
+                folder = os.path.dirname(path)
+                if not os.path.isdir(folder):
+                    os.makedirs(folder)
+                    created_folders.append(folder)
+                write_recipe(path + CHUNKED_SUFFIX, recipe)
+                written.append(path)
+
+        result["sets"] = merge_backup_sets(backup_folder, records, written)
+    except BaseException:
+        for folder in created_folders:
+            shutil.rmtree(folder, ignore_errors=True)
+        raise
+
+    result["files"] = len(written)
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="백업 세트 번들 내보내기/가져오기")
+    commands = parser.add_subparsers(dest="command", required=True)
+    for command in ("export", "import"):
+        sub = commands.add_parser(command, help="번들로 내보내기" if command == "export" else "번들 가져오기")
+        target = sub.add_mutually_exclusive_group(required=True)
+        target.add_argument("--profile", help="프로필 이름 (프로그램의 backups 폴더 사용)")
+        target.add_argument("--folder", help="백업 폴더 경로")
+        if command == "export":
+            sub.add_argument("--sets", nargs="+", default=None, help="내보낼 세트 ID (기본: 모든 세트)")
+            sub.add_argument("--xz", action="store_true", help="gzip 대신 xz로 압축 (느리지만 더 작음)")
+            sub.add_argument("-o", "--output", required=True, help="번들 파일 경로")
+        else:
+            sub.add_argument("bundle", help="번들 파일 경로")
+    args = parser.parse_args()
+
+    backup_folder = args.folder or get_backup_folder_path(args.profile)
+    try:
+        if args.command == "export":
+            result = export_backup_sets(backup_folder, args.output, args.sets, "xz" if args.xz else "gz")
+        else:
+            result = import_bundle(backup_folder, args.bundle)
+    except (OSError, ValueError, KeyError, tarfile.TarError) as e:
+        print(f"{'내보내기' if args.command == 'export' else '가져오기'} 실패: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+import os
+import io
+import json
+import zlib
+import base64
+import hashlib
+import shutil
+import tempfile
+import threading
+import time
+
+from utils import atomic_write_bytes, fsync_directory
+
+# 조각(chunk) 저장소 폴더. 조각은 내용 해시 앞 두 글자로 나눈 하위 폴더에 저장 (예: "chunks/3f/3fa9...")
+CHUNKS_DIR = "chunks"
+# 조각으로 나누어 저장한 백업 파일(레시피)의 접미사 (예: "save_250401_152655.sav.chunks")
+CHUNKED_SUFFIX = ".chunks"
+RECIPE_VERSION = 1
+# 이 크기 이하의 조각은 저장소에 따로 파일을 만들지 않고 레시피에 그대로 넣음 (zip 헤더 등)
+INLINE_MAX_SIZE = 4096
+# 어느 레시피도 참조하지 않는 조각이라도 최근에 기록/참조된 것은 지우지 않음 (레시피를 기록 중인 백업 대비)
+GC_GRACE_SECONDS = 3600
+
+# 조각 파일의 첫 바이트: 저장 형태
+_RAW = b"\x00"
+_ZLIB = b"\x01"
+
+# 저장소(폴더)별 잠금: 조각 참조(수정 시각 갱신)/기록과 정리 작업의 삭제가 엇갈리지 않도록 함
+_store_locks = {}
+_store_locks_guard = threading.Lock()
+
+def _store_lock(root):
+    key = os.path.normcase(os.path.abspath(root))
+    with _store_locks_guard:
+        lock = _store_locks.get(key)
+        if lock is None:
+            lock = _store_locks[key] = threading.Lock()
+        return lock
+
+class ChunkCorruptError(OSError):
+    """조각이나 다시 조립한 파일의 내용이 해시와 맞지 않을 때 발생합니다."""
+
+class ChunkStore:
+    """
+    백업 폴더의 내용 주소(SHA-256) 기반 조각 저장소입니다.
+    같은 내용의 조각은 여러 백업 세트가 함께 사용하며, 조각은 줄어드는 경우에만 zlib으로 압축해 저장합니다.
+    """
+
+    def __init__(self, backup_folder):
+        self.root = os.path.join(backup_folder, CHUNKS_DIR)
+        self._lock = _store_lock(self.root)
+
+    def path(self, digest):
+        return os.path.join(self.root, digest[:2], digest)
+
+    def put(self, data, fsync=False):
+        """
+        조각을 저장하고 (해시, 새로 기록한 바이트 수)를 반환합니다.
+        이미 있는 조각은 다시 기록하지 않고 수정 시각만 갱신하여 정리 작업(collect_garbage)에서 보호합니다.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        if self.touch(digest):
+            return digest, 0
+        compressed = zlib.compress(data, 6)
+        payload = _ZLIB + compressed if len(compressed) < len(data) else _RAW + bytes(data)
+        path = self.path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._lock:
+            atomic_write_bytes(path, payload, fsync=fsync)
+        return digest, len(payload)
+
+    def touch(self, digest):
+        """
+        조각이 있으면 수정 시각을 갱신하여 정리 작업에서 보호하고 True를 반환합니다. 없으면 False.
+        정리 작업의 삭제와 같은 잠금 안에서 갱신하므로, True를 받은 조각은 유예 시간 동안 지워지지 않습니다.
+        """
+        with self._lock:
+            try:
+                os.utime(self.path(digest))
+                return True
+            except FileNotFoundError:
+                return False
+
+    def get(self, digest):
+        """조각 내용을 반환합니다. 내용이 해시와 다르면 ChunkCorruptError가 발생합니다."""
+        with open(self.path(digest), 'rb') as f:
+            return _decode_payload(f.read(), digest)
+
+    def put_stored(self, digest, fileobj, fsync=False):
+        """
+        다른 저장소의 조각 파일(저장 형태 그대로)을 읽어 기록합니다. (번들 가져오기용)
+        내용이 해시와 다르면 기록하지 않고 ChunkCorruptError가 발생합니다.
+        fsync가 True면 rename 전에 내용을, rename 후에 조각 폴더를 디스크에 기록합니다.
+        """
+        path = self.path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".tmp_", dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, 'w+b') as f:
+                shutil.copyfileobj(fileobj, f)
+                f.seek(0)
+                _decode_payload(f.read(), digest)
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.chmod(tmp_path, 0o644)
+            with self._lock:
+                os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        if fsync:
+            fsync_directory(os.path.dirname(path))
+
+    def iter_digests(self):
+        """저장된 조각의 (해시, stat 결과)를 차례로 반환합니다."""
+        if not os.path.isdir(self.root):
+            return
+        with os.scandir(self.root) as prefixes:
+            prefix_dirs = [entry.path for entry in prefixes if entry.is_dir(follow_symlinks=False)]
+        for prefix_dir in prefix_dirs:
+            with os.scandir(prefix_dir) as entries:
+                for entry in entries:
+                    if not entry.name.startswith(".") and entry.is_file(follow_symlinks=False):
+                        yield entry.name, entry.stat(follow_symlinks=False)
+
+    def collect_garbage(self, referenced, grace_seconds=GC_GRACE_SECONDS):
+        """
+        referenced에 없는 조각을 삭제합니다. 최근 grace_seconds 안에 기록/참조된 조각은 남겨 둡니다.
+        목록을 만든 뒤에 다시 참조된 조각을 지우지 않도록, 삭제 직전에 잠금 안에서 수정 시각을 다시 확인합니다.
+
+        Returns:
+        tuple: (삭제한 조각 수, 삭제한 바이트 수)
+        """
+        cutoff = time.time() - grace_seconds
+        removed, removed_bytes = 0, 0
+        for digest, st in list(self.iter_digests()):
+            if digest in referenced or st.st_mtime >= cutoff:
+                continue
+            path = self.path(digest)
+            with self._lock:
+                try:
+                    st = os.stat(path)
+                    if st.st_mtime >= cutoff:
+                        continue
+                    os.remove(path)
+                except FileNotFoundError:
+                    continue
+            removed += 1
+            removed_bytes += st.st_size
+        return removed, removed_bytes
+
+def _decode_payload(payload, digest):
+    """조각 파일의 내용을 풀어 원래 데이터를 반환하고 해시를 확인합니다."""
+    try:
+        data = zlib.decompress(payload[1:]) if payload[:1] == _ZLIB else payload[1:]
+    except zlib.error as e:
+        raise ChunkCorruptError(f"조각을 읽을 수 없습니다 ({digest}): {e}")
+    if hashlib.sha256(data).hexdigest() != digest:
+        raise ChunkCorruptError(f"조각 내용이 손상되었습니다: {digest}")
+    return data
+
+def store_for_recipe(recipe_path):
+    """레시피가 있는 백업 폴더의 조각 저장소를 반환합니다. (레시피는 '<백업 폴더>/sets/<세트 ID>/'에 저장됨)"""
+    return ChunkStore(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(recipe_path)))))
+
+def store_pieces(store, pieces, fsync=False):
+    """
+    형식 처리기(save_formats)가 나눈 조각들을 저장소에 기록하고 레시피의 구간 목록을 만듭니다.
+
+    Parameters:
+    store (ChunkStore): 조각 저장소
+    pieces (iterable): ("raw", 데이터) 조각들 (원래 바이트 순서)
+    fsync (bool): 새로 기록한 조각을 바로 디스크에 기록할지 여부
+
+    Returns:
+    tuple: (구간 목록, 새로 기록한 조각 바이트 수)
+    """
+    segments = []
+    written = 0
+    for _, data in pieces:
+        if not data:
+            continue
+        if len(data) <= INLINE_MAX_SIZE:
+            segment = {"data": base64.b64encode(data).decode("ascii")}
+        else:
+            digest, stored = store.put(data, fsync)
+            written += stored
+            segment = {"chunk": digest}
+        segments.append(segment)
+    return segments, written
+
+def write_recipe(path, recipe, fsync=False):
+    atomic_write_bytes(path, json.dumps(recipe, separators=(",", ":")).encode('utf-8'), fsync=fsync)
+
+def read_recipe(path):
+    with open(path, 'rb') as f:
+        recipe = json.loads(f.read())
+    if recipe.get("version", 0) > RECIPE_VERSION:
+        raise ValueError(f"지원하지 않는 레시피 버전입니다: {path}")
+    return recipe
+
+def recipe_digests(recipe):
+    """레시피가 참조하는 조각 해시 목록을 반환합니다."""
+    return [segment["chunk"] for segment in recipe.get("segments", []) if "chunk" in segment]
+
+def _segment_bytes(store, segment):
+    """
+    구간 하나의 원래 바이트를 만듭니다.
+    이전 버전이 zip 항목의 압축을 풀어 저장한 deflate 구간은 기록된 설정으로 다시 압축합니다.
+    (백업한 컴퓨터와 zlib 빌드가 다르면 결과가 달라질 수 있으며, 이 경우 전체 해시 확인에서 오류가 발생)
+    """
+    data = base64.b64decode(segment["data"]) if "data" in segment else store.get(segment["chunk"])
+    if "deflate" in segment:
+        level, mem_level = segment["deflate"]
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15, mem_level)
+        data = compressor.compress(data) + compressor.flush()
+    return data
+
+class ChunkedReader(io.RawIOBase):
+    """
+    레시피의 구간을 차례로 조립하여 원래 파일 내용을 읽는 파일 객체입니다.
+    끝까지 읽으면 전체 내용의 해시를 레시피와 비교하며, 다르면 ChunkCorruptError가 발생합니다.
+    """
+
+    def __init__(self, recipe_path):
+        super().__init__()
+        self.recipe = read_recipe(recipe_path)
+        self._store = store_for_recipe(recipe_path)
+        self._segments = iter(self.recipe.get("segments", []))
+        self._buffer = b""
+        self._offset = 0
+        self._hasher = hashlib.sha256()
+        self._verified = False
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while self._offset >= len(self._buffer):
+            segment = next(self._segments, None)
+            if segment is None:
+                self._verify()
+                return 0
+            self._buffer = _segment_bytes(self._store, segment)
+            self._offset = 0
+            self._hasher.update(self._buffer)
+        n = min(len(b), len(self._buffer) - self._offset)
+        b[:n] = self._buffer[self._offset:self._offset + n]
+        self._offset += n
+        return n
+
+    def _verify(self):
+        if not self._verified:
+            self._verified = True
+            if self._hasher.hexdigest() != self.recipe.get("sha256"):
+                if any("deflate" in segment for segment in self.recipe.get("segments", [])):
+                    raise ChunkCorruptError(
+                        f"조립한 파일이 원본과 다릅니다 ({self.recipe.get('format')} 형식, 이전 버전에서 압축을 풀어 저장한 "
+                        f"zip 항목이 있어 백업한 컴퓨터와 zlib 버전이 다르면 복원할 수 없습니다. 현재 zlib {zlib.ZLIB_RUNTIME_VERSION})")
+                raise ChunkCorruptError(f"조립한 파일이 원본과 다릅니다 ({self.recipe.get('format')} 형식)")
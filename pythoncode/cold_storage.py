@@ -0,0 +1,199 @@
+import os
+import lzma
+import hashlib
+from datetime import datetime, timedelta
+
+from file_manager import (
+    get_backup_sets, get_set_manifest, set_backup_set_tier, mark_damaged_sets, get_backup_file_path,
+    relocate_backup_set, backup_set_lock, COLD_SUFFIX
+)
+from io_policy import IOPolicy
+from utils import iter_content_chunks
+
+COLD_TIER = "cold"
+# lzma 압축 수준 (9: 가장 높은 압축률)
+COLD_PRESET = 9
+# preset 9의 기본 사전 크기 (64 MB). 작은 파일은 파일 크기만큼만 사용하여 메모리를 아낌
+_MAX_DICT_SIZE = 64 * 1024 * 1024
+_MIN_DICT_SIZE = 4096
+
+def _lzma_filters(file_size):
+    dict_size = max(_MIN_DICT_SIZE, min(_MAX_DICT_SIZE, file_size))
+    return [{"id": lzma.FILTER_LZMA2, "preset": COLD_PRESET, "dict_size": dict_size}]
+
+def _compress_file(src, dst, io_policy, stop_event=None):
+    """
+    src를 lzma로 압축하여 dst에 원자적으로 기록하고, 원본 내용의 SHA-256 해시를 반환합니다.
+    중단되면 임시 파일을 지우고 None을 반환합니다. 희소 파일의 구멍은 읽지 않고 0으로 압축합니다.
+    """
+    tmp_path = dst + ".part"
+    hasher = hashlib.sha256()
+    try:
+        with open(src, 'rb') as fsrc, open(tmp_path, 'wb') as fdst:
+            with lzma.open(fdst, 'wb', filters=_lzma_filters(os.fstat(fsrc.fileno()).st_size)) as compressor:
+                for chunk, from_disk in iter_content_chunks(fsrc, io_policy.chunk_size):
+                    if stop_event is not None and stop_event.is_set():
+                        break
+                    hasher.update(chunk)
+                    compressor.write(chunk)
+                    if from_disk:
+                        io_policy.throttle(len(chunk))
+            if stop_event is not None and stop_event.is_set():
+                raise InterruptedError
+            fdst.flush()
+            os.fsync(fdst.fileno())
+    except InterruptedError:
+        os.remove(tmp_path)
+        return None
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, dst)
+    return hasher.hexdigest()
+
+def _hash_compressed(path, io_policy):
+    """압축 파일을 풀면서 내용의 SHA-256 해시를 계산합니다."""
+    hasher = hashlib.sha256()
+    with lzma.open(path, 'rb') as f:
+        while True:
+            chunk = f.read(io_policy.chunk_size)
+            if not chunk:
+                break
+            hasher.update(chunk)
+            io_policy.throttle(len(chunk))
+    return hasher.hexdigest()
+
+def _file_identity(path):
+    st = os.stat(path)
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+def _swap_to_compressed(backup_folder, file, src, dst, identity):
+    """
+    확인된 압축 사본으로 원본을 바꿉니다. (원본 삭제)
+    복원/삭제/내보내기가 파일 위치를 찾고 여는 동안과 겹치지 않도록 세트 잠금 안에서 바꾸며,
+    압축하는 동안 원본이 바뀌었거나 세트가 삭제되었으면 압축 사본을 지우고 False를 반환합니다.
+    """
+    with backup_set_lock(backup_folder, [file]):
+        try:
+            swapped = _file_identity(src) == identity
+            if swapped:
+                os.remove(src)
+        except FileNotFoundError:
+            swapped = False
+        except OSError:
+            swapped = False # 윈도우에서 다른 작업이 원본을 읽고 있음 - 다음에 다시 시도
+        if not swapped:
+            try:
+                os.remove(dst)
+            except FileNotFoundError:
+                pass
+    return swapped
+
+def move_set_to_cold(backup_folder, set_id, io_policy=None, stop_event=None):
+    """
+    백업 세트의 파일들을 lzma로 압축한 사본으로 바꾸고 세트를 콜드 보관으로 표시합니다.
+
+    각 파일은 압축 사본을 디스크에 기록하고 압축을 풀어 내용을 확인한 뒤에만 원본을 지우므로,
+    중간에 중단되어도 파일이 사라지지 않습니다. 이미 압축된 파일은 건너뜁니다.
+    압축과 확인은 잠금 없이 하고, 원본을 지우는 교체만 세트 잠금(backup_set_lock) 안에서 합니다.
+    (오래 걸리는 압축 동안 같은 세트의 복원/삭제가 기다리지 않도록)
+    매니페스트의 해시와 원본 내용이 다르면 해당 파일은 압축하지 않고 세트를 손상으로 표시합니다.
+
+    Parameters:
+    backup_folder (str): 백업 폴더 경로
+    set_id (str): 백업 세트 ID
+    io_policy (IOPolicy, optional): I/O 정책. 없으면 낮은 우선순위로 실행
+    stop_event (threading.Event, optional): 설정되면 현재 파일까지만 처리하고 중단
+
+    Returns:
+    dict: {"completed", "files", "before", "after"} 압축한 파일 수와 압축 전/후 크기
+    """
+    io_policy = io_policy or IOPolicy(low_priority=True)
+    result = {"completed": False, "files": 0, "before": 0, "after": 0}
+    backup_set = get_backup_sets(backup_folder).get(set_id)
+    if not isinstance(backup_set, dict):
+        return result
+
+    # 압축하는 동안 파일이 세트 폴더로 옮겨지지 않도록 이전 형식의 파일을 먼저 옮김
+    relocate_backup_set(backup_folder, set_id)
+    damaged = []
+    swapped_all = True
+    with io_policy.priority():
+        for entry in get_set_manifest(backup_folder, backup_set, with_hash=False):
+            if stop_event is not None and stop_event.is_set():
+                return result
+            src = get_backup_file_path(backup_folder, entry["file"])
+            dst = src + COLD_SUFFIX
+            if not os.path.exists(src):
+                continue # 이미 압축되었거나 사라진 파일
+
+            try:
+                identity = _file_identity(src)
+                source_hash = _compress_file(src, dst, io_policy, stop_event)
+            except FileNotFoundError:
+                swapped_all = False # 압축하는 동안 세트가 삭제됨
+                continue
+            if source_hash is None:
+                return result
+            expected = entry.get("hash")
+            if (expected and source_hash != expected) or _hash_compressed(dst, io_policy) != source_hash:
+                print(f"콜드 보관 건너뜀 (내용 불일치): {entry['file']}")
+                os.remove(dst)
+                damaged.append(entry["file"])
+                continue
+            if not _swap_to_compressed(backup_folder, entry["file"], src, dst, identity):
+                swapped_all = False
+                continue
+            result["files"] += 1
+            result["before"] += identity[1]
+            result["after"] += os.path.getsize(dst)
+
+    if damaged:
+        mark_damaged_sets(backup_folder, {set_id: damaged})
+        return result
+    if not swapped_all:
+        return result # 교체하지 못한 파일은 다음 실행 때 다시 압축
+    set_backup_set_tier(backup_folder, set_id, COLD_TIER)
+    result["completed"] = True
+    return result
+
+def compress_old_sets(backup_folder, older_than_days, io_policy=None, stop_event=None, progress_callback=None):
+    """
+    지정한 일수보다 오래된 백업 세트를 콜드 보관 계층으로 옮깁니다.
+    복원은 압축 사본에서 그대로 동작하므로 사용자가 따로 할 일은 없습니다.
+
+    Parameters:
+    backup_folder (str): 백업 폴더 경로
+    older_than_days (float): 이 일수보다 오래된 세트를 압축
+    io_policy (IOPolicy, optional): I/O 정책. 없으면 낮은 우선순위로 실행
+    stop_event (threading.Event, optional): 설정되면 중단 (다음 실행 때 이어서 진행)
+    progress_callback (callable, optional): 세트 하나가 끝날 때마다 (처리 수, 전체 수)로 호출
+
+    Returns:
+    dict: {"completed", "sets", "files", "before", "after"}
+    """
+    cutoff = (datetime.now() - timedelta(days=older_than_days)).strftime("%Y-%m-%d %H:%M:%S")
+    candidates = sorted(
+        set_id for set_id, backup_set in get_backup_sets(backup_folder).items()
+        if isinstance(backup_set, dict)
+        and backup_set.get("tier") != COLD_TIER
+        and not backup_set.get("damaged") # 손상된 세트는 확인 전까지 그대로 둠
+        and isinstance(backup_set.get("manifest"), list) # 형식 변환 전의 세트는 해시가 없어 나중에 처리
+        and backup_set.get("date", "") < cutoff
+    )
+
+    summary = {"completed": False, "sets": 0, "files": 0, "before": 0, "after": 0}
+    for index, set_id in enumerate(candidates, 1):
+        if stop_event is not None and stop_event.is_set():
+            return summary
+        result = move_set_to_cold(backup_folder, set_id, io_policy, stop_event)
+        summary["files"] += result["files"]
+        summary["before"] += result["before"]
+        summary["after"] += result["after"]
+        if result["completed"]:
+            summary["sets"] += 1
+        if progress_callback:
+            progress_callback(index, len(candidates))
+    summary["completed"] = stop_event is None or not stop_event.is_set()
+    return summary
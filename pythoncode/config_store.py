@@ -0,0 +1,88 @@
+import os
+import json
+import threading
+import atexit
+
+from utils import atomic_write_bytes
+
+class ConfigStore:
+    """
+    설정 파일(save_manager_config.json)을 안전하게 저장하는 저장소입니다.
+    
+    - 짧은 시간에 여러 번 저장을 요청하면 마지막 내용만 한 번 기록합니다 (디바운스).
+    - 실제 기록은 백그라운드 스레드에서 임시 파일 → fsync → rename 순서로 원자적으로 수행합니다.
+    - 기록에 성공한 내용은 '.bak' 사본(마지막 정상본)으로도 보관하여,
+      원본 파일이 손상되었을 때 시작 시 사본에서 불러옵니다.
+    """
+
+    def __init__(self, path, delay=0.5, on_error=None):
+        self.path = path
+        self.backup_path = path + ".bak"
+        self.delay = delay
+        self.on_error = on_error
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._timer = None
+        self._pending = None
+        atexit.register(self.flush)
+
+    def load(self):
+        """
+        설정을 불러옵니다.
+        
+        Returns:
+        tuple: (설정 데이터 또는 None, 불러온 위치 "primary" / "backup" / None)
+        """
+        for path, source in ((self.path, "primary"), (self.backup_path, "backup")):
+            data = self._read(path)
+            if data is not None:
+                return data, source
+        return None, None
+
+    def _read(self, path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # 기본 구조 유효성 검사
+        if isinstance(data, dict) and isinstance(data.get("profiles"), dict):
+            return data
+        return None
+
+    def exists(self):
+        """원본 또는 사본 설정 파일이 존재하는지 확인합니다."""
+        return os.path.exists(self.path) or os.path.exists(self.backup_path)
+
+    def save(self, data):
+        """
+        설정 저장을 예약합니다. 호출 시점의 내용을 직렬화해 두고,
+        delay초 동안 추가 요청이 없으면 백그라운드에서 기록합니다.
+        """
+        payload = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        with self._lock:
+            self._pending = payload
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """예약된 저장 내용을 즉시 기록합니다."""
+        # 기록은 별도 잠금으로 직렬화하여, 기록 중에도 save()가 UI 스레드를 막지 않도록 함
+        with self._write_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                payload, self._pending = self._pending, None
+            if payload is None:
+                return
+            try:
+                atomic_write_bytes(self.path, payload)
+                atomic_write_bytes(self.backup_path, payload)
+            except Exception as e:
+                print(f"설정 저장 중 오류 발생: {e}")
+                if self.on_error:
+                    self.on_error(e)
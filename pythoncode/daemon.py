@@ -0,0 +1,430 @@
+"""
+게임 런처나 게임 실행 전/후 훅에서 백업/복원을 요청할 수 있는 백그라운드 서비스입니다.
+
+Unix 도메인 소켓에서 한 줄에 하나씩 JSON 요청을 받고, 한 줄의 JSON 응답을 돌려줍니다.
+    요청: {"op": "backup", "profile": "엘든링", "description": "세션 종료", "id": 1}
+    응답: {"ok": true, "result": {...}, "id": 1} 또는 {"ok": false, "error": "...", "id": 1}
+
+지원하는 요청:
+    ping                                      서비스 상태
+    profiles                                  프로필 목록
+    sets     profile [limit]                  백업 세트 목록 (최신순)
+    backup   profile [description] [files] [tags]   백업 (files는 세이브 폴더 기준 파일명)
+    restore  profile [set_id="latest"] [names]      복원 (names가 있으면 해당 파일만)
+    shutdown                                  서비스 종료
+
+한 프로필에 대한 요청은 도착 순서대로 하나씩 처리하고, 다른 프로필의 요청은 동시에 처리합니다.
+서비스가 실행되는 동안 카탈로그와 파일 인덱스가 메모리 캐시에 유지되므로 반복 요청이 빠릅니다.
+GUI는 시작할 때 서비스가 실행 중이면 클라이언트로 연결하여 백업/복원을 서비스에 맡깁니다.
+
+사용법:
+    python daemon.py [--socket 경로] [--config save_manager_config.json]
+    python daemon.py --send '{"op": "backup", "profile": "엘든링"}'
+"""
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from file_manager import (
+    get_backup_folder_path, get_backup_sets, get_file_index, get_storage_stats,
+    backup_profile, restore_backup_files, resolve_durability
+)
+from config_store import ConfigStore
+from io_policy import resolve_io_policy
+from replication import MirrorManager
+from diagnostics import configure_diagnostics
+
+# Unix 도메인 소켓은 일부 시스템(이전 버전의 윈도우 등)에서 지원하지 않음
+HAS_UNIX_SOCKET = hasattr(socket, "AF_UNIX")
+PROTOCOL_VERSION = 1
+DEFAULT_CONFIG_FILE = "save_manager_config.json"
+# 한 요청/응답 줄의 최대 크기
+_MAX_LINE = 1024 * 1024
+
+def default_socket_path():
+    """사용자별 기본 소켓 경로를 반환합니다. (XDG_RUNTIME_DIR이 있으면 그 아래)"""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, "gamesaver.sock")
+    uid = os.getuid() if hasattr(os, "getuid") else os.getpid()
+    return os.path.join(tempfile.gettempdir(), f"gamesaver-{uid}.sock")
+
+class DaemonError(Exception):
+    """서비스가 요청을 처리하지 못했을 때 발생합니다. (메시지는 서비스가 보낸 오류)"""
+
+def _run_in_own_thread(func, *args, **kwargs):
+    """
+    작업을 새 스레드에서 실행하고 끝날 때까지 기다려 결과를 반환합니다. (예외는 그대로 전달)
+    저부하 I/O 정책은 작업 스레드의 nice 값을 낮추는데, 권한이 없는 프로세스는 다시 올릴 수 없습니다.
+    프로필 큐의 스레드는 계속 재사용되므로, 낮춘 우선순위가 작업과 함께 사라지도록 스레드를 따로 만듭니다.
+    """
+    outcome = {}
+
+    def run():
+        try:
+            outcome["result"] = func(*args, **kwargs)
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=run, name=f"{threading.current_thread().name}-job", daemon=True)
+    thread.start()
+    thread.join()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome.get("result")
+
+class BackupDaemon:
+    """
+    프로필 설정 파일을 읽어 백업/복원 요청을 처리하는 서비스입니다.
+
+    설정 파일이 바뀌면 다음 요청 때 다시 읽으며, 미러가 설정된 프로필은 이 서비스가 복제합니다.
+    """
+
+    def __init__(self, config_path=DEFAULT_CONFIG_FILE, socket_path=None):
+        self.config_path = config_path
+        self.socket_path = socket_path or default_socket_path()
+        self.config_store = ConfigStore(config_path)
+        self.mirror_manager = MirrorManager()
+        self._profiles = {}
+        self._config_signature = None
+        self._config_lock = threading.Lock()
+        # 프로필별 작업 큐 (작업 스레드 1개 = 도착 순서대로 하나씩 처리)
+        self._queues = {}
+        self._queues_lock = threading.Lock()
+        self._server = None
+
+    # --- 설정 ---
+
+    def _config_stat(self):
+        try:
+            st = os.stat(self.config_path)
+        except OSError:
+            return None
+        return (st.st_size, st.st_mtime_ns)
+
+    def profiles(self):
+        """현재 프로필 설정을 반환합니다. 설정 파일이 바뀌었으면 다시 읽습니다."""
+        with self._config_lock:
+            signature = self._config_stat()
+            if signature != self._config_signature:
+                data, _ = self.config_store.load()
+                self._profiles = (data or {}).get("profiles", {})
+                configure_diagnostics((data or {}).get("diagnostics"))
+                self._config_signature = signature
+                self._on_profiles_loaded()
+            return self._profiles
+
+    def _on_profiles_loaded(self):
+        for profile_name, profile_data in self._profiles.items():
+            mirrors = profile_data.get("mirrors", [])
+            backup_folder = get_backup_folder_path(profile_name)
+            if mirrors or self.mirror_manager.get(backup_folder) is not None:
+                self.mirror_manager.configure(backup_folder, mirrors, max_mbps=profile_data.get("mirror_max_mbps") or None)
+        threading.Thread(target=self._warm_caches, args=(list(self._profiles),), daemon=True).start()
+
+    def _warm_caches(self, profile_names):
+        """카탈로그, 파일 인덱스, 저장 공간 통계를 미리 읽어 메모리 캐시에 올려 둡니다."""
+        for profile_name in profile_names:
+            try:
+                backup_folder = get_backup_folder_path(profile_name)
+                get_backup_sets(backup_folder)
+                get_file_index(backup_folder)
+                get_storage_stats(backup_folder)
+            except Exception as e:
+                print(f"캐시 준비 중 오류 ({profile_name}): {e}")
+
+    def _profile(self, request):
+        profile_name = request.get("profile")
+        profile_data = self.profiles().get(profile_name)
+        if profile_data is None:
+            raise DaemonError(f"알 수 없는 프로필입니다: {profile_name}")
+        return profile_name, profile_data
+
+    # --- 요청 처리 ---
+
+    def handle_request(self, request):
+        """
+        요청 하나를 처리하고 응답을 반환합니다.
+
+        Parameters:
+        request (dict): {"op": 요청 이름, ...}
+
+        Returns:
+        dict: {"ok": True, "result": ...} 또는 {"ok": False, "error": 메시지}
+        """
+        response = {}
+        if isinstance(request, dict) and "id" in request:
+            response["id"] = request["id"]
+        try:
+            if not isinstance(request, dict):
+                raise DaemonError("요청은 JSON 객체여야 합니다.")
+            handler = getattr(self, f"_op_{request.get('op')}", None)
+            if handler is None:
+                raise DaemonError(f"알 수 없는 요청입니다: {request.get('op')}")
+            response.update(ok=True, result=handler(request))
+        except DaemonError as e:
+            response.update(ok=False, error=str(e))
+        except Exception as e:
+            response.update(ok=False, error=f"요청 처리 중 오류 발생: {e}")
+        return response
+
+    def _run_serialized(self, profile_name, func, *args, **kwargs):
+        """
+        프로필의 작업 큐에 넣고 끝날 때까지 기다립니다.
+        작업은 큐 스레드가 아닌 작업마다 새로 만든 스레드에서 실행합니다. (_run_in_own_thread 참고)
+        """
+        with self._queues_lock:
+            executor = self._queues.get(profile_name)
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"profile-{profile_name}")
+                self._queues[profile_name] = executor
+        return executor.submit(_run_in_own_thread, func, *args, **kwargs).result()
+
+    def _op_ping(self, request):
+        return {"pid": os.getpid(), "version": PROTOCOL_VERSION, "profiles": len(self.profiles())}
+
+    def _op_profiles(self, request):
+        return [
+            {"name": name, "save_folder": data.get("save_folder", ""),
+             "backup_folder": get_backup_folder_path(name)}
+            for name, data in self.profiles().items()
+        ]
+
+    def _op_sets(self, request):
+        profile_name, _ = self._profile(request)
+        backup_sets = get_backup_sets(get_backup_folder_path(profile_name))
+        summaries = [
+            {
+                "id": set_id,
+                "date": backup_set.get("date"),
+                "description": backup_set.get("description"),
+                "files": len(backup_set.get("files", [])),
+                "damaged": bool(backup_set.get("damaged")),
+                "tier": backup_set.get("tier"),
+            }
+            for set_id, backup_set in backup_sets.items() if isinstance(backup_set, dict)
+        ]
+        summaries.sort(key=lambda item: item["id"], reverse=True)
+        limit = request.get("limit")
+        return summaries[:limit] if isinstance(limit, int) and limit > 0 else summaries
+
+    def _op_backup(self, request):
+        profile_name, profile_data = self._profile(request)
+        save_folder = profile_data.get("save_folder", "")
+        file_paths = None
+        if request.get("files") is not None:
+            file_paths = [self._save_file_path(save_folder, name) for name in request["files"]]
+        return self._run_serialized(
+            profile_name, backup_profile, profile_name, save_folder,
+            description=request.get("description") or None, file_paths=file_paths,
+            io_policy=resolve_io_policy(profile_data), tags=request.get("tags") or None,
+            durability=resolve_durability(profile_data)
+        )
+
+    def _op_restore(self, request):
+        profile_name, profile_data = self._profile(request)
+        save_folder = profile_data.get("save_folder", "")
+        if not save_folder or not os.path.isdir(save_folder):
+            raise DaemonError(f"세이브 폴더 경로가 유효하지 않습니다: {save_folder}")
+
+        def restore():
+            backup_folder = get_backup_folder_path(profile_name)
+            set_id = request.get("set_id") or "latest"
+            if set_id == "latest":
+                set_ids = sorted(get_backup_sets(backup_folder))
+                if not set_ids:
+                    raise DaemonError("복원할 백업 세트가 없습니다.")
+                set_id = set_ids[-1]
+            result = restore_backup_files(backup_folder, set_id, save_folder,
+                                          names=request.get("names"), io_policy=resolve_io_policy(profile_data))
+            result["set_id"] = set_id
+            return result
+        return self._run_serialized(profile_name, restore)
+
+    def _op_shutdown(self, request):
+        # 응답을 보낸 뒤 종료되도록 다른 스레드에서 서버를 멈춤
+        threading.Thread(target=self.shutdown, daemon=True).start()
+        return {"stopping": True}
+
+    @staticmethod
+    def _save_file_path(save_folder, name):
+        """요청의 파일명을 세이브 폴더 안의 경로로 바꿉니다. 폴더 밖을 가리키면 거부합니다."""
+        path = os.path.normpath(os.path.join(save_folder, name))
+        if os.path.commonpath([path, os.path.normpath(save_folder)]) != os.path.normpath(save_folder):
+            raise DaemonError(f"세이브 폴더 밖의 파일은 백업할 수 없습니다: {name}")
+        return path
+
+    # --- 서버 ---
+
+    def serve_forever(self):
+        """소켓을 열고 shutdown()이 호출될 때까지 요청을 처리합니다."""
+        if not HAS_UNIX_SOCKET:
+            raise DaemonError("이 시스템은 Unix 도메인 소켓을 지원하지 않습니다.")
+        if os.path.exists(self.socket_path):
+            if DaemonClient(self.socket_path).is_running():
+                raise DaemonError(f"서비스가 이미 실행 중입니다: {self.socket_path}")
+            os.remove(self.socket_path) # 비정상 종료로 남은 소켓 파일
+
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in iter(lambda: self.rfile.readline(_MAX_LINE), b""):
+                    if not line.strip():
+                        continue
+                    try:
+                        request = json.loads(line)
+                    except ValueError:
+                        response = {"ok": False, "error": "JSON 형식이 잘못되었습니다."}
+                    else:
+                        response = daemon.handle_request(request)
+                    self.wfile.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b"\n")
+
+        class Server(socketserver.ThreadingUnixStreamServer):
+            daemon_threads = True
+
+        # 소켓은 현재 사용자만 접근할 수 있도록 만듦
+        old_umask = os.umask(0o177)
+        try:
+            self._server = Server(self.socket_path, Handler)
+        finally:
+            os.umask(old_umask)
+        self.profiles() # 설정을 읽고 캐시 준비 시작
+        print(f"서비스 시작: {self.socket_path}")
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            try:
+                os.remove(self.socket_path)
+            except OSError:
+                pass
+            self.mirror_manager.stop_all()
+            with self._queues_lock:
+                for executor in self._queues.values():
+                    executor.shutdown(wait=True) # 진행 중인 백업/복원은 마침
+            print("서비스 종료")
+
+    def shutdown(self):
+        if self._server is not None:
+            self._server.shutdown()
+
+class DaemonClient:
+    """
+    백업 서비스에 요청을 보내는 클라이언트입니다.
+
+    연결을 유지하며, 연결이 끊어지면 다음 요청 때 다시 연결합니다.
+    서비스가 보낸 오류는 DaemonError로, 연결 오류는 OSError로 전달됩니다.
+    """
+
+    def __init__(self, socket_path=None, timeout=None):
+        self.socket_path = socket_path or default_socket_path()
+        self.timeout = timeout
+        self._sock = None
+        self._reader = None
+        self._lock = threading.Lock()
+        self._next_id = 0
+
+    @classmethod
+    def attach(cls, socket_path=None):
+        """서비스가 실행 중이면 연결된 클라이언트를, 아니면 None을 반환합니다."""
+        client = cls(socket_path)
+        return client if client.is_running() else None
+
+    def is_running(self):
+        """서비스가 응답하는지 확인합니다."""
+        if not HAS_UNIX_SOCKET or not os.path.exists(self.socket_path):
+            return False
+        try:
+            self.request("ping")
+            return True
+        except (OSError, ValueError, DaemonError):
+            self.close()
+            return False
+
+    def _connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self._sock = sock
+        self._reader = sock.makefile('rb')
+
+    def request(self, op, **params):
+        """
+        요청을 보내고 결과를 반환합니다.
+
+        Parameters:
+        op (str): 요청 이름 (ping, profiles, sets, backup, restore, shutdown)
+        **params: 요청 인자 (profile, set_id, names, files, description, tags, limit)
+
+        Returns:
+        요청의 결과 (result)
+        """
+        with self._lock:
+            self._next_id += 1
+            message = dict(params, op=op, id=self._next_id)
+            payload = json.dumps(message, ensure_ascii=False).encode('utf-8') + b"\n"
+            for attempt in range(2):
+                try:
+                    if self._sock is None:
+                        self._connect()
+                    self._sock.sendall(payload)
+                    line = self._reader.readline(_MAX_LINE)
+                    if not line:
+                        raise ConnectionResetError("서비스 연결이 끊어졌습니다.")
+                    break
+                except OSError:
+                    self.close()
+                    # 보내기 전에 끊어진 연결일 수 있으므로 한 번만 다시 연결 (보낸 뒤 끊어졌으면 재전송하지 않음)
+                    if attempt or op not in ("ping", "profiles", "sets"):
+                        raise
+            response = json.loads(line)
+        if not response.get("ok"):
+            raise DaemonError(response.get("error", "알 수 없는 오류"))
+        return response.get("result")
+
+    def close(self):
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+def main():
+    parser = argparse.ArgumentParser(description="게임 세이버 백그라운드 서비스")
+    parser.add_argument("--socket", default=None, help="소켓 경로 (기본: 사용자별 경로)")
+    parser.add_argument("--config", default=DEFAULT_CONFIG_FILE, help="프로필 설정 파일 경로")
+    parser.add_argument("--send", metavar="JSON", help="서비스를 시작하지 않고 요청 하나를 보낸 뒤 결과를 출력")
+    args = parser.parse_args()
+
+    if args.send:
+        try:
+            request = json.loads(args.send)
+            result = DaemonClient(args.socket).request(request.pop("op"), **request)
+        except (OSError, ValueError, KeyError, DaemonError) as e:
+            print(f"요청 실패: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+        return
+
+    try:
+        BackupDaemon(args.config, args.socket).serve_forever()
+    except DaemonError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
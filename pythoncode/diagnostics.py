@@ -0,0 +1,305 @@
+"""
+"새로고침할 때 CPU를 많이 쓴다", "백업 중 메모리를 2 GB 쓴다" 같은 문제를 재현할 때 사용하는 진단 모드입니다.
+
+진단 모드가 켜지면 @profiled로 표시한 작업(백업, 복원, 목록 새로고침, 파일 복사 등)을 실행할 때마다
+cProfile(CPU)과 tracemalloc(메모리)으로 기록하고, 작업마다 진단 폴더에 다음 파일을 남깁니다.
+    <시각>_<작업>.prof   cProfile 결과 (python -m pstats 또는 snakeviz로 열기)
+    <시각>_<작업>.txt    소요 시간, 누적 시간 상위 함수, 메모리 최대 사용량과 증가량 상위 위치
+
+진단 모드가 꺼져 있으면 작업을 그대로 호출하므로 추가 비용이 없습니다. (전역 변수 확인 한 번)
+한 작업 안에서 호출된 다른 작업은 바깥 작업의 기록에 포함되며, tracemalloc은 프로세스 전체의 할당을
+기록하므로 메모리 기록은 한 번에 한 작업만 수행합니다. (동시에 실행된 작업은 CPU만 기록)
+
+켜는 방법 (환경 변수가 설정 파일보다 우선):
+    GAMESAVER_DIAGNOSTICS=1
+    GAMESAVER_DIAGNOSTICS="sample=0.2,top=30,max_mb=200,memory=0,dir=/tmp/diag"
+    save_manager_config.json: "diagnostics": {"enabled": true, "sample_rate": 0.2, "top_n": 30}
+
+설정 항목 (환경 변수 이름):
+    sample_rate (sample)     작업을 기록할 확률 (0~1, 자주 실행되는 자동 새로고침 등에 사용)
+    cpu / memory (cpu, memory)   cProfile / tracemalloc 기록 여부
+    top_n (top)              보고서에 표시할 상위 항목 수
+    frames (frames)          tracemalloc이 할당 위치마다 보관하는 호출 단계 수 (클수록 느림)
+    slow_ms (slow_ms)        이보다 빨리 끝난 작업은 기록을 남기지 않음
+    max_folder_mb (max_mb)   진단 폴더의 최대 크기 (넘으면 오래된 기록부터 삭제)
+    folder (dir)             진단 폴더 (기본: 프로그램 폴더의 'diagnostics')
+"""
+import cProfile
+import io
+import os
+import pstats
+import random
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from functools import wraps
+
+from utils import format_size
+
+DIAGNOSTICS_ENV = "GAMESAVER_DIAGNOSTICS"
+DIAGNOSTICS_DIR = "diagnostics"
+
+DEFAULT_DIAGNOSTICS_SETTINGS = {
+    "enabled": False,
+    "sample_rate": 1.0,
+    "cpu": True,
+    "memory": True,
+    "top_n": 25,
+    "frames": 1,
+    "slow_ms": 0,
+    "max_folder_mb": 100,
+    "folder": None,
+}
+
+# 환경 변수에서 사용하는 짧은 이름 -> 설정 항목
+_ENV_KEYS = {
+    "sample": "sample_rate", "cpu": "cpu", "memory": "memory", "mem": "memory", "top": "top_n",
+    "frames": "frames", "slow_ms": "slow_ms", "max_mb": "max_folder_mb", "dir": "folder",
+}
+
+# 활성화된 설정 (None이면 진단 모드 꺼짐)
+_settings = None
+# 현재 스레드에서 기록 중인 작업이 있는지 (안쪽 작업은 바깥 작업의 기록에 포함)
+_local = threading.local()
+# tracemalloc 기록은 프로세스 전체가 대상이므로 한 번에 한 작업만
+_memory_lock = threading.Lock()
+# 보고서 기록과 진단 폴더 정리
+_write_lock = threading.Lock()
+
+def default_diagnostics_folder():
+    """프로그램 실행 디렉토리 아래의 진단 폴더 경로를 반환합니다."""
+    if getattr(sys, 'frozen', False):
+        base_dir = os.path.dirname(sys.executable)
+    else:
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(base_dir, DIAGNOSTICS_DIR)
+
+def _parse_env_settings(value):
+    """
+    환경 변수 값을 설정으로 바꿉니다.
+    "0", "off" 등은 끄기, "1", "on" 등은 기본 설정으로 켜기, "키=값,..."은 해당 설정으로 켜기입니다.
+    """
+    value = value.strip()
+    if value.lower() in ("", "0", "off", "false", "no"):
+        return {"enabled": False}
+    settings = {"enabled": True}
+    if value.lower() in ("1", "on", "true", "yes"):
+        return settings
+    for item in value.split(","):
+        key, sep, raw = item.partition("=")
+        key = _ENV_KEYS.get(key.strip().lower())
+        if not sep or key is None:
+            print(f"경고: {DIAGNOSTICS_ENV}의 알 수 없는 항목을 무시합니다: {item.strip()}")
+            continue
+        settings[key] = raw.strip()
+    return settings
+
+def _normalize_settings(settings):
+    """설정 값의 형식을 맞추고 범위를 제한합니다."""
+    result = dict(DEFAULT_DIAGNOSTICS_SETTINGS)
+    for key, value in settings.items():
+        if key not in result:
+            continue
+        default = DEFAULT_DIAGNOSTICS_SETTINGS[key]
+        try:
+            if isinstance(default, bool):
+                value = value if isinstance(value, bool) else str(value).lower() in ("1", "on", "true", "yes")
+            elif isinstance(default, float):
+                value = min(max(float(value), 0.0), 1.0)
+            elif isinstance(default, int):
+                value = max(int(value), 0)
+        except (TypeError, ValueError):
+            print(f"경고: 진단 설정 '{key}' 값이 올바르지 않아 기본값을 사용합니다: {value}")
+            continue
+        result[key] = value
+    result["frames"] = max(result["frames"], 1)
+    result["max_folder_mb"] = max(result["max_folder_mb"], 1)
+    result["folder"] = result["folder"] or default_diagnostics_folder()
+    return result
+
+def resolve_diagnostics_settings(config=None, environ=None):
+    """
+    설정 파일의 diagnostics 항목과 환경 변수로 진단 설정을 정합니다.
+
+    Parameters:
+    config (dict, optional): 설정 파일의 "diagnostics" 항목
+    environ (dict, optional): 환경 변수 (기본: os.environ)
+
+    Returns:
+    dict: 진단 설정. 진단 모드가 꺼져 있으면 None
+    """
+    settings = dict(config) if isinstance(config, dict) else {}
+    env_value = (os.environ if environ is None else environ).get(DIAGNOSTICS_ENV)
+    if env_value is not None:
+        settings.update(_parse_env_settings(env_value))
+    settings = _normalize_settings(settings)
+    if not settings["enabled"] or not (settings["cpu"] or settings["memory"]) or settings["sample_rate"] <= 0:
+        return None
+    return settings
+
+def configure_diagnostics(config=None):
+    """
+    진단 모드를 켜거나 끕니다. 설정을 불러올 때마다 호출합니다.
+
+    Parameters:
+    config (dict, optional): 설정 파일의 "diagnostics" 항목
+
+    Returns:
+    dict: 적용된 진단 설정. 꺼져 있으면 None
+    """
+    global _settings
+    settings = resolve_diagnostics_settings(config)
+    if settings is not None:
+        try:
+            os.makedirs(settings["folder"], exist_ok=True)
+        except OSError as e:
+            print(f"경고: 진단 폴더를 만들 수 없어 진단 모드를 끕니다: {e}")
+            settings = None
+    if settings is not None and settings != _settings:
+        print(f"진단 모드: '{settings['folder']}'에 작업별 기록을 남깁니다. "
+              f"(기록 확률 {settings['sample_rate']:g}, CPU {'켬' if settings['cpu'] else '끔'}, "
+              f"메모리 {'켬' if settings['memory'] else '끔'})")
+    _settings = settings
+    return settings
+
+def profiled(name):
+    """
+    작업을 진단 모드에서 기록하도록 표시하는 데코레이터입니다.
+
+    Parameters:
+    name (str): 보고서와 파일명에 사용할 작업 이름 (예: "gui.backup_files")
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            settings = _settings
+            if settings is None or getattr(_local, "active", False):
+                return func(*args, **kwargs)
+            if settings["sample_rate"] < 1.0 and random.random() >= settings["sample_rate"]:
+                return func(*args, **kwargs)
+            return _capture(settings, name, func, args, kwargs)
+        return wrapper
+    return decorator
+
+def _capture(settings, name, func, args, kwargs):
+    """작업 하나를 cProfile/tracemalloc으로 기록하면서 실행합니다."""
+    _local.active = True
+    profiler = cProfile.Profile() if settings["cpu"] else None
+    memory = settings["memory"] and _memory_lock.acquire(blocking=False)
+    started_tracing = False
+    baseline = None
+    error = None
+    try:
+        if memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(settings["frames"])
+                started_tracing = True
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.take_snapshot()
+        if profiler is not None:
+            try:
+                profiler.enable()
+            except ValueError:
+                # 다른 프로파일러가 이미 실행 중 (디버거 등)
+                profiler = None
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            if profiler is not None:
+                profiler.disable()
+            memory_info = None
+            if memory:
+                memory_info = (baseline, tracemalloc.take_snapshot(), tracemalloc.get_traced_memory()[1])
+                if started_tracing:
+                    tracemalloc.stop()
+                    started_tracing = False
+                _memory_lock.release()
+                memory = False
+            if elapsed * 1000 >= settings["slow_ms"]:
+                try:
+                    _write_report(settings, name, elapsed, error, profiler, memory_info)
+                except Exception as e:
+                    print(f"경고: 진단 기록을 남기지 못했습니다 ({name}): {e}")
+    finally:
+        # 기록을 시작하기 전에 실패한 경우
+        if started_tracing:
+            tracemalloc.stop()
+        if memory:
+            _memory_lock.release()
+        _local.active = False
+
+def _memory_report(memory_info, top_n):
+    baseline, snapshot, peak = memory_info
+    filters = (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    )
+    baseline = baseline.filter_traces(filters)
+    snapshot = snapshot.filter_traces(filters)
+    before = sum(stat.size for stat in baseline.statistics("filename"))
+    after = sum(stat.size for stat in snapshot.statistics("filename"))
+    lines = [
+        "[메모리] (tracemalloc, 작업 중 프로세스 전체의 할당)",
+        f"작업 중 최대 사용량: {format_size(peak)}",
+        f"작업 전/후 사용량: {format_size(before)} -> {format_size(after)}",
+        f"증가량 상위 {top_n}개 위치:",
+    ]
+    for stat in snapshot.compare_to(baseline, "lineno")[:top_n]:
+        lines.append(f"  {stat}")
+    return lines
+
+def _write_report(settings, name, elapsed, error, profiler, memory_info):
+    """작업 하나의 진단 기록을 진단 폴더에 남기고, 폴더가 최대 크기를 넘으면 오래된 기록을 지웁니다."""
+    folder = settings["folder"]
+    top_n = settings["top_n"]
+    base_name = f"{datetime.now().strftime('%y%m%d_%H%M%S_%f')}_{re.sub(r'[^A-Za-z0-9_.-]', '_', name)}"
+    base_path = os.path.join(folder, base_name)
+
+    lines = [
+        f"작업: {name}",
+        f"시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        f"스레드: {threading.current_thread().name}",
+        f"소요 시간: {elapsed:.3f}초",
+    ]
+    if error is not None:
+        lines.append(f"오류: {type(error).__name__}: {error}")
+    if profiler is not None:
+        stream = io.StringIO()
+        pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(top_n)
+        lines += ["", f"[CPU] 누적 시간 상위 {top_n}개 (전체 기록: {base_name}.prof)", stream.getvalue().strip()]
+    if memory_info is not None:
+        lines += [""] + _memory_report(memory_info, top_n)
+
+    with _write_lock:
+        os.makedirs(folder, exist_ok=True)
+        if profiler is not None:
+            profiler.dump_stats(base_path + ".prof")
+        with open(base_path + ".txt", 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+        _trim_folder(folder, settings["max_folder_mb"] * 1024 * 1024)
+
+def _trim_folder(folder, max_bytes):
+    """진단 폴더의 크기가 max_bytes 이하가 되도록 오래된 기록부터 삭제합니다. (파일명이 시각 순)"""
+    entries = []
+    with os.scandir(folder) as it:
+        for entry in it:
+            if entry.is_file(follow_symlinks=False) and entry.name.endswith((".prof", ".txt")):
+                entries.append((entry.name, entry.stat(follow_symlinks=False).st_size))
+    total = sum(size for _, size in entries)
+    for name, size in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(os.path.join(folder, name))
+        except OSError:
+            continue
+        total -= size
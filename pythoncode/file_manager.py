@@ -1,11 +1,28 @@
 import os
 import shutil
+import stat
 import re
 import json
-from datetime import datetime
-from utils import get_timestamp
+import hashlib
+import lzma
+from datetime import datetime, timedelta
+from utils import (
+    new_set_id, parse_set_id, HAS_FADVISE, advise_sequential, drop_page_cache,
+    may_be_sparse, iter_content_chunks,
+    atomic_write_bytes, fsync_file, fsync_directory, lock_file, unlock_file
+)
 import sys
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import weakref
+from contextlib import nullcontext, contextmanager, ExitStack
+from chunk_store import (
+    ChunkStore, ChunkedReader, CHUNKED_SUFFIX,
+    store_pieces, write_recipe, read_recipe, recipe_digests
+)
+from save_formats import detect_save_format, SaveFormatError
+from diagnostics import profiled
 
 def get_backup_folder_path(profile_name):
     """
@@ -33,7 +50,130 @@ def get_backup_folder_path(profile_name):
     
     return profile_backup_dir
 
-def backup_save_file(file_path, backup_folder, timestamp):
+# 이 크기 이상의 파일은 페이지 캐시를 오염시키지 않도록 직접 나누어 복사
+CACHE_FRIENDLY_MIN_SIZE = 8 * 1024 * 1024
+# 복사한 데이터를 디스크에 기록하고 캐시에서 내보내는 단위
+_CACHE_DROP_WINDOW = 16 * 1024 * 1024
+
+def _copy_chunks(src, dst, chunk_size, io_policy=None, cache_friendly=False, hasher=None):
+    """
+    파일을 chunk_size 단위로 복사하고, 복사를 시작할 때 연 원본 파일의 stat(fstat) 결과를 반환합니다.
+    cache_friendly가 True면 원본은 순차 읽기로 알리고, 복사가 끝난 구간은 디스크에 기록한 뒤
+    원본/대상 모두 페이지 캐시에서 내보내 게임이 사용 중인 캐시를 밀어내지 않도록 합니다.
+    원본이 희소 파일이면 데이터 구간만 복사하고 대상에도 같은 위치에 구멍을 남깁니다.
+    hasher가 주어지면 복사한 내용(구멍은 0으로)을 함께 넣습니다.
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        source_stat = os.fstat(fsrc.fileno())
+        if cache_friendly:
+            advise_sequential(fsrc.fileno())
+        position = copied = dropped = 0 # 읽은 위치, 복사한 위치, 캐시에서 내보낸 위치
+        for chunk, from_disk in iter_content_chunks(fsrc, chunk_size):
+            if hasher is not None:
+                hasher.update(chunk)
+            if from_disk:
+                if position != copied:
+                    fdst.seek(position) # 건너뛴 구간은 구멍으로 남음
+                fdst.write(chunk)
+                copied = position + len(chunk)
+                if io_policy is not None:
+                    io_policy.throttle(len(chunk))
+                if cache_friendly and (copied - dropped >= _CACHE_DROP_WINDOW):
+                    _drop_copied_range(fsrc, fdst, dropped, copied - dropped)
+                    dropped = copied
+            position += len(chunk)
+        if position != copied:
+            fdst.truncate(position) # 파일 끝의 구멍까지 원본 크기로 맞춤
+        if cache_friendly and copied > dropped:
+            _drop_copied_range(fsrc, fdst, dropped, copied - dropped)
+    return source_stat
+
+def _drop_copied_range(fsrc, fdst, offset, length):
+    """복사된 구간을 디스크에 기록한 뒤 원본과 대상의 해당 페이지를 캐시에서 내보냅니다."""
+    fdst.flush()
+    os.fdatasync(fdst.fileno()) # 기록되지 않은(dirty) 페이지는 캐시에서 제거되지 않음
+    drop_page_cache(fdst.fileno(), offset, length)
+    drop_page_cache(fsrc.fileno(), offset, length)
+
+@profiled("file_manager.copy_file")
+def copy_file(src, dst, io_policy=None, preserve_stat=True, copied=None):
+    """
+    파일을 복사합니다. 백업/복원의 모든 파일 복사는 이 함수를 사용합니다.
+    
+    큰 파일은 posix_fadvise를 지원하는 시스템에서 페이지 캐시를 거의 남기지 않고 복사합니다.
+    미리 할당된 큰 세이브 파일처럼 구멍(hole)이 있는 희소 파일은 데이터 구간만 읽고 쓰며,
+    대상 파일에도 구멍을 그대로 만들어 백업 크기가 늘어나지 않게 합니다.
+    
+    Parameters:
+    src (str): 원본 파일 경로
+    dst (str): 대상 파일 경로
+    io_policy (IOPolicy, optional): 속도 제한 정책. 없으면 최대 속도로 복사
+    preserve_stat (bool): 수정 시각 등 메타데이터도 복사할지 여부
+    copied (dict, optional): 주어지면 복사하면서 읽은 내용의 해시와 복사를 시작할 때 연 원본의 크기/수정 시각을
+        {"hash", "size", "mtime_ns"}로 기록 (복사한 내용과 짝이 맞는 정보를 다시 읽거나 stat하지 않고 얻도록)
+    
+    Returns:
+    str: 대상 파일 경로
+    """
+    throttled = io_policy is not None and io_policy.is_throttled
+    st = os.stat(src)
+    cache_friendly = HAS_FADVISE and st.st_size >= CACHE_FRIENDLY_MIN_SIZE
+    # shutil.copy2는 구멍을 0으로 채워 기록하므로 희소 파일은 직접 복사 (해시를 계산할 때도 직접 읽으며 복사)
+    if not throttled and not cache_friendly and not may_be_sparse(st) and copied is None:
+        if preserve_stat:
+            shutil.copy2(src, dst)
+        else:
+            shutil.copy(src, dst)
+        return dst
+    
+    hasher = hashlib.sha256() if copied is not None else None
+    if throttled:
+        # 저부하 모드: 작은 단위로 나누어 복사하며 단위마다 속도 제한 적용
+        with io_policy.priority():
+            source_stat = _copy_chunks(src, dst, io_policy.chunk_size, io_policy, cache_friendly, hasher)
+    else:
+        source_stat = _copy_chunks(src, dst, 1024 * 1024, cache_friendly=cache_friendly, hasher=hasher)
+    if copied is not None:
+        copied.update(hash=hasher.hexdigest(), size=source_stat.st_size, mtime_ns=source_stat.st_mtime_ns)
+    if preserve_stat:
+        shutil.copystat(src, dst)
+    else:
+        shutil.copymode(src, dst)
+    return dst
+
+# 백업 내구성 수준 (프로필 설정의 "durability")
+# - none: 디스크 기록 시점은 운영체제에 맡김 (가장 빠름, 전원이 꺼지면 최근 세트의 파일이 비어 있을 수 있음)
+# - set: 세트의 파일을 모두 복사한 뒤 한꺼번에 fsync하고, 그 다음에 카탈로그를 원자적으로 기록
+# - paranoid: 파일마다 복사 직후 fsync하고, 카탈로그/인덱스/통계까지 모두 fsync
+DURABILITY_NONE = "none"
+DURABILITY_SET = "set"
+DURABILITY_PARANOID = "paranoid"
+DURABILITY_MODES = (DURABILITY_NONE, DURABILITY_SET, DURABILITY_PARANOID)
+DEFAULT_DURABILITY = DURABILITY_SET
+
+def resolve_durability(profile_data):
+    """프로필 설정의 내구성 수준을 반환합니다. 설정이 없거나 잘못되었으면 기본값(set)."""
+    durability = (profile_data or {}).get("durability")
+    return durability if durability in DURABILITY_MODES else DEFAULT_DURABILITY
+
+def _sync_backup_files(file_paths):
+    """
+    백업 파일들을 한꺼번에 디스크에 기록하고, 파일이 있는 폴더도 기록합니다.
+    복사가 모두 끝난 뒤 호출하므로 대부분의 내용은 이미 기록 중이어서 파일마다 바로 fsync하는 것보다 빠릅니다.
+    """
+    # 조각으로 저장된 파일은 레시피를 기록 (새 조각은 저장할 때 이미 기록됨)
+    file_paths = [resolve_backup_file(path) for path in file_paths]
+    for file_path in file_paths:
+        fsync_file(file_path)
+    folders = {os.path.dirname(os.path.abspath(path)) for path in file_paths}
+    for folder in folders:
+        fsync_directory(folder)
+    # 새로 만든 세트 폴더 자체의 항목도 기록
+    for parent in {os.path.dirname(folder) for folder in folders}:
+        if os.path.basename(parent) == SETS_DIR:
+            fsync_directory(parent)
+
+def backup_save_file(file_path, backup_folder, timestamp, io_policy=None, durability=DEFAULT_DURABILITY, copied_files=None):
     """
     세이브 파일을 백업 폴더에 복사합니다.
     
@@ -41,9 +181,14 @@ def backup_save_file(file_path, backup_folder, timestamp):
         file_path (str): 백업할 파일의 전체 경로
         backup_folder (str): 백업 폴더의 전체 경로
         timestamp (str): 백업 세트의 타임스탬프
+        io_policy (IOPolicy, optional): 게임 실행 중 사용할 저부하 I/O 정책
+        durability (str): 내구성 수준. paranoid면 복사 직후 fsync (set은 save_backup_set에서 한꺼번에 기록)
+        copied_files (dict, optional): 주어지면 {백업 파일명: {"hash", "size", "mtime_ns"}}로 복사하면서 계산한 내용 해시와
+            실제로 복사한 원본 파일의 크기/수정 시각(연 파일의 fstat)을 기록. save_backup_set에 넘기면 매니페스트 작성 때
+            파일을 다시 읽지 않고, 복사 뒤에 원본이 바뀌어도 복사한 내용과 다른 수정 시각이 기록되지 않음
         
     Returns:
-        str: 백업된 파일의 전체 경로
+        str: 백업된 파일의 전체 경로 (조각으로 나누어 저장한 경우에도 카탈로그에 기록할 원래 이름의 경로)
     """
     try:
         # 원본 파일명과 확장자 분리
@@ -53,30 +198,311 @@ def backup_save_file(file_path, backup_folder, timestamp):
         # 백업 파일명 생성 (파일명_타임스탬프.확장자)
         backup_filename = f"{name}_{timestamp}{ext}"
         
-        # 백업 파일의 전체 경로
-        backup_path = os.path.join(backup_folder, backup_filename)
+        # 백업 파일의 전체 경로 (세트마다 하위 폴더에 저장)
+        set_folder = get_set_folder(backup_folder, timestamp)
+        os.makedirs(set_folder, exist_ok=True)
+        backup_path = os.path.join(set_folder, backup_filename)
+        
+        # zip/SQLite 세이브는 형식에 맞게 조각으로 나누어 저장 (바뀐 부분만 새로 기록)
+        handler = _format_handler(file_path)
+        if handler is not None:
+            try:
+                source_stat = _backup_chunked(file_path, backup_folder, backup_path, handler, io_policy, durability)
+                if copied_files is not None:
+                    # 해시는 레시피에 기록된 값을 사용
+                    copied_files[backup_filename] = {"size": source_stat.st_size, "mtime_ns": source_stat.st_mtime_ns}
+                return backup_path
+            except SaveFormatError as e:
+                print(f"경고: {original_filename} 파일을 {handler.name} 형식으로 나누지 못해 그대로 복사합니다: {e}")
         
-        # 파일 복사
-        shutil.copy2(file_path, backup_path)
+        # 파일 복사 (요청하면 복사하면서 내용 해시와 원본 크기/수정 시각도 기록)
+        copied = {} if copied_files is not None else None
+        copy_file(file_path, backup_path, io_policy, copied=copied)
+        if copied is not None:
+            copied_files[backup_filename] = copied
         
         # 생성 시간을 현재 시간으로 설정
         current_time = time.time()
         os.utime(backup_path, (current_time, current_time))
         
+        if durability == DURABILITY_PARANOID:
+            _sync_backup_files([backup_path])
+        
         return backup_path
         
     except Exception as e:
         raise Exception(f"파일 백업 중 오류 발생: {str(e)}")
 
+# 형식에 맞게 나누어 저장할 최소 파일 크기 (작은 파일은 레시피와 조각 관리 비용이 더 큼)
+FORMAT_CHUNKING_MIN_SIZE = 64 * 1024
+
+def _format_handler(file_path):
+    """세이브 파일을 조각으로 나누어 저장할 형식 처리기를 반환합니다. 해당하지 않으면 None."""
+    try:
+        if os.path.getsize(file_path) < FORMAT_CHUNKING_MIN_SIZE:
+            return None
+        return detect_save_format(file_path)
+    except OSError:
+        return None # 읽을 수 없는 파일은 복사하면서 오류를 보고
+
+def _backup_chunked(file_path, backup_folder, backup_path, handler, io_policy=None, durability=DEFAULT_DURABILITY):
+    """
+    형식 처리기로 세이브 파일을 나누어 조각 저장소에 기록하고 레시피를 '<백업 파일>.chunks'로 저장합니다.
+    조각은 원래 바이트 순서대로 빠짐없이 나오므로, 원본 해시와 크기는 나누면서 조각으로 계산하고
+    파일을 다시 읽거나 조립하여 확인하지 않습니다. (I/O는 원본을 한 번 읽고 바뀐 조각만 기록)
+    나눈 조각이 파일 전체를 덮지 않거나 백업하는 동안 원본이 바뀌면 SaveFormatError가 발생합니다.
+    durability가 none이 아니면 새 조각은 기록 즉시 fsync합니다. (레시피는 다른 백업 파일과 같이 기록)
+    나누기 전에 연 원본 파일의 stat(fstat) 결과를 반환합니다.
+    """
+    throttled = io_policy is not None and io_policy.is_throttled
+    store = ChunkStore(backup_folder)
+    recipe_path = backup_path + CHUNKED_SUFFIX
+    hasher = hashlib.sha256()
+    size = 0
+    
+    def hashed_pieces(pieces):
+        nonlocal size
+        for piece in pieces:
+            hasher.update(piece[1])
+            size += len(piece[1])
+            if throttled:
+                io_policy.throttle(len(piece[1]))
+            yield piece
+    
+    with (io_policy.priority() if throttled else nullcontext()):
+        with open(file_path, 'rb') as f:
+            before = os.fstat(f.fileno())
+            segments, written = store_pieces(store, hashed_pieces(handler.split(f)),
+                                             fsync=durability != DURABILITY_NONE)
+            after = os.fstat(f.fileno())
+    if (before.st_size, before.st_mtime_ns) != (after.st_size, after.st_mtime_ns):
+        raise SaveFormatError("백업하는 동안 파일이 바뀌었습니다.")
+    if size != after.st_size:
+        raise SaveFormatError(f"나눈 조각의 크기가 파일 크기와 다릅니다: {size} != {after.st_size}")
+    recipe = {
+        "version": 1,
+        "format": handler.name,
+        "size": size,
+        "sha256": hasher.hexdigest(),
+        "stored": written, # 이 파일을 백업하며 새로 기록한 조각 크기 (저장 공간 통계용)
+        "segments": segments,
+    }
+    write_recipe(recipe_path, recipe, fsync=durability == DURABILITY_PARANOID)
+    return before
+
+# 콜드 보관 계층으로 옮겨진 백업 파일의 접미사 (lzma로 압축된 사본, 예: "save_250401_152655.sav.xz")
+COLD_SUFFIX = ".xz"
+# 백업 파일이 저장될 수 있는 형태 (원래 파일, 콜드 보관 사본, 조각 레시피)
+_STORED_SUFFIXES = ("", COLD_SUFFIX, CHUNKED_SUFFIX)
+
+def resolve_backup_file(backup_file_path):
+    """
+    백업 파일이 실제로 저장된 경로를 반환합니다.
+    원래 파일이 없으면 콜드 보관용 압축 사본이나 조각 레시피의 경로를, 모두 없으면 원래 경로를 반환합니다.
+    """
+    for suffix in _STORED_SUFFIXES:
+        if os.path.exists(backup_file_path + suffix):
+            return backup_file_path + suffix
+    return backup_file_path
+
+# 백업 세트별 폴더를 모아 두는 하위 폴더 (예: "sets/250401_152655_123456/save_250401_152655_123456.sav")
+# 이전 버전은 모든 백업 파일을 백업 폴더 바로 아래에 두었으며, migrate_backup_layout이 세트 폴더로 옮깁니다.
+SETS_DIR = "sets"
+
+# 세트 폴더를 삭제할 때 먼저 붙이는 이름 (삭제 도중 중단되어도 세트 폴더로 보이지 않도록)
+_DELETING_PREFIX = ".deleting_"
+
+# 세트 폴더(파일명의 타임스탬프)별 잠금. 쓰는 곳이 없어지면 사전에서 사라짐
+_set_folder_locks = weakref.WeakValueDictionary()
+_set_folder_locks_guard = threading.Lock()
+
+@contextmanager
+def backup_set_lock(backup_folder, backup_files=(), set_ids=()):
+    """
+    세트 폴더 단위 잠금을 잡습니다. (같은 프로세스 안)
+    migrate_backup_layout이 이전 형식의 파일을 세트 폴더로 옮기는 동안, 같은 파일의 위치를 찾아 읽거나 지우는 작업이
+    옮기기 전의 경로를 찾은 뒤 파일이 없는 것으로 보는 일이 없도록, 위치를 찾고 사용하는 동안 잡습니다.
+    
+    Parameters:
+    backup_folder (str): 백업 폴더 경로
+    backup_files (list): 사용할 백업 파일명 목록 (파일명의 타임스탬프로 세트 폴더를 정함)
+    set_ids (list): 함께 잠글 세트 ID 목록
+    """
+    keys = set(set_ids)
+    for file in backup_files:
+        file_set_id = _parse_backup_file_name(file)[0]
+        if file_set_id:
+            keys.add(file_set_id)
+    folder_key = _catalog_key(backup_folder)
+    locks = []
+    with _set_folder_locks_guard:
+        # 여러 세트를 잠글 때 교착 상태가 생기지 않도록 항상 같은 순서로 잠금
+        for key in sorted(keys):
+            lock = _set_folder_locks.get((folder_key, key))
+            if lock is None:
+                lock = _set_folder_locks[(folder_key, key)] = threading.RLock()
+            locks.append(lock)
+    with ExitStack() as stack:
+        for lock in locks:
+            stack.enter_context(lock)
+        yield
+
+def get_set_folder(backup_folder, set_id):
+    """백업 세트의 파일을 저장하는 폴더 경로를 반환합니다."""
+    return os.path.join(backup_folder, SETS_DIR, set_id)
+
+def _parse_backup_file_name(name):
+    """
+    백업 폴더의 파일명을 해석합니다.
+    
+    Returns:
+    tuple: (세트 ID 또는 None, 저장 형태 접미사를 뗀 백업 파일명, 저장 형태 접미사 ("", ".xz", ".chunks"))
+    """
+    # 원래 형태의 백업 파일을 먼저 확인하고, 아니면 콜드 보관 사본이나 조각 레시피로 해석
+    match = _SET_ID_SUFFIX.search(name)
+    if match is None:
+        for suffix in _STORED_SUFFIXES[1:]:
+            if name.endswith(suffix):
+                name = name[:-len(suffix)]
+                match = _SET_ID_SUFFIX.search(name)
+                return (match.group(1) if match else None), name, suffix
+    return (match.group(1) if match else None), name, ""
+
+def _is_backup_folder_metadata(name):
+    """카탈로그/인덱스, 기록 중인 임시 파일처럼 백업 파일이 아닌 항목인지 확인합니다."""
+    return name.endswith((".json", ".part", ".jsonl", ".offset", ".corrupt", ".lock")) or name.startswith(".")
+
+def backup_file_locations(backup_file):
+    """
+    카탈로그의 백업 파일이 있을 수 있는 백업 폴더 기준 경로를 찾는 순서대로 반환합니다.
+    세트 폴더(파일명의 타임스탬프) 안의 경로, 이전 형식(백업 폴더 바로 아래)의 경로 순이며, 저장 형태 접미사는 붙이지 않습니다.
+    """
+    set_id = _parse_backup_file_name(backup_file)[0]
+    if not set_id:
+        return [backup_file]
+    return [os.path.join(SETS_DIR, set_id, backup_file), backup_file]
+
+def get_backup_file_path(backup_folder, backup_file):
+    """
+    카탈로그의 백업 파일명에 해당하는 경로를 반환합니다. (콜드 보관 사본, 조각 레시피는 resolve_backup_file로 찾음)
+    세트 폴더에 없고 아직 옮기지 않은 이전 형식의 파일이 있으면 그 경로를, 어디에도 없으면 세트 폴더 안의 경로를 반환합니다.
+    
+    Parameters:
+    backup_folder (str): 백업 폴더 경로
+    backup_file (str): 카탈로그의 백업 파일명 (예: "save_250401_152655.sav")
+    """
+    paths = [os.path.join(backup_folder, location) for location in backup_file_locations(backup_file)]
+    for path in paths:
+        if any(os.path.exists(path + suffix) for suffix in _STORED_SUFFIXES):
+            return path
+    # 확인하는 사이에 migrate_backup_layout이 파일을 세트 폴더로 옮겼을 수 있으므로 세트 폴더 경로를 기본값으로 사용
+    return paths[0]
+
+def backup_file_exists(backup_file_path):
+    """백업 파일이 원래 형태, 콜드 보관용 압축 사본 또는 조각 레시피로 존재하는지 확인합니다."""
+    return os.path.exists(resolve_backup_file(backup_file_path))
+
+def open_backup_file(backup_file_path):
+    """백업 파일을 읽기용으로 엽니다. 콜드 보관된 파일은 압축을 풀면서, 조각으로 저장된 파일은 조립하면서 읽습니다."""
+    stored_path = resolve_backup_file(backup_file_path)
+    if stored_path.endswith(CHUNKED_SUFFIX):
+        return ChunkedReader(stored_path)
+    if stored_path != backup_file_path:
+        return lzma.open(stored_path, 'rb')
+    return open(stored_path, 'rb')
+
+def remove_backup_file(backup_file_path):
+    """
+    백업 파일과 콜드 보관용 압축 사본, 조각 레시피를 모두 삭제합니다. (조각은 collect_chunk_garbage가 정리)
+    
+    Returns:
+    bool: 삭제한 파일이 있으면 True
+    """
+    removed = False
+    for path in (backup_file_path + suffix for suffix in _STORED_SUFFIXES):
+        try:
+            os.remove(path)
+            removed = True
+        except FileNotFoundError:
+            pass
+    return removed
+
+@profiled("file_manager.decompress_file")
+def _decompress_file(src, dst, io_policy=None):
+    """
+    콜드 보관된 압축 파일을 풀어 dst에 기록합니다.
+    압축 사본에는 구멍 정보가 없으므로, 0으로만 채워진 단위는 기록하지 않고 구멍으로 남깁니다.
+    """
+    throttled = io_policy is not None and io_policy.is_throttled
+    chunk_size = io_policy.chunk_size if throttled else 1024 * 1024
+    zeros = bytes(chunk_size)
+    with (io_policy.priority() if throttled else nullcontext()):
+        with lzma.open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            while True:
+                chunk = fsrc.read(chunk_size)
+                if not chunk:
+                    break
+                if len(chunk) == chunk_size and chunk == zeros:
+                    fdst.seek(chunk_size, os.SEEK_CUR)
+                else:
+                    fdst.write(chunk)
+                if throttled:
+                    io_policy.throttle(len(chunk))
+            fdst.truncate() # 파일 끝이 구멍이면 현재 위치까지 크기를 늘림
+    shutil.copymode(src, dst)
+
+@profiled("file_manager.reassemble_file")
+def _reassemble_file(recipe_path, dst, io_policy=None):
+    """조각으로 저장된 파일을 조립하여 dst에 기록합니다. 조립한 내용이 원본 해시와 다르면 ChunkCorruptError가 발생합니다."""
+    throttled = io_policy is not None and io_policy.is_throttled
+    chunk_size = io_policy.chunk_size if throttled else 1024 * 1024
+    with (io_policy.priority() if throttled else nullcontext()):
+        with ChunkedReader(recipe_path) as fsrc, open(dst, 'wb') as fdst:
+            while True:
+                chunk = fsrc.read(chunk_size)
+                if not chunk:
+                    break
+                fdst.write(chunk)
+                if throttled:
+                    io_policy.throttle(len(chunk))
+
+# 백업 파일명의 타임스탬프(세트 ID) 패턴: 확장자 바로 앞의 _YYMMDD_HHMMSS(_ffffff)
+_SET_ID_SUFFIX = re.compile(r'_(\d{6}_\d{6}(?:_\d{6})?)(?=(?:\.[^.]*)?$)')
+
 def get_original_filename(backup_file_name):
     """
-    백업 파일명에서 타임스탬프 (YYMMDD_HHMMSS)를 제거하여 원본 파일명을 반환합니다.
-    예: "save_250401_152655.sav" -> "save.sav"
+    백업 파일명에서 타임스탬프 (YYMMDD_HHMMSS 또는 YYMMDD_HHMMSS_ffffff)를 제거하여 원본 파일명을 반환합니다.
+    예: "save_250401_152655.sav" -> "save.sav", "save_250401_152655_123456.sav" -> "save.sav"
+    """
+    return _SET_ID_SUFFIX.sub('', backup_file_name, count=1)
+
+_DRIVE_PREFIX = re.compile(r'^[A-Za-z]:')
+
+def is_safe_relative_path(path):
+    """
+    매니페스트의 원본 경로가 세이브 폴더 안의 상대 경로인지 확인합니다.
+    비어 있거나, 절대 경로이거나, 드라이브 문자로 시작하거나, '..' 등이 들어 있으면 False입니다.
     """
-    # 타임스탬프 패턴: _YYMMDD_HHMMSS
-    return re.sub(r'_\d{6}_\d{6}', '', backup_file_name)
+    if not isinstance(path, str) or not path:
+        return False
+    if path.startswith(('/', '\\')) or _DRIVE_PREFIX.match(path) or os.path.isabs(path):
+        return False
+    return all(part not in ('', '.', '..') for part in path.replace('\\', '/').split('/'))
 
-def restore_save_file(backup_file_path, original_folder, original_file_name=None):
+def get_restore_destination(original_folder, original_file_name):
+    """
+    원본 경로('/'로 구분된 상대 경로)를 복원할 파일 경로로 바꿉니다.
+    세이브 폴더 밖을 가리키면 (심볼릭 링크를 따라간 실제 경로 포함) ValueError가 발생합니다.
+    """
+    if not is_safe_relative_path(original_file_name):
+        raise ValueError(f"세이브 폴더 밖을 가리키는 복원 경로입니다: {original_file_name}")
+    destination_path = os.path.join(original_folder, *original_file_name.split('/'))
+    root = os.path.realpath(original_folder)
+    if os.path.commonpath([root, os.path.realpath(destination_path)]) != root:
+        raise ValueError(f"세이브 폴더 밖을 가리키는 복원 경로입니다: {original_file_name}")
+    return destination_path
+
+def restore_save_file(backup_file_path, original_folder, original_file_name=None, io_policy=None):
     """
     백업 파일을 원래의 save 파일 이름으로 복원합니다.
     기존 파일이 있다면 덮어씁니다.
@@ -84,66 +510,1382 @@ def restore_save_file(backup_file_path, original_folder, original_file_name=None
     Parameters:
     backup_file_path (str): 백업 파일 경로
     original_folder (str): 원본 폴더 경로
-    original_file_name (str, optional): 원본 파일명. 지정하지 않으면 백업 파일명에서 추출
+    original_file_name (str, optional): 원본 파일명 또는 원본 폴더 기준 상대 경로. 지정하지 않으면 백업 파일명에서 추출
+    io_policy (IOPolicy, optional): 게임 실행 중 사용할 저부하 I/O 정책
     
     Returns:
     str: 복원된 파일 경로
     """
-    if not os.path.exists(backup_file_path):
+    # 콜드 보관된 세트는 압축 사본에서 바로 복원
+    stored_path = resolve_backup_file(backup_file_path)
+    if not os.path.exists(stored_path):
         raise FileNotFoundError(f"백업 파일이 존재하지 않습니다: {backup_file_path}")
     
-    if not os.path.exists(original_folder):
-        os.makedirs(original_folder)
-    
     # 원본 파일명이 제공되지 않은 경우 백업 파일명에서 추출
     if original_file_name is None:
-        backup_file_name = os.path.basename(backup_file_path)
-        name, ext = os.path.splitext(backup_file_name)
         # 타임스탬프 부분을 제거하여 원본 파일명 추출
-        original_file_name = name.rsplit('_', 1)[0] + ext
+        original_file_name = get_original_filename(os.path.basename(backup_file_path))
     
-    destination_path = os.path.join(original_folder, original_file_name)
-    shutil.copy(backup_file_path, destination_path)
+    # 매니페스트의 원본 경로는 '/'로 구분된 상대 경로일 수 있음 (세이브 폴더 밖은 거부)
+    destination_path = get_restore_destination(original_folder, original_file_name)
+    if not os.path.exists(original_folder):
+        os.makedirs(original_folder)
+    destination_dir = os.path.dirname(destination_path)
+    if not os.path.exists(destination_dir):
+        os.makedirs(destination_dir)
+    # 조각의 해시는 끝까지 읽어야 확인되고 압축 오류도 도중에 발생하므로, 임시 파일에 모두 기록하고 확인된 뒤에
+    # 교체함 (실패하면 임시 파일만 지우고 기존 세이브 파일은 그대로 둠)
+    tmp_path = destination_path + ".part"
+    try:
+        if stored_path.endswith(CHUNKED_SUFFIX):
+            _reassemble_file(stored_path, tmp_path, io_policy)
+            if os.path.exists(destination_path):
+                shutil.copymode(destination_path, tmp_path) # 덮어쓰던 때처럼 기존 파일 권한 유지
+        elif stored_path != backup_file_path:
+            _decompress_file(stored_path, tmp_path, io_policy)
+        else:
+            copy_file(backup_file_path, tmp_path, io_policy, preserve_stat=False)
+        fsync_file(tmp_path)
+        os.replace(tmp_path, destination_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    fsync_directory(destination_dir)
     return destination_path
 
-def save_backup_set(backup_folder, set_id, file_paths, description=None):
+BACKUP_SETS_FILE = "backup_sets.json"
+FILE_INDEX_FILE = "file_index.json"
+STORAGE_STATS_FILE = "storage_stats.json"
+# 이 세트 수까지는 카탈로그를 사람이 읽기 쉽게 들여쓰기하여 기록
+_PRETTY_CATALOG_MAX_SETS = 1000
+# 카탈로그에서 다시 만들 수 있는 파일 (손상되면 새로 만듦)
+_DERIVED_FILES = (FILE_INDEX_FILE, STORAGE_STATS_FILE)
+# 백업 세트 레코드 형식 버전 (2: 파일별 매니페스트 포함)
+CATALOG_SCHEMA_VERSION = 2
+
+# 백업 폴더 안의 JSON 파일(카탈로그, 파일 인덱스) 캐시: {(폴더 키, 파일명): ((크기, mtime_ns), 데이터)}
+_catalog_cache = {}
+_catalog_lock = threading.RLock()
+
+# 백업 세트 추가/삭제 시 호출되는 리스너 목록
+# 리스너는 (백업 폴더, "added"/"removed"/"updated", 세트 ID, 세트 레코드)로 호출됩니다.
+# "updated"는 세트의 백업 파일이 바뀐 경우(콜드 보관 등)입니다.
+_catalog_listeners = []
+
+def add_catalog_listener(listener):
+    """백업 세트가 추가, 삭제되거나 백업 파일이 바뀔 때 호출될 함수를 등록합니다."""
+    if listener not in _catalog_listeners:
+        _catalog_listeners.append(listener)
+
+def remove_catalog_listener(listener):
+    """등록된 카탈로그 리스너를 제거합니다."""
+    if listener in _catalog_listeners:
+        _catalog_listeners.remove(listener)
+
+def _notify_catalog_listeners(backup_folder, event, set_id, backup_set):
+    for listener in list(_catalog_listeners):
+        try:
+            listener(backup_folder, event, set_id, backup_set)
+        except Exception as e:
+            print(f"카탈로그 리스너 오류 ({event}, {set_id}): {e}")
+
+def _catalog_key(backup_folder):
+    return os.path.normcase(os.path.abspath(backup_folder))
+
+# 카탈로그 잠금 파일 (백그라운드 서비스와 GUI 등 여러 프로세스가 카탈로그를 고쳐 쓰는 순서를 맞춤)
+CATALOG_LOCK_FILE = "backup_sets.lock"
+# 이 프로세스가 잡고 있는 카탈로그 잠금 파일: {폴더 키: 파일 디스크립터}
+_catalog_file_locks = {}
+
+@contextmanager
+def catalog_lock(backup_folder):
+    """
+    카탈로그(및 파일 인덱스, 저장 공간 통계)를 읽고 고쳐 쓰는 동안 잡는 잠금입니다.
+    같은 프로세스의 스레드는 _catalog_lock으로, 다른 프로세스는 백업 폴더의 잠금 파일로 막으므로
+    백그라운드 서비스와 GUI가 동시에 고쳐 써도 서로의 변경을 잃지 않습니다. 중첩해서 잡아도 됩니다.
+    """
+    key = _catalog_key(backup_folder)
+    with _catalog_lock:
+        # _catalog_lock 안이므로 이미 잡혀 있다면 이 스레드가 잡은 것
+        # 백업 폴더가 아직 없으면 고쳐 쓸 카탈로그도 없음
+        if key in _catalog_file_locks or not os.path.isdir(backup_folder):
+            yield
+            return
+        _catalog_file_locks[key] = lock_file(os.path.join(backup_folder, CATALOG_LOCK_FILE))
+        try:
+            yield
+        finally:
+            unlock_file(_catalog_file_locks.pop(key))
+
+def _catalog_signature(json_file):
+    st = os.stat(json_file)
+    # 다른 프로세스가 rename으로 교체하면 inode가 바뀜 (같은 크기, 같은 수정 시각이어도 감지)
+    return (st.st_size, st.st_mtime_ns, st.st_ino)
+
+def invalidate_backup_sets_cache(backup_folder=None):
+    """
+    카탈로그 캐시를 무효화합니다.
+    backup_folder를 지정하지 않으면 모든 폴더의 캐시를 비웁니다.
+    """
+    with _catalog_lock:
+        if backup_folder is None:
+            _catalog_cache.clear()
+        else:
+            folder_key = _catalog_key(backup_folder)
+            for key in [key for key in _catalog_cache if key[0] == folder_key]:
+                del _catalog_cache[key]
+
+def _read_cached_json(backup_folder, file_name):
+    """
+    백업 폴더의 JSON 파일을 읽습니다. 파일 크기와 mtime_ns가 같으면 캐시된 데이터를 반환합니다.
+    파일이 없으면 None을 반환합니다.
+    """
+    json_file = os.path.join(backup_folder, file_name)
+    key = (_catalog_key(backup_folder), file_name)
+    
+    with _catalog_lock:
+        try:
+            signature = _catalog_signature(json_file)
+        except FileNotFoundError:
+            _catalog_cache.pop(key, None)
+            return None
+        
+        cached = _catalog_cache.get(key)
+        if cached and cached[0] == signature:
+            return cached[1]
+        
+        try:
+            with open(json_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except ValueError:
+            # 인덱스/통계는 카탈로그에서 다시 만들 수 있으므로, 손상되었으면 없는 것으로 처리
+            if file_name not in _DERIVED_FILES:
+                raise
+            print(f"경고: '{json_file}' 파일이 손상되어 다시 만듭니다.")
+            return None
+        _catalog_cache[key] = (signature, data)
+        return data
+
+def _write_cached_json(backup_folder, file_name, data, indent=4, fsync=False):
+    """
+    백업 폴더의 JSON 파일을 원자적으로 교체하고 캐시를 갱신합니다.
+    기록 도중 종료되어도 이전 내용이 남으며, fsync가 True면 전원이 꺼져도 새 내용이 유지됩니다.
+    """
+    json_file = os.path.join(backup_folder, file_name)
+    key = (_catalog_key(backup_folder), file_name)
+    with _catalog_lock:
+        try:
+            # json.dump는 순수 파이썬 인코더로 조각마다 write하므로, 한 번에 직렬화하여 기록
+            text = json.dumps(data, ensure_ascii=False, indent=indent)
+            atomic_write_bytes(json_file, text.encode('utf-8'), fsync=fsync)
+            _catalog_cache[key] = (_catalog_signature(json_file), data)
+        except Exception:
+            _catalog_cache.pop(key, None)
+            raise
+
+def write_backup_sets(backup_folder, backup_sets, fsync=False):
+    """
+    백업 세트 정보를 backup_sets.json에 저장하고 캐시를 갱신합니다.
+    카탈로그를 수정하는 모든 경로는 이 함수를 통해 저장해야 합니다.
+    """
+    # 들여쓰기가 있으면 json이 느린 순수 파이썬 인코더를 사용하므로, 큰 카탈로그는 들여쓰기 없이 기록
+    indent = 4 if len(backup_sets) <= _PRETTY_CATALOG_MAX_SETS else None
+    _write_cached_json(backup_folder, BACKUP_SETS_FILE, backup_sets, indent=indent, fsync=fsync)
+
+def hash_file(file_path, chunk_size=1024 * 1024):
+    """
+    파일 내용의 SHA-256 해시(16진수 문자열)를 계산합니다.
+    희소 파일의 구멍은 디스크에서 읽지 않고 0으로 계산합니다.
+    """
+    hasher = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        # 백업 직후 해시 계산으로 큰 파일이 다시 캐시에 올라오지 않도록 함
+        cache_friendly = HAS_FADVISE and os.fstat(f.fileno()).st_size >= CACHE_FRIENDLY_MIN_SIZE
+        if cache_friendly:
+            advise_sequential(f.fileno())
+        for chunk, _ in iter_content_chunks(f, chunk_size):
+            hasher.update(chunk)
+        if cache_friendly:
+            drop_page_cache(f.fileno())
+    return hasher.hexdigest()
+
+def hash_backup_file(backup_file_path, chunk_size=1024 * 1024):
+    """백업 파일 내용의 SHA-256 해시를 계산합니다. 콜드 보관된 파일은 압축을 푼 내용으로 계산합니다."""
+    if resolve_backup_file(backup_file_path) == backup_file_path:
+        return hash_file(backup_file_path, chunk_size)
+    hasher = hashlib.sha256()
+    with open_backup_file(backup_file_path) as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+def build_manifest_entry(backup_folder, backup_file, source_path=None, source_root=None, with_hash=True, copied=None):
+    """
+    백업 파일 하나에 대한 매니페스트 항목을 만듭니다.
+    
+    Parameters:
+    backup_folder (str): 백업 폴더 경로
+    backup_file (str): 백업 파일명 (예: "save_250401_152655.sav")
+    source_path (str, optional): 원본 파일 경로. 없으면 백업 파일명에서 원본 파일명을 추출
+    source_root (str, optional): 원본 상대 경로의 기준 폴더 (보통 세이브 폴더)
+    with_hash (bool): 내용 해시 계산 여부
+    copied (dict, optional): backup_save_file이 복사하면서 기록한 {"hash", "size", "mtime_ns"}.
+        해시가 있으면 파일을 다시 읽지 않고, 수정 시각은 지금 원본을 stat하지 않고 실제로 복사한 원본의 값을 사용
+    
+    Returns:
+    dict: {"file", "path", "size", "mtime_ns", "hash"}
+          path는 '/'로 구분된 원본 상대 경로, mtime_ns는 백업 당시 원본 파일의 수정 시각
+    """
+    backup_path = get_backup_file_path(backup_folder, backup_file)
+    if source_path:
+        original_path = None
+        if source_root:
+            try:
+                relative_path = os.path.relpath(source_path, source_root).replace(os.sep, '/')
+            except ValueError:
+                # 다른 드라이브의 파일 (윈도우)
+                relative_path = None
+            if is_safe_relative_path(relative_path):
+                original_path = relative_path
+        # 세이브 폴더 밖의 파일은 이전처럼 파일명으로 복원
+        if original_path is None:
+            original_path = os.path.basename(source_path)
+        if copied and copied.get("mtime_ns") is not None:
+            mtime_ns = copied["mtime_ns"]
+        else:
+            # 복사할 때의 정보가 없으면 지금 원본의 수정 시각 (복사 뒤에 바뀌었으면 내용과 맞지 않을 수 있음)
+            try:
+                mtime_ns = os.stat(source_path).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+    else:
+        # 원본 정보가 없으면 (이전 형식의 세트) 수정 시각은 알 수 없음
+        original_path = get_original_filename(os.path.basename(backup_file))
+        mtime_ns = None
+    
+    file_hash = (copied or {}).get("hash")
+    try:
+        stored_path = resolve_backup_file(backup_path)
+        if stored_path.endswith(CHUNKED_SUFFIX):
+            # 조각으로 저장된 파일은 저장할 때 조립 결과로 확인한 원본 크기와 해시를 사용
+            recipe = read_recipe(stored_path)
+            size = recipe["size"]
+            file_hash = recipe["sha256"] if with_hash else None
+        else:
+            size = os.path.getsize(backup_path)
+            if not with_hash:
+                file_hash = None
+            elif file_hash is None:
+                file_hash = hash_file(backup_path)
+    except (OSError, ValueError, KeyError):
+        size, file_hash = None, None
+    
+    return {
+        "file": backup_file,
+        "path": original_path.replace(os.sep, '/'),
+        "size": size,
+        "mtime_ns": mtime_ns,
+        "hash": file_hash,
+    }
+
+def get_set_manifest(backup_folder, backup_set, with_hash=True):
+    """
+    백업 세트의 매니페스트(파일별 원본 경로, 크기, 수정 시각, 해시)를 반환합니다.
+    이전 형식의 세트는 디스크의 백업 파일에서 매니페스트를 만들어 반환합니다.
+    """
+    manifest = backup_set.get("manifest")
+    if isinstance(manifest, list):
+        return manifest
+    return [
+        build_manifest_entry(backup_folder, file, with_hash=with_hash)
+        for file in backup_set.get("files", []) if isinstance(file, str)
+    ]
+
+def get_set_original_paths(backup_set):
+    """백업 세트에 포함된 원본 파일 경로 목록을 반환합니다. (디스크 접근 없음)"""
+    manifest = backup_set.get("manifest")
+    if isinstance(manifest, list):
+        return [entry["path"] for entry in manifest]
+    return [get_original_filename(os.path.basename(file)) for file in backup_set.get("files", []) if isinstance(file, str)]
+
+def matches_manifest_entry(entry, file_path):
+    """
+    파일이 매니페스트 항목과 같은 내용인지 메타데이터(크기, 수정 시각)만으로 판단합니다.
+    확실히 같다고 할 수 없으면 False를 반환합니다.
+    """
+    if entry.get("mtime_ns") is None or entry.get("size") is None:
+        return False
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return False
+    return st.st_size == entry["size"] and st.st_mtime_ns == entry["mtime_ns"]
+
+def _file_index_entries(manifest):
+    """매니페스트에서 파일 인덱스 항목 {원본 경로: 버전 정보}을 만듭니다."""
+    return {
+        entry["path"]: {
+            "file": entry["file"],
+            "size": entry.get("size"),
+            "hash": entry.get("hash"),
+        }
+        for entry in manifest
+    }
+
+def _update_file_index(backup_folder, added=None, removed_set_ids=None, fsync=False):
+    """
+    파일 인덱스(원본 파일명 -> 해당 파일이 포함된 백업 세트들)를 증분 갱신합니다.
+    인덱스 파일이 아직 없으면 카탈로그 전체에서 새로 만듭니다.
+    
+    Parameters:
+    added (dict, optional): {세트 ID: {원본 파일명: 버전 정보}}
+    removed_set_ids (list, optional): 인덱스에서 제거할 세트 ID 목록
+    """
+    with catalog_lock(backup_folder):
+        file_index = _read_cached_json(backup_folder, FILE_INDEX_FILE)
+        if file_index is None:
+            rebuild_file_index(backup_folder)
+            return
+        
+        # 캐시는 공유되므로 바뀌는 항목만 복사해서 수정
+        file_index = dict(file_index)
+        if removed_set_ids:
+            removed = set(removed_set_ids)
+            for name, versions in list(file_index.items()):
+                if removed.intersection(versions):
+                    versions = {k: v for k, v in versions.items() if k not in removed}
+                    if versions:
+                        file_index[name] = versions
+                    else:
+                        del file_index[name]
+        for set_id, entries in (added or {}).items():
+            for name, entry in entries.items():
+                versions = dict(file_index.get(name, {}))
+                versions[set_id] = entry
+                file_index[name] = versions
+        _write_cached_json(backup_folder, FILE_INDEX_FILE, file_index, indent=None, fsync=fsync)
+
+def rebuild_file_index(backup_folder):
+    """
+    카탈로그의 모든 백업 세트를 읽어 파일 인덱스를 새로 만듭니다.
+    
+    Returns:
+    dict: 생성된 파일 인덱스
+    """
+    with catalog_lock(backup_folder):
+        backup_sets = get_backup_sets(backup_folder)
+        file_index = {}
+        for set_id, backup_set in backup_sets.items():
+            if not isinstance(backup_set, dict) or not isinstance(backup_set.get("files"), list):
+                continue
+            for name, entry in _file_index_entries(get_set_manifest(backup_folder, backup_set)).items():
+                file_index.setdefault(name, {})[set_id] = entry
+        _write_cached_json(backup_folder, FILE_INDEX_FILE, file_index, indent=None)
+        return file_index
+
+def get_file_index(backup_folder):
+    """
+    파일 인덱스를 가져옵니다. 인덱스 파일이 없으면 카탈로그에서 새로 만듭니다.
+    반환된 사전은 캐시와 공유되므로 수정하지 마세요.
+    
+    Returns:
+    dict: {원본 파일명: {세트 ID: {"file", "size", "hash"}}}
+    """
+    file_index = _read_cached_json(backup_folder, FILE_INDEX_FILE)
+    if file_index is None:
+        file_index = rebuild_file_index(backup_folder)
+    return file_index
+
+def get_file_versions(backup_folder, original_file_name):
+    """
+    특정 원본 파일이 포함된 모든 백업 버전을 최신순으로 반환합니다.
+    
+    Parameters:
+    backup_folder (str): 백업 폴더 경로
+    original_file_name (str): 원본 파일명 (예: "slot3.sav")
+    
+    Returns:
+    list: [{"set_id", "date", "description", "file", "size", "hash"}, ...]
+    """
+    versions = get_file_index(backup_folder).get(original_file_name, {})
+    backup_sets = get_backup_sets(backup_folder)
+    result = []
+    for set_id in sorted(versions, reverse=True):
+        backup_set = backup_sets.get(set_id, {})
+        version = dict(versions[set_id])
+        version["set_id"] = set_id
+        version["date"] = backup_set.get("date", "")
+        version["description"] = backup_set.get("description", "")
+        result.append(version)
+    return result
+
+def restore_file_version(backup_folder, set_id, original_file_name, save_folder, io_policy=None):
+    """
+    파일 인덱스를 이용해 특정 백업 세트에 들어 있는 파일 하나만 복원합니다.
+    
+    Returns:
+    str: 복원된 파일 경로
+    """
+    entry = get_file_index(backup_folder).get(original_file_name, {}).get(set_id)
+    if entry is None:
+        raise FileNotFoundError(f"'{original_file_name}' 파일의 백업 버전({set_id})을 찾을 수 없습니다.")
+    with backup_set_lock(backup_folder, [entry["file"]]):
+        return restore_save_file(get_backup_file_path(backup_folder, entry["file"]), save_folder, original_file_name, io_policy)
+
+def select_manifest_entries(manifest, names):
+    """
+    매니페스트에서 복원할 항목만 고릅니다.
+    
+    Parameters:
+    manifest (list): get_set_manifest의 반환값
+    names (list): 원본 상대 경로(예: "slot2.sav"), 하위 폴더 경로(예: "profile1" - 그 아래 모든 파일),
+                  또는 백업 파일명. None이면 모든 항목
+    
+    Returns:
+    tuple: (선택된 항목 목록, 어떤 항목과도 맞지 않은 이름 목록)
+    """
+    if names is None:
+        return list(manifest), []
+    
+    wanted = {}
+    for name in names:
+        wanted[name.replace(os.sep, '/').strip('/')] = name
+    
+    selected = []
+    matched = set()
+    for entry in manifest:
+        path = entry.get("path") or ""
+        hits = [key for key in wanted if key == path or key == entry.get("file") or not key or path.startswith(key + '/')]
+        if hits:
+            # 파일과 그 상위 폴더를 함께 지정해도 항목은 한 번만 복원
+            selected.append(entry)
+            matched.update(hits)
+    unmatched = [name for key, name in wanted.items() if key not in matched]
+    return selected, unmatched
+
+def restore_backup_files(backup_folder, set_id, save_folder, names=None, io_policy=None, progress_callback=None):
+    """
+    백업 세트의 파일 중 일부(또는 전체)만 복원합니다.
+    각 파일은 백업에서 한 번 읽어 대상에 한 번만 쓰며, 지정하지 않은 파일은 건드리지 않습니다.
+    대상 파일이 백업 당시와 크기/수정 시각이 같으면 복사하지 않습니다.
+    
+    Parameters:
+    backup_folder (str): 백업 폴더 경로
+    set_id (str): 백업 세트 ID
+    save_folder (str): 복원할 세이브 폴더
+    names (list, optional): 복원할 원본 경로/하위 폴더/백업 파일명 목록 (select_manifest_entries 참고).
+                            None이면 세트 전체
+    io_policy (IOPolicy, optional): 저부하 I/O 정책
+    progress_callback (callable, optional): 파일 하나를 처리할 때마다 (처리 수, 전체 수)로 호출
+    
+    Returns:
+    dict: {"total", "restored", "unchanged", "errors": [메시지], "unmatched": [이름]}
+          restored는 이미 같은 내용이라 건너뛴 파일(unchanged)을 포함
+    """
+    backup_set = get_backup_sets(backup_folder).get(set_id)
+    if not isinstance(backup_set, dict):
+        raise KeyError(f"백업 세트를 찾을 수 없습니다: {set_id}")
+    
+    manifest = get_set_manifest(backup_folder, backup_set, with_hash=False)
+    entries, unmatched = select_manifest_entries(manifest, names)
+    result = {"total": len(entries), "restored": 0, "unchanged": 0, "errors": [], "unmatched": unmatched}
+    
+    for idx, entry in enumerate(entries, 1):
+        if progress_callback:
+            progress_callback(idx, len(entries))
+        backup_file_name = entry.get("file")
+        original_file_name = entry.get("path")
+        if not isinstance(backup_file_name, str) or not backup_file_name:
+            result["errors"].append(f"잘못된 경로 데이터: {backup_file_name}")
+            continue
+        if not original_file_name:
+            result["errors"].append(f"{backup_file_name}: 원본 파일명 추출 불가")
+            continue
+        
+        try:
+            destination_path = get_restore_destination(save_folder, original_file_name)
+        except ValueError as e:
+            result["errors"].append(f"{backup_file_name}: {e}")
+            continue
+        
+        # 대상 파일이 백업 당시와 크기/수정 시각이 같으면 복사하지 않음 (메타데이터만으로 판단)
+        if matches_manifest_entry(entry, destination_path):
+            result["restored"] += 1
+            result["unchanged"] += 1
+            continue
+        try:
+            # 위치를 찾은 뒤 복사를 마칠 때까지 세트 폴더로 옮겨지지 않도록 잠금
+            with backup_set_lock(backup_folder, [backup_file_name]):
+                restore_save_file(get_backup_file_path(backup_folder, backup_file_name), save_folder,
+                                  original_file_name, io_policy)
+            result["restored"] += 1
+        except FileNotFoundError:
+            result["errors"].append(f"{backup_file_name}: 백업 파일 없음")
+        except PermissionError:
+            result["errors"].append(f"{backup_file_name}: 대상 폴더 쓰기 권한 없음")
+        except Exception as e:
+            result["errors"].append(f"{backup_file_name}: {e}")
+    return result
+
+def _physical_size(file_path):
+    """파일이 디스크에서 실제로 차지하는 바이트 수를 반환합니다. (할당 블록 기준, 지원하지 않으면 크기)"""
+    st = os.stat(file_path)
+    blocks = getattr(st, "st_blocks", None)
+    if blocks is None:
+        return st.st_size
+    return blocks * 512
+
+def _set_storage_entry(backup_folder, backup_set):
+    """백업 세트 하나의 저장 공간 사용량 {"date", "logical", "physical"}을 계산합니다."""
+    logical = 0
+    physical = 0
+    for entry in get_set_manifest(backup_folder, backup_set, with_hash=False):
+        logical += entry.get("size") or 0
+        try:
+            stored_path = resolve_backup_file(get_backup_file_path(backup_folder, entry["file"]))
+            physical += _physical_size(stored_path)
+            if stored_path.endswith(CHUNKED_SUFFIX):
+                # 다른 세트와 함께 쓰는 조각은 처음 기록한 세트의 사용량으로 계산
+                physical += read_recipe(stored_path).get("stored", 0)
+        except (OSError, ValueError):
+            pass
+    return {"date": backup_set.get("date", ""), "logical": logical, "physical": physical}
+
+def _update_storage_stats(backup_folder, added=None, removed_set_ids=None, fsync=False):
+    """
+    저장 공간 통계를 증분 갱신합니다. 통계 파일이 아직 없으면 카탈로그에서 새로 만듭니다.
+    
+    Parameters:
+    added (dict, optional): {세트 ID: 세트 사용량}
+    removed_set_ids (list, optional): 통계에서 제거할 세트 ID 목록
+    """
+    with catalog_lock(backup_folder):
+        stats = _read_cached_json(backup_folder, STORAGE_STATS_FILE)
+        if stats is None:
+            rebuild_storage_stats(backup_folder)
+            return
+        
+        sets = dict(stats.get("sets", {}))
+        totals = dict(stats.get("totals", {"logical": 0, "physical": 0, "sets": 0}))
+        for set_id in removed_set_ids or []:
+            old = sets.pop(set_id, None)
+            if old:
+                totals["logical"] -= old["logical"]
+                totals["physical"] -= old["physical"]
+                totals["sets"] -= 1
+        for set_id, entry in (added or {}).items():
+            old = sets.get(set_id)
+            if old:
+                totals["logical"] -= old["logical"]
+                totals["physical"] -= old["physical"]
+                totals["sets"] -= 1
+            sets[set_id] = entry
+            totals["logical"] += entry["logical"]
+            totals["physical"] += entry["physical"]
+            totals["sets"] += 1
+        _write_cached_json(backup_folder, STORAGE_STATS_FILE, {"totals": totals, "sets": sets}, indent=None, fsync=fsync)
+
+def rebuild_storage_stats(backup_folder):
+    """
+    카탈로그의 모든 세트에서 저장 공간 통계를 새로 만듭니다. (통계 파일이 없을 때 한 번만 사용)
+    
+    Returns:
+    dict: {"totals": {"logical", "physical", "sets"}, "sets": {세트 ID: 사용량}}
+    """
+    with catalog_lock(backup_folder):
+        sets = {}
+        for set_id, backup_set in get_backup_sets(backup_folder).items():
+            if isinstance(backup_set, dict):
+                sets[set_id] = _set_storage_entry(backup_folder, backup_set)
+        stats = {
+            "totals": {
+                "logical": sum(entry["logical"] for entry in sets.values()),
+                "physical": sum(entry["physical"] for entry in sets.values()),
+                "sets": len(sets),
+            },
+            "sets": sets,
+        }
+        _write_cached_json(backup_folder, STORAGE_STATS_FILE, stats, indent=None)
+        return stats
+
+def refresh_set_storage_stats(backup_folder, set_id):
+    """세트의 백업 파일이 바뀐 경우(압축 등) 해당 세트의 사용량만 다시 계산합니다."""
+    backup_set = get_backup_sets(backup_folder).get(set_id)
+    if isinstance(backup_set, dict):
+        _update_storage_stats(backup_folder, added={set_id: _set_storage_entry(backup_folder, backup_set)})
+
+def get_storage_stats(backup_folder):
+    """
+    저장 공간 통계를 가져옵니다. 반환된 사전은 캐시와 공유되므로 수정하지 마세요.
+    
+    Returns:
+    dict: {"totals": {"logical", "physical", "sets"}, "sets": {세트 ID: {"date", "logical", "physical"}}}
+    """
+    stats = _read_cached_json(backup_folder, STORAGE_STATS_FILE)
+    if stats is None:
+        stats = rebuild_storage_stats(backup_folder)
+    return stats
+
+def get_storage_summary(backup_folder, top_n=10, growth_days=30):
+    """
+    대시보드용 저장 공간 요약을 계산합니다. (통계 파일만 사용하며 백업 폴더를 탐색하지 않음)
+    
+    Parameters:
+    backup_folder (str): 백업 폴더 경로
+    top_n (int): 가장 큰 세트 목록 개수
+    growth_days (int): 증가 추세를 계산할 최근 기간 (일)
+    
+    Returns:
+    dict: {"logical", "physical", "savings", "sets", "largest": [(세트 ID, 사용량), ...],
+           "growth_per_day": 최근 기간 하루 평균 증가량 (바이트)}
+    """
+    stats = get_storage_stats(backup_folder)
+    totals = stats.get("totals", {})
+    sets = stats.get("sets", {})
+    largest = sorted(sets.items(), key=lambda item: item[1]["physical"], reverse=True)[:top_n]
+    
+    cutoff = (datetime.now() - timedelta(days=growth_days)).strftime("%Y-%m-%d %H:%M:%S")
+    recent = [entry for entry in sets.values() if entry.get("date", "") >= cutoff]
+    growth_per_day = sum(entry["physical"] for entry in recent) / growth_days
+    
+    logical = totals.get("logical", 0)
+    physical = totals.get("physical", 0)
+    return {
+        "logical": logical,
+        "physical": physical,
+        "savings": logical - physical,
+        "sets": totals.get("sets", 0),
+        "largest": largest,
+        "growth_per_day": growth_per_day,
+    }
+
+def save_backup_set(backup_folder, set_id, file_paths, description=None, tags=None, source_paths=None, source_root=None,
+                    durability=DEFAULT_DURABILITY, copied_files=None):
     """
     백업 세트 정보를 저장합니다.
+    각 파일의 원본 상대 경로, 크기, 원본 수정 시각, 내용 해시를 매니페스트로 함께 기록합니다.
+    durability가 none이 아니면 백업 파일을 먼저 디스크에 기록한 뒤 카탈로그를 기록하므로,
+    전원이 꺼져도 카탈로그에 있는 세트의 파일이 비어 있거나 일부만 기록된 상태가 되지 않습니다.
     
     Parameters:
     backup_folder (str): 백업 폴더 경로
     set_id (str): 백업 세트 ID (타임스탬프)
     file_paths (list): 백업된 파일 경로 목록
     description (str, optional): 백업 세트 설명
+    tags (list, optional): 검색용 태그 목록
+    source_paths (list, optional): file_paths와 같은 순서의 원본 파일 경로 목록
+    source_root (str, optional): 원본 상대 경로의 기준 폴더 (세이브 폴더)
+    durability (str): 내구성 수준 (none / set / paranoid)
+    copied_files (dict, optional): backup_save_file이 복사하면서 기록한 {백업 파일명: {"hash", "size", "mtime_ns"}}.
+        해시가 없는 파일만 다시 읽어 계산하고, 원본 수정 시각은 복사한 원본의 값을 기록
     """
-    backup_sets_file = os.path.join(backup_folder, "backup_sets.json")
-    
-    # 기존 백업 세트 정보 로드
-    backup_sets = {}
-    if os.path.exists(backup_sets_file):
-        with open(backup_sets_file, 'r', encoding='utf-8') as f:
-            backup_sets = json.load(f)
+    # 카탈로그에 올리기 전에 세트의 백업 파일을 한꺼번에 디스크에 기록
+    if durability != DURABILITY_NONE:
+        _sync_backup_files(file_paths)
     
     # 형식화된 날짜 생성
-    formatted_date = datetime.strptime(set_id, "%y%m%d_%H%M%S").strftime("%Y-%m-%d %H:%M:%S")
+    formatted_date = parse_set_id(set_id).strftime("%Y-%m-%d %H:%M:%S")
+    
+    file_names = [os.path.basename(file) for file in file_paths]
+    # 매니페스트(크기, 해시)는 잠금 밖에서 미리 계산
+    if source_paths is None:
+        source_paths = [None] * len(file_names)
+    copied_files = copied_files or {}
+    manifest = [
+        build_manifest_entry(backup_folder, file, source_path, source_root, copied=copied_files.get(file))
+        for file, source_path in zip(file_names, source_paths)
+    ]
     
-    # 새 백업 세트 정보 추가
-    backup_sets[set_id] = {
+    record = {
         "id": set_id,
+        "schema": CATALOG_SCHEMA_VERSION,
         "date": formatted_date,
         "description": description or f"백업 ({formatted_date})",
-        "files": [os.path.basename(file) for file in file_paths]
+        "files": file_names,
+        "manifest": manifest
     }
+    if tags:
+        record["tags"] = list(tags)
     
-    # 백업 세트 정보 저장
-    with open(backup_sets_file, 'w', encoding='utf-8') as f:
-        json.dump(backup_sets, f, ensure_ascii=False, indent=4)
+    with catalog_lock(backup_folder):
+        # 기존 백업 세트 정보 로드 (캐시는 공유되므로 복사본을 수정)
+        backup_sets = dict(get_backup_sets(backup_folder))
+        backup_sets[set_id] = record
+        
+        # 백업 세트 정보 저장 (세트가 확정되는 시점)
+        write_backup_sets(backup_folder, backup_sets, fsync=durability != DURABILITY_NONE)
+        
+        # 파일 인덱스 및 저장 공간 통계 갱신 (손상되면 카탈로그에서 다시 만들 수 있으므로 paranoid에서만 fsync)
+        paranoid = durability == DURABILITY_PARANOID
+        _update_file_index(backup_folder, added={set_id: _file_index_entries(manifest)}, fsync=paranoid)
+        _update_storage_stats(backup_folder, added={set_id: _set_storage_entry(backup_folder, record)}, fsync=paranoid)
     
+    _notify_catalog_listeners(backup_folder, "added", set_id, record)
     return set_id
 
+def merge_backup_sets(backup_folder, records, file_paths=()):
+    """
+    다른 곳에서 가져온 백업 세트 레코드들을 카탈로그에 한 번에 추가합니다. (가져오기용)
+    카탈로그에 이미 있는 세트 ID는 건너뛰며, 카탈로그는 세트 수와 관계없이 한 번만 기록합니다.
+    file_paths(가져온 백업 파일)를 먼저 디스크에 기록한 뒤 카탈로그를 기록합니다.
+    
+    Parameters:
+    backup_folder (str): 백업 폴더 경로
+    records (dict): {세트 ID: 백업 세트 레코드} (매니페스트 포함)
+    file_paths (list): 가져오면서 기록한 백업 파일 경로 목록
+    
+    Returns:
+    list: 추가된 세트 ID 목록
+    """
+    if file_paths:
+        _sync_backup_files(file_paths)
+    with catalog_lock(backup_folder):
+        backup_sets = dict(get_backup_sets(backup_folder))
+        added = {set_id: record for set_id, record in records.items() if set_id not in backup_sets}
+        if added:
+            backup_sets.update(added)
+            write_backup_sets(backup_folder, backup_sets, fsync=True)
+            _update_file_index(backup_folder, added={
+                set_id: _file_index_entries(get_set_manifest(backup_folder, record, with_hash=False))
+                for set_id, record in added.items()
+            })
+            _update_storage_stats(backup_folder, added={
+                set_id: _set_storage_entry(backup_folder, record) for set_id, record in added.items()
+            })
+    
+    for set_id, record in added.items():
+        _notify_catalog_listeners(backup_folder, "added", set_id, record)
+    return list(added)
+
+def migrate_backup_sets(backup_folder, stop_event=None, batch_size=20):
+    """
+    이전 형식의 백업 세트에 매니페스트를 채워 넣습니다. (백그라운드 실행용)
+    백업 파일을 읽어 크기와 해시를 계산하며, 원본 수정 시각은 알 수 없으므로 비워 둡니다.
+    batch_size개 세트마다 카탈로그를 다시 읽어 병합하므로 다른 작업과 동시에 실행해도 안전합니다.
+    
+    Parameters:
+    backup_folder (str): 백업 폴더 경로
+    stop_event (threading.Event, optional): 설정되면 중단
+    batch_size (int): 한 번에 기록할 세트 수
+    
+    Returns:
+    int: 변환된 세트 수
+    """
+    pending = [
+        set_id for set_id, backup_set in get_backup_sets(backup_folder).items()
+        if isinstance(backup_set, dict) and backup_set.get("schema", 1) < CATALOG_SCHEMA_VERSION
+        and isinstance(backup_set.get("files"), list)
+    ]
+    
+    migrated = 0
+    batch = {}
+    
+    def commit(batch):
+        with catalog_lock(backup_folder):
+            backup_sets = dict(get_backup_sets(backup_folder))
+            changed = 0
+            for set_id, manifest in batch.items():
+                backup_set = backup_sets.get(set_id)
+                if isinstance(backup_set, dict) and backup_set.get("schema", 1) < CATALOG_SCHEMA_VERSION:
+                    backup_set = dict(backup_set)
+                    backup_set["schema"] = CATALOG_SCHEMA_VERSION
+                    backup_set["manifest"] = manifest
+                    backup_sets[set_id] = backup_set
+                    changed += 1
+            if changed:
+                write_backup_sets(backup_folder, backup_sets)
+            return changed
+    
+    for set_id in pending:
+        if stop_event is not None and stop_event.is_set():
+            break
+        backup_set = get_backup_sets(backup_folder).get(set_id)
+        if not isinstance(backup_set, dict):
+            continue
+        batch[set_id] = get_set_manifest(backup_folder, backup_set)
+        if len(batch) >= batch_size:
+            migrated += commit(batch)
+            batch = {}
+    if batch:
+        migrated += commit(batch)
+    return migrated
+
+def _move_to_set_folder(backup_folder, set_id, names):
+    """
+    백업 폴더 바로 아래의 파일들을 세트 폴더로 옮깁니다. (같은 파일 시스템 안에서 이름만 바꿈)
+    다른 스레드가 먼저 옮긴 파일은 건너뛰고, 세트 폴더에 같은 이름이 이미 있으면 덮어쓰지 않습니다.
+    
+    Returns:
+    int: 옮긴 파일 수
+    """
+    set_folder = get_set_folder(backup_folder, set_id)
+    moved = 0
+    # 같은 세트의 파일을 찾아 읽거나 지우는 작업(복원, 삭제)과 엇갈리지 않도록 세트 단위로 잠그고 옮김
+    with backup_set_lock(backup_folder, set_ids=[set_id]):
+        os.makedirs(set_folder, exist_ok=True)
+        for name in names:
+            dst = os.path.join(set_folder, name)
+            if os.path.exists(dst):
+                print(f"경고: 세트 폴더에 같은 이름의 파일이 있어 옮기지 않았습니다: {name}")
+                continue
+            try:
+                os.rename(os.path.join(backup_folder, name), dst)
+            except FileNotFoundError:
+                continue # 그 사이 삭제된 파일
+            moved += 1
+    return moved
+
+def relocate_backup_set(backup_folder, set_id):
+    """
+    백업 세트의 파일 중 이전 형식으로 백업 폴더 바로 아래에 있는 파일(콜드 보관 사본 포함)을 세트 폴더로 옮깁니다.
+    세트의 파일을 새로 쓰거나 지우는 작업(콜드 보관 등)은 먼저 이 함수를 호출하여 파일 위치를 고정합니다.
+    
+    Returns:
+    int: 옮긴 파일 수
+    """
+    backup_set = get_backup_sets(backup_folder).get(set_id)
+    if not isinstance(backup_set, dict):
+        return 0
+    groups = {}
+    for file in backup_set.get("files", []):
+        file_set_id = _parse_backup_file_name(file)[0] if isinstance(file, str) else None
+        if file_set_id is None:
+            continue
+        for name in (file + suffix for suffix in _STORED_SUFFIXES):
+            if os.path.exists(os.path.join(backup_folder, name)):
+                groups.setdefault(file_set_id, []).append(name)
+    return sum(_move_to_set_folder(backup_folder, file_set_id, names) for file_set_id, names in groups.items())
+
+def migrate_backup_layout(backup_folder, stop_event=None):
+    """
+    이전 형식으로 백업 폴더 바로 아래에 쌓인 백업 파일을 세트 폴더(sets/<세트 ID>/)로 옮깁니다. (백그라운드 실행용)
+    파일 이름만 바꾸므로 내용을 다시 쓰지 않고 카탈로그도 바뀌지 않습니다.
+    세트 단위로 backup_set_lock을 잡고 옮기므로, 같은 잠금 안에서 파일 위치를 찾는 복원/삭제와 동시에 실행해도 되며,
+    중단되면 다음 실행 때 남은 파일부터 이어서 옮깁니다. 삭제 도중 중단된 세트 폴더도 정리합니다.
+    
+    Parameters:
+    backup_folder (str): 백업 폴더 경로
+    stop_event (threading.Event, optional): 설정되면 현재 세트까지만 옮기고 중단
+    
+    Returns:
+    dict: {"completed", "sets", "files"} 옮긴 세트 수와 파일 수
+    """
+    result = {"completed": False, "sets": 0, "files": 0}
+    groups = {}
+    with os.scandir(backup_folder) as entries:
+        for entry in entries:
+            if _is_backup_folder_metadata(entry.name) or not entry.is_file(follow_symlinks=False):
+                continue
+            set_id = _parse_backup_file_name(entry.name)[0]
+            if set_id is not None:
+                groups.setdefault(set_id, []).append(entry.name)
+    
+    for set_id in sorted(groups):
+        if stop_event is not None and stop_event.is_set():
+            return result
+        try:
+            parse_set_id(set_id)
+        except ValueError:
+            continue # 백업 세트 형식이 아닌 파일은 그대로 둠
+        moved = _move_to_set_folder(backup_folder, set_id, groups[set_id])
+        if moved:
+            result["sets"] += 1
+            result["files"] += moved
+    
+    sets_dir = os.path.join(backup_folder, SETS_DIR)
+    if os.path.isdir(sets_dir):
+        with os.scandir(sets_dir) as entries:
+            leftovers = [entry.name for entry in entries if entry.name.startswith(_DELETING_PREFIX)]
+        for name in leftovers:
+            # 지금 삭제 중인 폴더는 건드리지 않도록 해당 세트의 잠금을 잡고 정리
+            with backup_set_lock(backup_folder, set_ids=[name[len(_DELETING_PREFIX):]]):
+                shutil.rmtree(os.path.join(sets_dir, name), ignore_errors=True)
+    result["completed"] = True
+    return result
+
+def delete_backup_set_files(backup_folder, set_id):
+    """
+    백업 세트의 파일을 삭제합니다. (카탈로그는 delete_backup_set_records로 따로 갱신)
+    세트 폴더는 파일을 하나씩 지우지 않고 이름을 바꾼 뒤 폴더째 삭제하며,
+    아직 옮기지 않은 이전 형식의 파일은 하나씩 삭제합니다. 콜드 보관된 압축 사본도 함께 삭제됩니다.
+    
+    Parameters:
+    backup_folder (str): 백업 폴더 경로
+    set_id (str): 백업 세트 ID
+    
+    Returns:
+    tuple: (삭제한 파일 수, 찾지 못한 백업 파일명 목록)
+    """
+    backup_set = get_backup_sets(backup_folder).get(set_id)
+    files = [file for file in backup_set.get("files", []) if isinstance(file, str)] if isinstance(backup_set, dict) else []
+    
+    # 삭제하는 동안 이전 형식의 파일이 세트 폴더로 옮겨져 "없음"으로 남지 않도록 잠금
+    with backup_set_lock(backup_folder, files, [set_id]):
+        deleted, found, chunked = _delete_set_files_locked(backup_folder, set_id, files)
+    
+    # 조각으로 저장된 파일이 있었으면 더 이상 쓰지 않는 조각을 정리 (모든 레시피를 읽으므로 백그라운드에서)
+    if chunked:
+        schedule_chunk_garbage_collection(backup_folder)
+    missing = [file for file in files if file not in found]
+    return deleted, missing
+
+def _delete_set_files_locked(backup_folder, set_id, files):
+    """delete_backup_set_files의 실제 삭제. (backup_set_lock 안에서 호출) Returns: (삭제한 파일 수, 찾은 백업 파일명 집합, 레시피가 있었는지)"""
+    set_folder = get_set_folder(backup_folder, set_id)
+    try:
+        with os.scandir(set_folder) as entries:
+            names = [entry.name for entry in entries]
+    except FileNotFoundError:
+        names = None
+    if names is not None:
+        # 삭제 도중 중단되어도 세트 폴더로 보이지 않도록 먼저 이름을 바꿈 (남은 폴더는 migrate_backup_layout이 정리)
+        doomed = os.path.join(os.path.dirname(set_folder), _DELETING_PREFIX + set_id)
+        os.rename(set_folder, doomed)
+        shutil.rmtree(doomed)
+    else:
+        names = []
+    deleted = len(names)
+    found = {_parse_backup_file_name(name)[1] for name in names}
+    
+    # 아직 옮기지 않은 이전 형식의 파일 (또는 파일명의 타임스탬프가 세트 ID와 다른 파일)
+    for file in files:
+        if file not in found and remove_backup_file(get_backup_file_path(backup_folder, file)):
+            deleted += 1
+            found.add(file)
+    return deleted, found, any(name.endswith(CHUNKED_SUFFIX) for name in names)
+
+# 백업 폴더별 백그라운드 조각 정리 상태: 실행 중이면 폴더 키가 있고, 값이 True면 끝난 뒤 한 번 더 실행
+_chunk_gc_state = {}
+_chunk_gc_lock = threading.Lock()
+
+def schedule_chunk_garbage_collection(backup_folder):
+    """
+    collect_chunk_garbage를 백그라운드 스레드에서 실행합니다.
+    이미 실행 중이면 새 스레드를 만들지 않고, 실행 중인 정리가 끝난 뒤 한 번 더 실행합니다.
+    (프로그램이 도중에 끝나도 남은 조각은 다음 정리 때 지워짐)
+    """
+    key = _catalog_key(backup_folder)
+    with _chunk_gc_lock:
+        if key in _chunk_gc_state:
+            _chunk_gc_state[key] = True
+            return
+        _chunk_gc_state[key] = False
+
+    def run():
+        while True:
+            try:
+                collect_chunk_garbage(backup_folder)
+            except Exception as e:
+                print(f"경고: 조각 정리 중 오류 발생 ({backup_folder}): {e}")
+            with _chunk_gc_lock:
+                if not _chunk_gc_state[key]:
+                    del _chunk_gc_state[key]
+                    return
+                _chunk_gc_state[key] = False
+
+    threading.Thread(target=run, name="chunk-gc", daemon=True).start()
+
+def collect_chunk_garbage(backup_folder):
+    """
+    백업 폴더의 어느 레시피도 참조하지 않는 조각을 조각 저장소에서 삭제합니다.
+    방금 백업 중인 파일이 쓰는 조각은 최근에 기록/참조되어 유예 시간 동안 남으므로 백업과 동시에 실행해도 안전합니다.
+    
+    Returns:
+    tuple: (삭제한 조각 수, 삭제한 바이트 수)
+    """
+    referenced = set()
+    folders = [backup_folder]
+    sets_dir = os.path.join(backup_folder, SETS_DIR)
+    if os.path.isdir(sets_dir):
+        with os.scandir(sets_dir) as entries:
+            folders.extend(entry.path for entry in entries if entry.is_dir(follow_symlinks=False))
+    for folder in folders:
+        with os.scandir(folder) as entries:
+            recipes = [entry.path for entry in entries if entry.name.endswith(CHUNKED_SUFFIX)]
+        for recipe_path in recipes:
+            try:
+                referenced.update(recipe_digests(read_recipe(recipe_path)))
+            except (OSError, ValueError) as e:
+                # 읽을 수 없는 레시피가 있으면 필요한 조각을 지울 수 있으므로 정리하지 않음
+                print(f"경고: 레시피를 읽을 수 없어 조각 정리를 건너뜁니다 ({recipe_path}): {e}")
+                return 0, 0
+    return ChunkStore(backup_folder).collect_garbage(referenced)
+
+def _scan_backup_files(backup_folder):
+    """
+    백업 폴더(세트 폴더와 이전 형식으로 바로 아래에 있는 파일)를 한 번 훑어 백업 파일을 세트 ID(파일명의 타임스탬프)별로 묶습니다.
+    
+    Returns:
+    tuple: ({세트 ID: [(백업 파일명, 저장 형태 접미사, 크기, 파일이 있는 폴더)]}, {세트 ID: 날짜}, 타임스탬프가 없어 건너뛴 파일 수)
+    """
+    groups = {}
+    dates = {}
+    skipped = 0
+    
+    def scan(folder):
+        nonlocal skipped
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                # 카탈로그/인덱스, 기록 중인 임시 파일은 제외
+                if _is_backup_folder_metadata(entry.name) or not entry.is_file(follow_symlinks=False):
+                    continue
+                set_id, name, suffix = _parse_backup_file_name(entry.name)
+                if set_id is None:
+                    skipped += 1
+                    continue
+                groups.setdefault(set_id, []).append((name, suffix, entry.stat(follow_symlinks=False).st_size, folder))
+    
+    scan(backup_folder)
+    sets_dir = os.path.join(backup_folder, SETS_DIR)
+    if os.path.isdir(sets_dir):
+        with os.scandir(sets_dir) as entries:
+            set_folders = [entry.path for entry in entries
+                           if not entry.name.startswith(".") and entry.is_dir(follow_symlinks=False)]
+        for set_folder in set_folders:
+            scan(set_folder)
+    # 날짜로 해석되지 않는 타임스탬프는 제외 (strptime은 느리므로 세트마다 한 번만 확인)
+    for set_id in list(groups):
+        try:
+            dates[set_id] = parse_set_id(set_id)
+        except ValueError:
+            skipped += len(groups.pop(set_id))
+    return groups, dates, skipped
+
+def _recovered_manifest_entries(files, with_hash):
+    """스캔한 백업 파일들의 매니페스트 항목을 만듭니다. (작업 스레드에서 여러 파일을 한 번에 처리)"""
+    entries = []
+    for name, suffix, size, folder in files:
+        file_hash = None
+        backup_path = os.path.join(folder, name)
+        try:
+            if suffix:
+                # 압축 사본과 조각 레시피는 풀거나 조립하여 원래 크기와 해시를 계산
+                size = 0
+                hasher = hashlib.sha256()
+                with open_backup_file(backup_path) as f:
+                    for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                        size += len(chunk)
+                        hasher.update(chunk)
+                file_hash = hasher.hexdigest() if with_hash else None
+            elif with_hash:
+                file_hash = hash_file(backup_path)
+        except (OSError, ValueError, lzma.LZMAError) as e:
+            print(f"경고: 백업 파일을 읽을 수 없습니다 ({name}): {e}")
+            size = None
+        entries.append({
+            "file": name,
+            "path": get_original_filename(name),
+            "size": size,
+            "mtime_ns": None, # 원본 파일의 수정 시각은 알 수 없음
+            "hash": file_hash,
+        })
+    return entries
+
+def rebuild_backup_sets(backup_folder, with_hash=True, workers=None, progress_callback=None):
+    """
+    백업 폴더의 파일을 스캔하여 카탈로그(backup_sets.json)를 복구합니다.
+    
+    백업 파일명의 타임스탬프로 파일을 세트로 묶고, 카탈로그에 없는 세트를 새로 등록합니다.
+    카탈로그에 이미 있는 세트는 설명과 태그를 그대로 유지합니다.
+    카탈로그 파일이 손상되었으면 'backup_sets.json.corrupt'로 옮겨 두고 파일만으로 새로 만듭니다.
+    해시는 여러 스레드에서 파일 묶음 단위로 병렬 계산하며, 파일 인덱스와 저장 공간 통계도 새로 만듭니다.
+    
+    Parameters:
+    backup_folder (str): 백업 폴더 경로
+    with_hash (bool): 복구한 세트의 내용 해시 계산 여부 (False면 무결성 검사 전까지 검증 불가)
+    workers (int, optional): 해시 계산 스레드 수. 없으면 CPU 수에 맞춤
+    progress_callback (callable, optional): 파일 묶음이 끝날 때마다 (처리한 파일 수, 전체 파일 수)로 호출
+    
+    Returns:
+    dict: {"sets", "recovered", "files", "skipped", "catalog_corrupt"}
+          전체 세트 수, 새로 등록한 세트 수, 새로 등록한 파일 수, 타임스탬프가 없어 건너뛴 파일 수, 카탈로그 손상 여부
+    """
+    catalog_file = os.path.join(backup_folder, BACKUP_SETS_FILE)
+    catalog_corrupt = False
+    try:
+        existing = get_backup_sets(backup_folder)
+    except ValueError:
+        catalog_corrupt = True
+        with catalog_lock(backup_folder):
+            os.replace(catalog_file, catalog_file + ".corrupt")
+            invalidate_backup_sets_cache(backup_folder)
+        existing = {}
+
+    groups, dates, skipped = _scan_backup_files(backup_folder)
+    missing = {set_id: files for set_id, files in groups.items() if set_id not in existing}
+
+    # 작은 파일이 아주 많을 때 작업 예약 비용이 커지지 않도록 파일 묶음 단위로 나누어 처리
+    tasks = []
+    for set_id in sorted(missing):
+        for file_info in sorted(missing[set_id]):
+            tasks.append((set_id, file_info))
+    batch_size = 256
+    batches = [tasks[i:i + batch_size] for i in range(0, len(tasks), batch_size)]
+    manifests = {set_id: [] for set_id in missing}
+    done = 0
+    with ThreadPoolExecutor(max_workers=workers or min(32, (os.cpu_count() or 1) * 2)) as executor:
+        futures = [
+            executor.submit(_recovered_manifest_entries, [file_info for _, file_info in batch], with_hash)
+            for batch in batches
+        ]
+        for batch, future in zip(batches, futures):
+            for (set_id, _), entry in zip(batch, future.result()):
+                manifests[set_id].append(entry)
+            done += len(batch)
+            if progress_callback:
+                progress_callback(done, len(tasks))
+
+    records = {}
+    for set_id, manifest in manifests.items():
+        formatted_date = dates[set_id].strftime("%Y-%m-%d %H:%M:%S")
+        record = {
+            "id": set_id,
+            "schema": CATALOG_SCHEMA_VERSION,
+            "date": formatted_date,
+            "description": f"복구된 백업 ({formatted_date})",
+            "files": [entry["file"] for entry in manifest],
+            "manifest": manifest,
+        }
+        if all(suffix == COLD_SUFFIX for _, suffix, _, _ in missing[set_id]):
+            record["tier"] = "cold"
+        records[set_id] = record
+
+    with catalog_lock(backup_folder):
+        backup_sets = dict(get_backup_sets(backup_folder))
+        if records or catalog_corrupt:
+            backup_sets.update({set_id: record for set_id, record in records.items() if set_id not in backup_sets})
+            write_backup_sets(backup_folder, backup_sets, fsync=True)
+            rebuild_file_index(backup_folder)
+            rebuild_storage_stats(backup_folder)
+
+    for set_id, record in records.items():
+        _notify_catalog_listeners(backup_folder, "added", set_id, record)
+    return {
+        "sets": len(backup_sets),
+        "recovered": len(records),
+        "files": len(tasks),
+        "skipped": skipped,
+        "catalog_corrupt": catalog_corrupt,
+    }
+
+def _scan_live_folder(save_folder, paths):
+    """
+    세이브 폴더에서 세트의 매니페스트 경로에 해당하는 파일만 stat으로 매니페스트 형태로 만듭니다. (해시 없음)
+    세트에 없는 파일은 복원해도 바뀌지 않으므로 폴더 전체를 훑지 않고 비교에서도 제외합니다.
+    """
+    entries = {}
+    for path in paths:
+        try:
+            file_path = get_restore_destination(save_folder, path)
+            st = os.stat(file_path)
+        except (ValueError, OSError):
+            continue # 안전하지 않은 경로이거나 세이브 폴더에 없는 파일
+        if not stat.S_ISREG(st.st_mode):
+            continue
+        entries[path] = {
+            "file": file_path,
+            "path": path,
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "hash": None,
+        }
+    return entries
+
+def compare_backup_set(backup_folder, set_id, save_folder=None, other_set_id=None):
+    """
+    백업 세트를 현재 세이브 폴더 또는 다른 백업 세트와 메타데이터만으로 비교합니다.
+    크기와 수정 시각(또는 저장된 해시)으로 판단할 수 없는 파일은 'ambiguous'로 분류되며,
+    resolve_ambiguous()로 해시를 계산해 확정할 수 있습니다.
+    
+    Parameters:
+    backup_folder (str): 백업 폴더 경로
+    set_id (str): 기준 백업 세트 ID (복원할 세트)
+    save_folder (str, optional): 비교할 세이브 폴더 (other_set_id가 없을 때 사용)
+    other_set_id (str, optional): 비교할 다른 백업 세트 ID
+    
+    Returns:
+    dict: {"added", "removed", "changed", "identical", "ambiguous"} 각각 항목 목록
+          added: 세트에만 있는 파일 (복원 시 추가됨), removed: 비교 대상 세트에만 있는 파일
+          세이브 폴더와 비교할 때는 세트에 있는 경로만 비교하므로 removed는 항상 비어 있음
+          항목: {"path", "size", "other_size", "delta", "entry", "other_entry"}
+    """
+    backup_sets = get_backup_sets(backup_folder)
+    if set_id not in backup_sets:
+        raise KeyError(f"백업 세트를 찾을 수 없습니다: {set_id}")
+    left = {entry["path"]: entry for entry in get_set_manifest(backup_folder, backup_sets[set_id], with_hash=False)}
+    
+    if other_set_id is not None:
+        if other_set_id not in backup_sets:
+            raise KeyError(f"백업 세트를 찾을 수 없습니다: {other_set_id}")
+        right = {entry["path"]: entry for entry in get_set_manifest(backup_folder, backup_sets[other_set_id], with_hash=False)}
+        live = False
+    else:
+        right = _scan_live_folder(save_folder, left)
+        live = True
+    
+    result = {"added": [], "removed": [], "changed": [], "identical": [], "ambiguous": []}
+    for path in sorted(set(left) | set(right)):
+        entry, other_entry = left.get(path), right.get(path)
+        size = entry.get("size") if entry else None
+        other_size = other_entry.get("size") if other_entry else None
+        item = {
+            "path": path,
+            "size": size,
+            "other_size": other_size,
+            "delta": (size or 0) - (other_size or 0),
+            "entry": entry,
+            "other_entry": other_entry,
+        }
+        if other_entry is None:
+            result["added"].append(item)
+        elif entry is None:
+            result["removed"].append(item)
+        elif size is not None and other_size is not None and size != other_size:
+            result["changed"].append(item)
+        elif entry.get("hash") and other_entry.get("hash"):
+            result["identical" if entry["hash"] == other_entry["hash"] else "changed"].append(item)
+        elif live and size == other_size and entry.get("mtime_ns") is not None and entry["mtime_ns"] == other_entry["mtime_ns"]:
+            # 크기와 수정 시각이 백업 당시와 같으면 같은 파일로 간주
+            result["identical"].append(item)
+        else:
+            result["ambiguous"].append(item)
+    result["live"] = live
+    return result
+
+def resolve_ambiguous(backup_folder, result, on_resolved=None, stop_event=None):
+    """
+    compare_backup_set 결과의 'ambiguous' 항목을 해시로 비교해 'changed' 또는 'identical'로 옮깁니다.
+    (백그라운드 스레드에서 실행하는 용도)
+    
+    Parameters:
+    backup_folder (str): 백업 폴더 경로
+    result (dict): compare_backup_set의 반환값 (제자리에서 갱신됨)
+    on_resolved (callable, optional): 항목 하나가 확정될 때마다 (항목, "changed"/"identical")로 호출
+    stop_event (threading.Event, optional): 설정되면 중단
+    """
+    def content_hash(entry, is_live):
+        if entry.get("hash"):
+            return entry["hash"]
+        if is_live:
+            return hash_file(entry["file"])
+        return hash_backup_file(get_backup_file_path(backup_folder, entry["file"]))
+    
+    while result["ambiguous"]:
+        if stop_event is not None and stop_event.is_set():
+            break
+        item = result["ambiguous"].pop(0)
+        try:
+            same = content_hash(item["entry"], False) == content_hash(item["other_entry"], result.get("live", False))
+        except OSError:
+            same = False
+        status = "identical" if same else "changed"
+        result[status].append(item)
+        if on_resolved:
+            on_resolved(item, status)
+
+def mark_damaged_sets(backup_folder, damaged_files, replace=False):
+    """
+    손상되었거나 사라진 백업 파일을 백업 세트 레코드에 표시합니다.
+    세트를 카탈로그에서 지우지 않고 "damaged" 목록으로 남겨 사용자가 확인할 수 있게 합니다.
+    
+    Parameters:
+    backup_folder (str): 백업 폴더 경로
+    damaged_files (dict): {세트 ID: [손상된 백업 파일, ...]}
+    replace (bool): True면 기존 표시를 덮어씀 (빈 목록이면 표시 제거),
+                    False면 기존 표시에 추가만 함
+    
+    Returns:
+    list: 표시가 바뀐 세트 ID 목록
+    """
+    with catalog_lock(backup_folder):
+        backup_sets = get_backup_sets(backup_folder)
+        updated = {}
+        for set_id, files in damaged_files.items():
+            backup_set = backup_sets.get(set_id)
+            if not isinstance(backup_set, dict):
+                continue
+            current = backup_set.get("damaged", [])
+            new = sorted(set(files)) if replace else sorted(set(current) | set(files))
+            if new == current:
+                continue
+            backup_set = dict(backup_set)
+            if new:
+                backup_set["damaged"] = new
+            else:
+                backup_set.pop("damaged", None)
+            updated[set_id] = backup_set
+        if updated:
+            backup_sets = dict(backup_sets)
+            backup_sets.update(updated)
+            write_backup_sets(backup_folder, backup_sets)
+    return list(updated)
+
+def set_backup_set_tier(backup_folder, set_id, tier):
+    """
+    백업 세트의 보관 계층을 기록하고 저장 공간 통계를 갱신합니다.
+    
+    Parameters:
+    backup_folder (str): 백업 폴더 경로
+    set_id (str): 백업 세트 ID
+    tier (str): "cold" (압축 보관) 또는 None (일반)
+    
+    Returns:
+    bool: 기록했으면 True (세트가 없으면 False)
+    """
+    with catalog_lock(backup_folder):
+        backup_sets = get_backup_sets(backup_folder)
+        backup_set = backup_sets.get(set_id)
+        if not isinstance(backup_set, dict):
+            return False
+        backup_set = dict(backup_set)
+        if tier:
+            backup_set["tier"] = tier
+        else:
+            backup_set.pop("tier", None)
+        backup_sets = dict(backup_sets)
+        backup_sets[set_id] = backup_set
+        write_backup_sets(backup_folder, backup_sets)
+        refresh_set_storage_stats(backup_folder, set_id)
+    
+    _notify_catalog_listeners(backup_folder, "updated", set_id, backup_set)
+    return True
+
+def delete_backup_set_records(backup_folder, set_ids):
+    """
+    카탈로그에서 백업 세트 정보를 삭제합니다. (백업 파일은 삭제하지 않습니다)
+    
+    Parameters:
+    backup_folder (str): 백업 폴더 경로
+    set_ids (list): 삭제할 백업 세트 ID 목록
+    
+    Returns:
+    list: 실제로 삭제된 백업 세트 ID 목록
+    """
+    with catalog_lock(backup_folder):
+        backup_sets = get_backup_sets(backup_folder)
+        removed = [set_id for set_id in set_ids if set_id in backup_sets]
+        removed_records = {set_id: backup_sets[set_id] for set_id in removed}
+        if removed:
+            backup_sets = {k: v for k, v in backup_sets.items() if k not in removed}
+            write_backup_sets(backup_folder, backup_sets)
+            _update_file_index(backup_folder, removed_set_ids=removed)
+            _update_storage_stats(backup_folder, removed_set_ids=removed)
+    
+    for set_id, backup_set in removed_records.items():
+        _notify_catalog_listeners(backup_folder, "removed", set_id, backup_set)
+    return removed
+
 def get_backup_sets(backup_folder):
     """
     백업 폴더에서 모든 백업 세트 정보를 가져옵니다.
+    파싱 결과는 파일 크기와 mtime_ns로 검증되는 캐시에 보관되므로,
+    반환된 사전은 다른 호출자와 공유됩니다. 수정하지 말고 필요하면 복사해서 사용하세요.
     
     Parameters:
     backup_folder (str): 백업 폴더 경로
@@ -151,13 +1893,21 @@ def get_backup_sets(backup_folder):
     Returns:
     dict: 백업 세트 정보 사전
     """
-    backup_sets_file = os.path.join(backup_folder, "backup_sets.json")
+    backup_sets = _read_cached_json(backup_folder, BACKUP_SETS_FILE)
+    return backup_sets if backup_sets is not None else {}
+
+def allocate_set_id(backup_folder):
+    """
+    백업 폴더에서 사용할 새 백업 세트 ID를 만듭니다.
+    카탈로그에 이미 있는 ID(다른 프로세스가 같은 시각에 만든 세트 등)와 겹치지 않습니다.
     
-    if not os.path.exists(backup_sets_file):
-        return {}
+    Parameters:
+    backup_folder (str): 백업 폴더 경로
     
-    with open(backup_sets_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    Returns:
+    str: 백업 세트 ID (YYMMDD_HHMMSS_ffffff)
+    """
+    return new_set_id(get_backup_sets(backup_folder))
 
 def get_backup_set_files(backup_folder, set_id):
     """
@@ -176,4 +1926,158 @@ def get_backup_set_files(backup_folder, set_id):
         return []
     
     backup_set = backup_sets[set_id]
-    return [os.path.join(backup_folder, file) for file in backup_set["files"]]
\ No newline at end of file
+    return [get_backup_file_path(backup_folder, file) for file in backup_set["files"]]
+
+def list_save_files(save_folder):
+    """
+    세이브 폴더 바로 아래에 있는 파일들의 전체 경로 목록을 반환합니다.
+    (GUI의 파일 목록과 동일하게 하위 폴더는 포함하지 않습니다)
+    """
+    return [
+        os.path.join(save_folder, file)
+        for file in sorted(os.listdir(save_folder))
+        if os.path.isfile(os.path.join(save_folder, file))
+    ]
+
+def backup_profile(profile_name, save_folder, description=None, file_paths=None, io_policy=None, tags=None,
+                   durability=DEFAULT_DURABILITY):
+    """
+    하나의 프로필에 대해 백업 세트를 생성합니다.
+    
+    Parameters:
+    profile_name (str): 프로필 이름
+    save_folder (str): 세이브 폴더 경로
+    description (str, optional): 백업 세트 설명
+    file_paths (list, optional): 백업할 파일 목록. 지정하지 않으면 세이브 폴더의 모든 파일
+    io_policy (IOPolicy, optional): 저부하 I/O 정책
+    tags (list, optional): 검색용 태그 목록
+    durability (str): 내구성 수준 (none / set / paranoid)
+    
+    Returns:
+    dict: 프로필별 백업 결과 (set_id, 성공/실패 파일 수, 오류 목록 등)
+    """
+    result = {
+        "profile": profile_name,
+        "set_id": None,
+        "backed_up": 0,
+        "bytes": 0,
+        "errors": [],
+    }
+    if not save_folder or not os.path.isdir(save_folder):
+        result["errors"].append(f"세이브 폴더 경로가 유효하지 않습니다: {save_folder}")
+        return result
+
+    backup_folder = get_backup_folder_path(profile_name)
+    if file_paths is None:
+        file_paths = list_save_files(save_folder)
+    if not file_paths:
+        result["errors"].append("백업할 파일이 없습니다.")
+        return result
+
+    timestamp = allocate_set_id(backup_folder)
+    backup_paths = []
+    source_paths = []
+    copied_files = {}
+    for file_path in file_paths:
+        try:
+            backup_path = backup_save_file(file_path, backup_folder, timestamp, io_policy, durability, copied_files)
+            backup_paths.append(backup_path)
+            source_paths.append(file_path)
+            result["bytes"] += os.path.getsize(file_path)
+        except Exception as e:
+            result["errors"].append(f"{os.path.basename(file_path)}: {e}")
+
+    if backup_paths:
+        save_backup_set(backup_folder, timestamp, backup_paths, description, tags,
+                        source_paths=source_paths, source_root=save_folder, durability=durability,
+                        copied_files=copied_files)
+        result["set_id"] = timestamp
+        result["backed_up"] = len(backup_paths)
+    return result
+
+def backup_profiles(profiles, description=None, per_device_limit=1, progress_callback=None, io_policies=None,
+                    durabilities=None):
+    """
+    여러 프로필을 한 번에 병렬로 백업합니다.
+    세이브 폴더와 백업 폴더가 위치한 장치(st_dev)별로 동시에 실행되는 백업 수를 제한하여,
+    읽거나 쓰는 HDD가 겹치는 프로필끼리는 순차적으로, 겹치지 않는 프로필은 동시에 진행합니다.
+    (세이브 폴더가 서로 다른 장치에 있어도 백업 폴더가 같은 장치에 있으면 동시에 실행하지 않음)
+    
+    Parameters:
+    profiles (dict): {프로필 이름: 세이브 폴더 경로}
+    description (str, optional): 모든 백업 세트에 사용할 설명
+    per_device_limit (int): 장치 하나당 동시에 실행할 최대 백업 수
+    progress_callback (callable, optional): 프로필 하나가 끝날 때마다 (완료 수, 전체 수, 결과)로 호출
+    io_policies (dict, optional): {프로필 이름: IOPolicy} 프로필별 저부하 I/O 정책
+    durabilities (dict, optional): {프로필 이름: 내구성 수준} 없으면 기본값(set)
+    
+    Returns:
+    dict: 통합 요약 정보 (프로필별 결과, 전체 파일 수, 오류 수, 소요 시간)
+    """
+    start_time = time.time()
+    results = []
+
+    # 세이브 폴더(읽기)와 백업 폴더(쓰기)가 있는 장치별로 세마포어 생성
+    device_locks = {}
+    jobs = []
+    for profile_name, save_folder in profiles.items():
+        try:
+            devices = {os.stat(save_folder).st_dev, os.stat(get_backup_folder_path(profile_name)).st_dev}
+        except OSError as e:
+            results.append({
+                "profile": profile_name,
+                "set_id": None,
+                "backed_up": 0,
+                "bytes": 0,
+                "errors": [f"세이브 폴더 또는 백업 폴더에 접근할 수 없습니다: {e}"],
+            })
+            continue
+        for device in devices:
+            if device not in device_locks:
+                device_locks[device] = threading.Semaphore(max(1, per_device_limit))
+        # 여러 장치의 세마포어를 잡을 때 교착 상태가 생기지 않도록 항상 같은 순서로 잡음
+        jobs.append((profile_name, save_folder, [device_locks[device] for device in sorted(devices)]))
+
+    total = len(profiles)
+    done_lock = threading.Lock()
+    done = [len(results)]
+
+    def run_job(profile_name, save_folder, job_device_locks):
+        with ExitStack() as stack:
+            for device_lock in job_device_locks:
+                stack.enter_context(device_lock)
+            try:
+                result = backup_profile(profile_name, save_folder, description,
+                                        io_policy=(io_policies or {}).get(profile_name),
+                                        durability=(durabilities or {}).get(profile_name, DEFAULT_DURABILITY))
+            except Exception as e:
+                result = {
+                    "profile": profile_name,
+                    "set_id": None,
+                    "backed_up": 0,
+                    "bytes": 0,
+                    "errors": [str(e)],
+                }
+        with done_lock:
+            done[0] += 1
+            completed = done[0]
+        if progress_callback:
+            progress_callback(completed, total, result)
+        return result
+
+    if jobs:
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = [executor.submit(run_job, *job) for job in jobs]
+            results.extend(future.result() for future in futures)
+
+    results.sort(key=lambda r: r["profile"])
+    return {
+        "results": results,
+        "profiles": total,
+        "succeeded": sum(1 for r in results if r["set_id"]),
+        "files": sum(r["backed_up"] for r in results),
+        "bytes": sum(r["bytes"] for r in results),
+        "errors": sum(len(r["errors"]) for r in results),
+        "devices": len(device_locks),
+        "elapsed": time.time() - start_time,
+    }
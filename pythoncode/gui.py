@@ -1,18 +1,31 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk, simpledialog # simpledialog 추가
 import os
-import json
-from datetime import datetime
 import re
 import threading
 import time
 
 from file_manager import (
-    backup_save_file, restore_save_file, get_original_filename,
-    save_backup_set, get_backup_sets, get_backup_set_files,
-    get_backup_folder_path
+    backup_save_file,
+    save_backup_set, get_backup_sets, delete_backup_set_files,
+    get_backup_folder_path, backup_profiles, delete_backup_set_records,
+    get_file_index, get_file_versions, restore_file_version,
+    get_set_original_paths, migrate_backup_sets, restore_backup_files,
+    compare_backup_set, resolve_ambiguous, mark_damaged_sets, get_storage_summary, allocate_set_id,
+    backup_file_exists, get_backup_file_path, resolve_durability, rebuild_backup_sets, migrate_backup_layout,
+    DURABILITY_NONE, DURABILITY_SET, DURABILITY_PARANOID
 )
-from utils import get_timestamp
+from utils import parse_set_id, format_size
+from config_store import ConfigStore
+from search_index import BackupSetIndex
+from scrubber import scrub_backup_folder
+from replication import MirrorManager
+from cold_storage import compress_old_sets
+from profile_cache import ProfileState, ProfileStateCache
+from io_policy import IOPolicy, resolve_io_policy, IO_MODE_NORMAL, IO_MODE_LOW, IO_MODE_AUTO
+from daemon import DaemonClient
+from bundle import export_backup_sets, import_bundle, BUNDLE_EXTENSION
+from diagnostics import configure_diagnostics, profiled
 
 CONFIG_FILE = "save_manager_config.json"
 
@@ -40,6 +53,8 @@ class SaveManagerGUI:
         self.save_files = []
         self.backup_folder = ""
         self.backup_sets = {}
+        self.search_index = None # 백업 세트 검색 인덱스
+        self._search_job = None # 검색 디바운스용 after ID
         self.config_data = {"active_profile": None, "profiles": {}} # 설정 데이터 전체 저장
         self.active_profile_name = None # 현재 활성화된 프로필 이름
         
@@ -49,37 +64,86 @@ class SaveManagerGUI:
         self.last_refresh_time = 0
         self.refresh_interval = 20  # 20초마다 새로고침
 
+        # 무결성 검사 관련 변수
+        self.scrub_thread = None
+        self.scrub_stop_event = None
+
+        # 카탈로그 복구 작업 스레드
+        self.rebuild_thread = None
+        self.bundle_thread = None
+        # 백업/복원 작업 스레드 (한 번에 하나)
+        self.transfer_thread = None
+
+        # 오래된 세트 압축(콜드 보관) 작업 관련 변수
+        self.cold_storage_lock = threading.Lock()
+        self.background_stop_event = threading.Event()
+
+        # 카탈로그/폴더 구조 변환 작업 (백업 폴더마다 실행 중 한 번만)
+        self.migration_thread = None
+        self.migrated_folders = set()
+
+        # 프로필별 화면 상태 캐시 (최근 사용한 프로필은 다시 읽거나 다시 그리지 않고 바로 전환)
+        self.profile_states = ProfileStateCache(on_evict=self._discard_profile_view)
+
+        # 보조 백업 폴더(미러) 복제 관리자
+        self.mirror_manager = MirrorManager()
+
+        # 백그라운드 서비스(daemon.py)가 실행 중이면 연결하여 백업/복원과 미러 복제를 맡김
+        self.daemon = DaemonClient.attach()
+
+        # 설정 파일 저장소 (디바운스 + 원자적 기록)
+        self.config_store = ConfigStore(
+            CONFIG_FILE,
+            on_error=lambda e: self.root.after(0, lambda: messagebox.showwarning("저장 오류", f"설정 저장 중 오류 발생:\n{e}"))
+        )
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
         self.setup_ui()
+        # 프로필이 선택되지 않았을 때 표시하는 빈 화면 상태
+        self._empty_view = ProfileState(None, "")
+        self._empty_view.sets_tree = self.sets_tree
+        self._empty_view.checkbox_frame = self.checkbox_frame
+        self._empty_view.checkbox_vars = self.checkbox_vars
+        self._view = self._empty_view # 현재 표시 중인 프로필 상태
         self._load_config() # UI 로드 후 설정 파일 로드
 
+    def _on_close(self):
+        """창을 닫기 전에 예약된 설정 저장을 마칩니다."""
+        self.stop_auto_refresh()
+        self.background_stop_event.set()
+        self.mirror_manager.stop_all()
+        self.profile_states.close()
+        if self.daemon is not None:
+            self.daemon.close()
+        self.config_store.flush()
+        self.root.destroy()
+
     def _load_config(self):
         """설정 파일에서 프로필 정보를 로드합니다."""
-        try:
-            if os.path.exists(CONFIG_FILE):
-                with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                    loaded_data = json.load(f)
-                    # 기본 구조 유효성 검사
-                    if isinstance(loaded_data, dict) and "profiles" in loaded_data:
-                         self.config_data = loaded_data
-                    else:
-                         print(f"경고: '{CONFIG_FILE}' 파일 구조가 예상과 다릅니다. 기본값으로 시작합니다.")
-                         self.config_data = {"active_profile": None, "profiles": {}} # 기본 구조로 리셋
-            else:
-                 # 파일 없으면 기본 구조 사용
-                 self.config_data = {"active_profile": None, "profiles": {}}
-
-        except json.JSONDecodeError:
-            messagebox.showerror("설정 오류", f"'{CONFIG_FILE}' 파일 형식이 잘못되었습니다. 파일을 확인하거나 삭제 후 다시 시작해주세요.")
-            # 오류 시 기본값으로 계속 진행하거나, 프로그램 종료를 고려할 수 있음
-            self.config_data = {"active_profile": None, "profiles": {}}
-        except Exception as e:
-            print(f"설정 로드 중 오류 발생: {e}")
+        loaded_data, source = self.config_store.load()
+        if loaded_data is not None:
+            self.config_data = loaded_data
+            if source == "backup":
+                print(f"경고: '{CONFIG_FILE}' 파일이 손상되어 마지막 정상 사본에서 설정을 불러왔습니다.")
+                messagebox.showwarning("설정 복구", f"'{CONFIG_FILE}' 파일이 손상되어 마지막으로 정상 저장된 설정을 불러왔습니다.")
+                self._save_config() # 복구된 설정으로 원본 파일 재작성
+        else:
+            if self.config_store.exists():
+                messagebox.showerror("설정 오류", f"'{CONFIG_FILE}' 파일 형식이 잘못되었습니다. 파일을 확인하거나 삭제 후 다시 시작해주세요.")
+            # 파일이 없거나 읽을 수 없으면 기본 구조 사용
             self.config_data = {"active_profile": None, "profiles": {}}
 
+        # 진단 모드 (설정 파일의 diagnostics 항목 또는 환경 변수로 켬)
+        configure_diagnostics(self.config_data.get("diagnostics"))
+
         # 콤보박스 업데이트
         profile_names = list(self.config_data.get("profiles", {}).keys())
         self.profile_combobox['values'] = profile_names
 
+        # 미러가 설정된 프로필은 복제 시작 (남아 있는 큐도 이어서 처리)
+        for profile_name, profile_data in self.config_data.get("profiles", {}).items():
+            self._configure_mirrors(profile_name, profile_data)
+
         # 마지막 활성 프로필 선택 시도
         last_active = self.config_data.get("active_profile")
         if last_active and last_active in profile_names:
@@ -104,12 +168,8 @@ class SaveManagerGUI:
         else:
              self.config_data["active_profile"] = None
 
-        try:
-            with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.config_data, f, ensure_ascii=False, indent=4)
-        except Exception as e:
-            print(f"설정 저장 중 오류 발생: {e}")
-            messagebox.showwarning("저장 오류", f"설정 저장 중 오류 발생:\n{e}")
+        # 실제 기록은 백그라운드에서 모아서 수행됨
+        self.config_store.save(self.config_data)
 
     def _apply_profile(self, profile_name):
         """선택된 프로필의 경로를 로드하고 UI에 적용합니다."""
@@ -117,8 +177,15 @@ class SaveManagerGUI:
         if profile_data:
             loaded_save_folder = profile_data.get("save_folder", "")
             
-            # 백업 폴더는 자동으로 생성
-            self.backup_folder = get_backup_folder_path(profile_name)
+            # 최근에 사용한 프로필이면 보관된 상태(경로, 트리뷰, 파일 목록)를 그대로 사용
+            state = self.profile_states.get(profile_name)
+            if state is None:
+                # 백업 폴더는 자동으로 생성
+                state = self.profile_states.put(ProfileState(profile_name, get_backup_folder_path(profile_name)))
+            elif not os.path.isdir(state.backup_folder):
+                state.backup_folder = get_backup_folder_path(profile_name)
+            self.backup_folder = state.backup_folder
+            self._show_profile_view(state)
             
             valid_save = os.path.isdir(loaded_save_folder)
 
@@ -137,21 +204,111 @@ class SaveManagerGUI:
             self.load_backup_sets()
 
             self.active_profile_name = profile_name
+            # 이전 형식의 백업 세트에 매니페스트를 백그라운드에서 채움
+            self._start_catalog_migration()
             print(f"프로필 '{profile_name}' 로드 완료.")
 
         else:
             print(f"오류: 프로필 '{profile_name}' 데이터를 찾을 수 없습니다.")
             self._clear_paths_and_ui()
 
+    def _start_catalog_migration(self):
+        """
+        현재 프로필의 카탈로그와 백업 폴더 구조를 최신 형식으로 변환하는 작업을 백그라운드에서 시작합니다.
+        변환이 끝나면 설정된 경우 오래된 세트를 콜드 보관으로 옮깁니다.
+        프로필을 바꿀 때마다 백업 폴더 전체를 다시 읽지 않도록 백업 폴더마다 한 번만 실행하며,
+        이전 변환 작업이 아직 실행 중이면 시작하지 않습니다. (다음에 프로필을 선택할 때 다시 시도)
+        """
+        backup_folder = self.backup_folder
+        folder_key = os.path.normcase(os.path.abspath(backup_folder))
+        if folder_key in self.migrated_folders:
+            return
+        if self.migration_thread is not None and self.migration_thread.is_alive():
+            return
+        profile_data = self.config_data.get("profiles", {}).get(self.active_profile_name, {})
+
+        def worker():
+            try:
+                migrated = migrate_backup_sets(backup_folder)
+            except Exception as e:
+                print(f"백업 세트 형식 변환 중 오류: {e}")
+                return
+            if migrated:
+                print(f"{migrated}개의 백업 세트에 파일 정보를 추가했습니다.")
+                # 같은 프로필을 보고 있을 때만 목록 갱신
+                self.root.after(0, lambda: self.backup_folder == backup_folder and self.load_backup_sets())
+            # 백업 폴더 바로 아래에 쌓인 이전 형식의 백업 파일을 세트 폴더로 옮김
+            try:
+                layout = migrate_backup_layout(backup_folder, self.background_stop_event)
+            except Exception as e:
+                print(f"백업 폴더 구조 변환 중 오류: {e}")
+            else:
+                if layout["files"]:
+                    print(f"{layout['sets']}개 백업 세트의 파일 {layout['files']}개를 세트 폴더로 옮겼습니다.")
+            self._run_cold_storage(backup_folder, profile_data)
+            if not self.background_stop_event.is_set():
+                self.migrated_folders.add(folder_key)
+
+        self.migration_thread = threading.Thread(target=worker, daemon=True)
+        self.migration_thread.start()
+
+    def _run_cold_storage(self, backup_folder, profile_data):
+        """
+        프로필의 cold_after_days보다 오래된 세트를 압축 보관합니다. (백그라운드 스레드에서 호출)
+        이미 다른 압축 작업이 실행 중이면 아무것도 하지 않습니다.
+        """
+        cold_after_days = profile_data.get("cold_after_days", 0)
+        if not cold_after_days or not os.path.isdir(backup_folder):
+            return
+        if not self.cold_storage_lock.acquire(blocking=False):
+            return
+        try:
+            # 게임 실행 중이면 저부하 정책, 아니어도 낮은 우선순위로 실행
+            io_policy = resolve_io_policy(profile_data) or IOPolicy(low_priority=True)
+            summary = compress_old_sets(backup_folder, cold_after_days, io_policy, self.background_stop_event)
+        except Exception as e:
+            print(f"콜드 보관 중 오류: {e}")
+            return
+        finally:
+            self.cold_storage_lock.release()
+        if summary["files"]:
+            print(f"{summary['sets']}개의 오래된 백업 세트를 압축했습니다: "
+                  f"{format_size(summary['before'])} -> {format_size(summary['after'])}")
+
+    def _show_profile_view(self, state):
+        """프로필 전용 트리뷰와 체크박스 목록으로 화면을 전환합니다. (처음이면 새로 만듦)"""
+        if state.sets_tree is None:
+            state.sets_tree = self._create_sets_tree()
+        if state.checkbox_frame is None:
+            state.checkbox_frame = self._create_checkbox_frame()
+        self._attach_sets_tree(state.sets_tree)
+        self._attach_checkbox_frame(state.checkbox_frame, state.checkbox_vars)
+        self.search_index = state.search_index
+        self._view = state
+
+    def _discard_profile_view(self, state):
+        """캐시에서 밀려난 프로필의 위젯을 정리합니다."""
+        if state is self._view:
+            return
+        for widget in (state.sets_tree, state.checkbox_frame):
+            if widget is not None:
+                widget.destroy()
+        state.sets_tree = None
+        state.checkbox_frame = None
+
     def _clear_paths_and_ui(self):
         """경로 변수와 관련 UI를 초기화합니다."""
         # 자동 새로고침 중지
         self.stop_auto_refresh()
+        self._show_profile_view(self._empty_view)
+        self._empty_view.rendered_files = None
+        self._empty_view.invalidate_view()
         
         self.save_folder = ""
         self.backup_folder = ""
         self.save_files = []
         self.backup_sets = {}
+        self.search_index = None
         self.active_profile_name = None
 
         self.folder_entry.delete(0, tk.END)
@@ -173,8 +330,8 @@ class SaveManagerGUI:
             self._apply_profile(selected_profile)
             # 활성 프로필 변경 시 바로 저장
             self._save_config()
-            # 파일 목록 새로고침
-            self._refresh_file_list()
+            # 파일 목록 새로고침 (폴더가 바뀌지 않았으면 캐시된 목록 사용)
+            self._refresh_file_list(force=False)
 
     def _create_new_profile(self):
         """새 프로필 생성 대화상자를 띄우고 프로필을 추가합니다."""
@@ -220,6 +377,7 @@ class SaveManagerGUI:
             profiles = self.config_data.get("profiles", {})
             if profile_to_delete in profiles:
                 del profiles[profile_to_delete] # 프로필 제거
+                self.mirror_manager.configure(get_backup_folder_path(profile_to_delete), [])
                 self.config_data["profiles"] = profiles
 
                 # 활성 프로필이 삭제된 경우
@@ -231,6 +389,7 @@ class SaveManagerGUI:
                 profile_names = list(profiles.keys())
                 self.profile_combobox['values'] = profile_names
                 self._clear_paths_and_ui() # UI 및 경로 초기화
+                self.profile_states.discard(profile_to_delete)
 
                 # 변경사항 저장
                 self._save_config()
@@ -246,6 +405,108 @@ class SaveManagerGUI:
                      self.config_data["active_profile"] = first_profile
                      self._save_config()
 
+    def _open_batch_backup_dialog(self):
+        """여러 프로필을 한 번에 백업할 수 있는 대화상자를 띄웁니다."""
+        profiles = self.config_data.get("profiles", {})
+        if not profiles:
+            messagebox.showinfo("알림", "백업할 프로필이 없습니다.")
+            return
+
+        dialog = tk.Toplevel(self.root)
+        dialog.title("전체 백업")
+        dialog.transient(self.root)
+        dialog.configure(bg=self.bg_color)
+
+        frame = ttk.Frame(dialog, padding=10)
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        ttk.Label(frame, text="백업할 프로필 선택:").pack(anchor=tk.W)
+
+        profile_vars = {}
+        for profile_name, profile_data in profiles.items():
+            save_folder = profile_data.get("save_folder", "")
+            var = tk.BooleanVar(value=bool(save_folder))
+            profile_vars[profile_name] = var
+            checkbox = ttk.Checkbutton(frame, text=f"{profile_name}  ({save_folder or '세이브 폴더 없음'})", variable=var)
+            checkbox.pack(anchor=tk.W, padx=5, pady=2)
+            if not save_folder:
+                checkbox.state(['disabled'])
+
+        desc_frame = ttk.Frame(frame)
+        desc_frame.pack(fill=tk.X, pady=(10, 0))
+        ttk.Label(desc_frame, text="백업 설명:").pack(side=tk.LEFT, padx=(0, 5))
+        desc_entry = ttk.Entry(desc_frame)
+        desc_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+
+        def start_batch():
+            selected = {
+                name: profiles[name].get("save_folder", "")
+                for name, var in profile_vars.items() if var.get()
+            }
+            if not selected:
+                messagebox.showwarning("선택 필요", "백업할 프로필을 선택해주세요.", parent=dialog)
+                return
+            description = desc_entry.get().strip() or None
+            dialog.destroy()
+            self._run_batch_backup(selected, description)
+
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(pady=(10, 0))
+        ttk.Button(button_frame, text="백업 시작", command=start_batch).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="취소", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+
+    def _run_batch_backup(self, selected_profiles, description):
+        """선택된 프로필들을 백그라운드 스레드에서 백업합니다."""
+        self.progress_bar["value"] = 0
+        self.status_label.config(text=f"전체 백업 진행 중... (0/{len(selected_profiles)})")
+
+        def on_progress(completed, total, result):
+            self.root.after(0, self.update_progress, completed, total)
+
+        # 게임 실행 여부는 시작 시점에 한 번만 확인
+        profiles = self.config_data.get("profiles", {})
+        io_policies = {name: resolve_io_policy(profiles.get(name)) for name in selected_profiles}
+        durabilities = {name: resolve_durability(profiles.get(name)) for name in selected_profiles}
+
+        def worker():
+            try:
+                summary = backup_profiles(selected_profiles, description, progress_callback=on_progress,
+                                          io_policies=io_policies, durabilities=durabilities)
+            except Exception as e:
+                self.root.after(0, lambda: messagebox.showerror("오류", f"전체 백업 중 오류 발생:\n{e}"))
+                return
+            self.root.after(0, self._show_batch_summary, summary)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _show_batch_summary(self, summary):
+        """전체 백업 결과를 하나의 요약으로 표시합니다."""
+        # 현재 프로필도 백업되었을 수 있으므로 목록 갱신
+        self.load_backup_sets()
+
+        lines = []
+        for result in summary["results"]:
+            if result["set_id"]:
+                line = f"- {result['profile']}: {result['backed_up']}개 파일 ({result['bytes'] / (1024 * 1024):.1f} MB)"
+            else:
+                line = f"- {result['profile']}: 실패"
+            if result["errors"]:
+                line += f", 오류 {len(result['errors'])}건"
+                print(f"전체 백업 오류 ({result['profile']}):", result["errors"])
+            lines.append(line)
+
+        message = (
+            f"{summary['succeeded']}/{summary['profiles']}개 프로필 백업 완료 "
+            f"(파일 {summary['files']}개, {summary['elapsed']:.1f}초, 장치 {summary['devices']}개)\n\n"
+            + "\n".join(lines)
+        )
+        if summary["errors"]:
+            self.status_label.config(text="전체 백업 완료 (일부 오류)")
+            messagebox.showwarning("전체 백업 완료 (일부 오류)", message + "\n\n자세한 내용은 콘솔 로그를 확인하세요.", parent=self.root)
+        else:
+            self.status_label.config(text="전체 백업 완료")
+            messagebox.showinfo("전체 백업 완료", message, parent=self.root)
+
     def setup_ui(self):
         # 메인 컨테이너 (스크롤 가능한 영역)
         container = ttk.Frame(self.root)
@@ -318,6 +579,7 @@ class SaveManagerGUI:
         # 프로필 관리 버튼
         ttk.Button(profile_manage_frame, text="새 프로필", command=self._create_new_profile).pack(side=tk.LEFT, padx=5)
         ttk.Button(profile_manage_frame, text="프로필 삭제", command=self._delete_profile).pack(side=tk.LEFT, padx=5)
+        ttk.Button(profile_manage_frame, text="전체 백업", command=self._open_batch_backup_dialog).pack(side=tk.LEFT, padx=5)
 
         # --- 세이브 폴더 선택 프레임 ---
         folder_frame = ttk.LabelFrame(main_frame, text="세이브 폴더", padding=10)
@@ -383,9 +645,10 @@ class SaveManagerGUI:
         # 체크박스와 파일명을 담을 캔버스와 스크롤바
         canvas = tk.Canvas(files_frame, height=150)
         scrollbar = ttk.Scrollbar(files_frame, orient="vertical", command=canvas.yview)
+        self.files_canvas = canvas
         
-        # 체크박스들을 담을 프레임
-        self.checkbox_frame = ttk.Frame(canvas)
+        # 체크박스들을 담을 프레임 (프로필마다 따로 만들어 전환 시 재사용)
+        self.checkbox_frame = self._create_checkbox_frame()
         
         # 캔버스 설정
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -396,11 +659,7 @@ class SaveManagerGUI:
         
         # 체크박스 프레임을 캔버스에 추가
         canvas_frame = canvas.create_window((0, 0), window=self.checkbox_frame, anchor="nw")
-        
-        # 체크박스 프레임 크기 변경 시 스크롤 영역 업데이트
-        def configure_scroll_region(event):
-            canvas.configure(scrollregion=canvas.bbox("all"))
-        self.checkbox_frame.bind("<Configure>", configure_scroll_region)
+        self.files_canvas_window = canvas_frame
         
         # 캔버스 크기 변경 시 내부 프레임 크기 조정
         def configure_canvas(event):
@@ -414,12 +673,6 @@ class SaveManagerGUI:
                 canvas.yview_scroll(int(-1*(event.delta/120)), "units")
                 return "break"  # 이벤트 전파 중지
         canvas.bind("<MouseWheel>", _on_mousewheel)
-        
-        # 체크박스 프레임에도 마우스 휠 이벤트 바인딩
-        def _on_checkbox_frame_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-            return "break"  # 이벤트 전파 중지
-        self.checkbox_frame.bind("<MouseWheel>", _on_checkbox_frame_mousewheel)
 
         # 체크박스 변수들을 저장할 딕셔너리
         self.checkbox_vars = {}
@@ -431,6 +684,10 @@ class SaveManagerGUI:
         ttk.Label(desc_frame, text="백업 설명:").pack(side=tk.LEFT, padx=(0, 5))
         self.desc_entry = ttk.Entry(desc_frame)
         self.desc_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+
+        ttk.Label(desc_frame, text="태그:").pack(side=tk.LEFT, padx=(5, 5))
+        self.tags_entry = ttk.Entry(desc_frame, width=12)
+        self.tags_entry.pack(side=tk.LEFT)
         
         # 수동 새로고침 버튼
         refresh_btn = ttk.Button(desc_frame, text="새로고침", command=self._refresh_file_list, width=8)
@@ -440,42 +697,90 @@ class SaveManagerGUI:
         self.button_frame = ttk.Frame(parent)
         self.button_frame.pack(side=tk.BOTTOM, pady=5)
 
+    def _create_checkbox_frame(self):
+        """백업할 파일 체크박스를 담을 프레임을 만듭니다. (표시는 _attach_checkbox_frame)"""
+        canvas = self.files_canvas
+        frame = ttk.Frame(canvas)
+        
+        # 체크박스 프레임 크기 변경 시 스크롤 영역 업데이트
+        def configure_scroll_region(event):
+            canvas.configure(scrollregion=canvas.bbox("all"))
+        frame.bind("<Configure>", configure_scroll_region)
+        
+        # 체크박스 프레임에도 마우스 휠 이벤트 바인딩
+        def _on_checkbox_frame_mousewheel(event):
+            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+            return "break"  # 이벤트 전파 중지
+        frame.bind("<MouseWheel>", _on_checkbox_frame_mousewheel)
+        return frame
+
+    def _attach_checkbox_frame(self, frame, checkbox_vars):
+        """체크박스 프레임을 캔버스에 표시합니다."""
+        if self.checkbox_frame is not frame:
+            self.files_canvas.itemconfigure(self.files_canvas_window, window=frame)
+            self.files_canvas.yview_moveto(0)
+            # 크기가 같으면 <Configure>가 발생하지 않으므로 스크롤 영역을 직접 갱신
+            self.root.after_idle(lambda: self.files_canvas.configure(scrollregion=self.files_canvas.bbox("all")))
+        self.checkbox_frame = frame
+        self.checkbox_vars = checkbox_vars
+
     def setup_restore_area(self, parent):
+        # 백업 세트 검색 프레임
+        search_frame = ttk.LabelFrame(parent, text="백업 세트 검색", padding=10)
+        search_frame.pack(fill=tk.X, pady=5)
+
+        query_frame = ttk.Frame(search_frame)
+        query_frame.pack(fill=tk.X)
+        ttk.Label(query_frame, text="검색어:").pack(side=tk.LEFT, padx=(0, 5))
+        self.search_entry = ttk.Entry(query_frame)
+        self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        ttk.Button(query_frame, text="초기화", command=self._clear_search, width=8).pack(side=tk.LEFT, padx=(5, 0))
+
+        filter_frame = ttk.Frame(search_frame)
+        filter_frame.pack(fill=tk.X, pady=(5, 0))
+        ttk.Label(filter_frame, text="기간:").pack(side=tk.LEFT, padx=(0, 5))
+        self.date_from_entry = ttk.Entry(filter_frame, width=11)
+        self.date_from_entry.pack(side=tk.LEFT)
+        ttk.Label(filter_frame, text="~").pack(side=tk.LEFT, padx=2)
+        self.date_to_entry = ttk.Entry(filter_frame, width=11)
+        self.date_to_entry.pack(side=tk.LEFT)
+        ttk.Label(filter_frame, text="파일명:").pack(side=tk.LEFT, padx=(10, 5))
+        self.file_filter_entry = ttk.Entry(filter_frame, width=14)
+        self.file_filter_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+
+        # 입력할 때마다 결과 갱신
+        for entry in (self.search_entry, self.date_from_entry, self.date_to_entry, self.file_filter_entry):
+            entry.bind("<KeyRelease>", self._schedule_search)
+
         # 백업 세트 선택 프레임
         sets_frame = ttk.LabelFrame(parent, text="복원할 백업 세트 선택", padding=10)
         sets_frame.pack(fill=tk.BOTH, expand=True, pady=5)
 
-        # 백업 세트 목록을 보여줄 트리뷰
-        self.sets_tree = ttk.Treeview(sets_frame, columns=("date", "description", "files"), show="headings", height=6)
-        self.sets_tree.heading("date", text="날짜")
-        self.sets_tree.heading("description", text="설명")
-        self.sets_tree.heading("files", text="파일 수")
-
-        # 열 너비 설정
-        self.sets_tree.column("date", width=120, anchor=tk.W)
-        self.sets_tree.column("description", width=200, anchor=tk.W)
-        self.sets_tree.column("files", width=60, anchor=tk.CENTER)
-
-        self.sets_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.sets_frame = sets_frame
 
         # 스크롤바 추가
-        sets_scrollbar = ttk.Scrollbar(sets_frame, orient="vertical", command=self.sets_tree.yview)
-        sets_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.sets_tree.config(yscrollcommand=sets_scrollbar.set)
+        self.sets_scrollbar = ttk.Scrollbar(sets_frame, orient="vertical")
+        self.sets_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        # 마우스 휠 스크롤 지원 - 트리뷰에만 적용
-        def _on_tree_mousewheel(event):
-            # 마우스가 트리뷰 위에 있을 때만 스크롤
-            if str(event.widget).startswith(str(self.sets_tree)):
-                self.sets_tree.yview_scroll(int(-1*(event.delta/120)), "units")
-                return "break"  # 이벤트 전파 중지
-        self.sets_tree.bind("<MouseWheel>", _on_tree_mousewheel)
+        # 백업 세트 목록을 보여줄 트리뷰 (프로필마다 따로 만들어 전환 시 재사용)
+        self.sets_tree = None
+        self._attach_sets_tree(self._create_sets_tree())
 
         # 백업 세트 상세 정보 프레임
         details_frame = ttk.LabelFrame(parent, text="선택한 백업 세트의 파일 목록", padding=10)
         details_frame.pack(fill=tk.BOTH, expand=True, pady=5)
 
-        self.details_listbox = tk.Listbox(details_frame, height=4)
+        # 선택 복원 버튼 (상세 목록에서 여러 파일을 골라 복원)
+        details_button_frame = ttk.Frame(details_frame)
+        details_button_frame.pack(side=tk.BOTTOM, fill=tk.X, pady=(5, 0))
+        restore_selected_btn = ttk.Button(
+            details_button_frame, text="선택한 파일만 복원",
+            command=lambda: self.restore_backup_set(selected_only=True)
+        )
+        restore_selected_btn.pack(side=tk.RIGHT)
+
+        # Ctrl/Shift로 여러 파일 선택 가능 (다른 위젯을 클릭해도 선택 유지)
+        self.details_listbox = tk.Listbox(details_frame, height=4, selectmode=tk.EXTENDED, exportselection=False)
         self.details_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
         # 스크롤바 추가
@@ -491,9 +796,6 @@ class SaveManagerGUI:
                 return "break"  # 이벤트 전파 중지
         self.details_listbox.bind("<MouseWheel>", _on_listbox_mousewheel)
 
-        # 이벤트 연결
-        self.sets_tree.bind("<<TreeviewSelect>>", self.on_backup_set_selected)
-
         # 버튼 프레임 생성
         button_frame = ttk.Frame(parent)
         button_frame.pack(side=tk.BOTTOM, pady=5, fill=tk.X)
@@ -514,6 +816,84 @@ class SaveManagerGUI:
         delete_btn = ttk.Button(center_frame, text="삭제하기", command=self.delete_backup_set, width=15)
         delete_btn.pack(side=tk.LEFT, padx=5)
 
+        # 파일 기록 버튼
+        history_btn = ttk.Button(center_frame, text="파일 기록", command=self._open_file_history, width=10)
+        history_btn.pack(side=tk.LEFT, padx=5)
+
+        # 비교 버튼
+        compare_btn = ttk.Button(center_frame, text="비교", command=self._open_compare_dialog, width=8)
+        compare_btn.pack(side=tk.LEFT, padx=5)
+
+        # 도구 버튼 프레임
+        tools_frame = ttk.Frame(parent)
+        tools_frame.pack(side=tk.BOTTOM, pady=(0, 5), fill=tk.X)
+        self.tools_center_frame = ttk.Frame(tools_frame)
+        self.tools_center_frame.pack(expand=True)
+
+        # 무결성 검사 버튼
+        self.scrub_btn = ttk.Button(self.tools_center_frame, text="무결성 검사", command=self._toggle_scrub, width=12)
+        self.scrub_btn.pack(side=tk.LEFT, padx=5)
+
+        # 미러 설정 버튼
+        mirror_btn = ttk.Button(self.tools_center_frame, text="미러 설정", command=self._open_mirror_dialog, width=10)
+        mirror_btn.pack(side=tk.LEFT, padx=5)
+
+        # 저장 공간 대시보드 버튼
+        storage_btn = ttk.Button(self.tools_center_frame, text="저장 공간", command=self._open_storage_dashboard, width=10)
+        storage_btn.pack(side=tk.LEFT, padx=5)
+
+        # I/O 설정 버튼
+        io_btn = ttk.Button(self.tools_center_frame, text="I/O 설정", command=self._open_io_settings_dialog, width=10)
+        io_btn.pack(side=tk.LEFT, padx=5)
+
+        # 카탈로그 복구 버튼
+        self.rebuild_btn = ttk.Button(self.tools_center_frame, text="카탈로그 복구", command=self._rebuild_catalog, width=12)
+        self.rebuild_btn.pack(side=tk.LEFT, padx=5)
+
+        # 번들 내보내기/가져오기 버튼 (다른 컴퓨터로 백업 세트 옮기기)
+        self.export_btn = ttk.Button(self.tools_center_frame, text="내보내기", command=self._export_bundle, width=10)
+        self.export_btn.pack(side=tk.LEFT, padx=5)
+        self.import_btn = ttk.Button(self.tools_center_frame, text="가져오기", command=self._import_bundle, width=10)
+        self.import_btn.pack(side=tk.LEFT, padx=5)
+
+    def _create_sets_tree(self):
+        """백업 세트 목록 트리뷰를 만듭니다. (표시는 _attach_sets_tree)"""
+        tree = ttk.Treeview(self.sets_frame, columns=("date", "description", "files"), show="headings", height=6)
+        tree.heading("date", text="날짜")
+        tree.heading("description", text="설명")
+        tree.heading("files", text="파일 수")
+
+        # 열 너비 설정
+        tree.column("date", width=120, anchor=tk.W)
+        tree.column("description", width=200, anchor=tk.W)
+        tree.column("files", width=60, anchor=tk.CENTER)
+
+        # 손상된 세트는 빨간색으로 표시
+        tree.tag_configure("damaged", foreground="#d93025")
+
+        # 마우스 휠 스크롤 지원 - 트리뷰에만 적용
+        def _on_tree_mousewheel(event):
+            # 마우스가 트리뷰 위에 있을 때만 스크롤
+            if str(event.widget).startswith(str(tree)):
+                tree.yview_scroll(int(-1*(event.delta/120)), "units")
+                return "break"  # 이벤트 전파 중지
+        tree.bind("<MouseWheel>", _on_tree_mousewheel)
+
+        # 이벤트 연결
+        tree.bind("<<TreeviewSelect>>", self.on_backup_set_selected)
+        return tree
+
+    def _attach_sets_tree(self, tree):
+        """트리뷰를 화면에 표시하고 스크롤바를 연결합니다. 이전 트리뷰는 숨깁니다."""
+        if self.sets_tree is tree:
+            return
+        if self.sets_tree is not None:
+            self.sets_tree.pack_forget()
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.sets_scrollbar.config(command=tree.yview)
+        tree.config(yscrollcommand=self.sets_scrollbar.set)
+        self.sets_tree = tree
+
     def select_save_files(self):
         """사용자가 여러 개의 세이브 파일을 선택"""
         if not self.save_folder:
@@ -554,8 +934,22 @@ class SaveManagerGUI:
                      self.file_listbox.insert(tk.END, os.path.basename(file))
 
 
+    @profiled("gui.load_backup_sets")
     def load_backup_sets(self):
         """백업 폴더에서 백업 세트 정보 로드"""
+        view = self._view
+        if self.backup_folder and os.path.isdir(self.backup_folder):
+            try:
+                backup_sets = get_backup_sets(self.backup_folder)
+            except Exception:
+                backup_sets = None # 아래에서 다시 읽으며 오류 표시
+            # 카탈로그와 검색 조건이 그대로면 프로필 전용 트리뷰를 다시 그리지 않음
+            if backup_sets is not None and view.tree_catalog is backup_sets and view.tree_filters == self._search_filters():
+                self.backup_sets = backup_sets
+                self.on_backup_set_selected(None) # 선택된 세트의 상세 정보 다시 표시
+                self.status_label.config(text=f"{len(self.sets_tree.get_children())}개의 백업 세트 로드됨")
+                return
+
         # 트리뷰 초기화 (먼저 수행)
         for item in self.sets_tree.get_children():
             self.sets_tree.delete(item)
@@ -564,6 +958,7 @@ class SaveManagerGUI:
 
         # 백업 폴더 경로 유효성 검사
         if not self.backup_folder or not os.path.isdir(self.backup_folder):
+            self.search_index = None
             self.status_label.config(text="백업 폴더가 유효하지 않습니다.")
             return
 
@@ -571,46 +966,110 @@ class SaveManagerGUI:
         try:
             self.backup_sets = get_backup_sets(self.backup_folder)
         except Exception as e: # JSON 로딩 오류 등 처리
-            messagebox.showerror("로드 오류", f"백업 세트 정보를 불러오는 중 오류 발생:\n{e}\n'{os.path.join(self.backup_folder, 'backup_sets.json')}' 파일을 확인하세요.")
             self.backup_sets = {}
+            self.search_index = None
             self.status_label.config(text="백업 세트 로드 오류")
+            # 카탈로그가 손상된 경우 백업 파일을 스캔하여 복구할 수 있도록 함
+            if isinstance(e, ValueError) and messagebox.askyesno(
+                "로드 오류",
+                f"백업 세트 정보를 불러오는 중 오류 발생:\n{e}\n\n"
+                "백업 폴더의 파일을 스캔하여 카탈로그를 복구하시겠습니까?\n"
+                "(손상된 파일은 'backup_sets.json.corrupt'로 보관됩니다)"):
+                self._rebuild_catalog(confirm=False)
+            else:
+                messagebox.showerror("로드 오류", f"백업 세트 정보를 불러오는 중 오류 발생:\n{e}\n'{os.path.join(self.backup_folder, 'backup_sets.json')}' 파일을 확인하세요.")
             return # 오류 발생 시 더 이상 진행하지 않음
 
-        # 트리뷰에 백업 세트 정보 추가 (최신순 정렬)
+        # 검색 인덱스 생성 후 트리뷰에 백업 세트 정보 추가 (최신순 정렬)
         if isinstance(self.backup_sets, dict):
-            set_ids_sorted = sorted(self.backup_sets.keys(), reverse=True)
-            if not set_ids_sorted:
+            if not self.backup_sets:
                  self.status_label.config(text="백업 세트가 없습니다.")
-
-            loaded_count = 0
-            for set_id in set_ids_sorted:
-                backup_set = self.backup_sets[set_id]
-                # backup_set 데이터 유효성 검사 강화
-                if isinstance(backup_set, dict) and all(k in backup_set for k in ["id", "date", "description", "files"]) and isinstance(backup_set["files"], list):
-                    try:
-                        file_count = len(backup_set["files"])
-                        self.sets_tree.insert(
-                            "", "end",
-                            iid=set_id, # iid는 고유해야 함 (set_id 사용)
-                            values=(
-                                backup_set["date"],
-                                backup_set["description"],
-                                file_count # 파일 개수 표시
-                            )
-                        )
-                        loaded_count += 1
-                    except Exception as insert_error:
-                         print(f"Treeview 삽입 오류 (set_id: {set_id}): {insert_error}")
-                else:
-                    print(f"경고: 잘못된 백업 세트 데이터 (set_id: {set_id}) - 건너뜀: {backup_set}")
+            # 카탈로그가 바뀐 경우에만 인덱스 재생성
+            if self.search_index is None or self.search_index.source is not self.backup_sets:
+                self.search_index = BackupSetIndex(self.backup_sets)
+                view.search_index = self.search_index
+            loaded_count = self._populate_sets_tree(self._search_set_ids())
             if loaded_count > 0:
                  self.status_label.config(text=f"{loaded_count}개의 백업 세트 로드됨")
 
         else:
              messagebox.showerror("로드 오류", f"백업 세트 데이터 형식이 잘못되었습니다 (딕셔너리가 아님). '{os.path.join(self.backup_folder, 'backup_sets.json')}' 파일을 확인하세요.")
              self.backup_sets = {}
+             self.search_index = None
              self.status_label.config(text="백업 세트 데이터 형식 오류")
 
+    def _populate_sets_tree(self, set_ids):
+        """주어진 백업 세트들로 트리뷰를 다시 채웁니다."""
+        for item in self.sets_tree.get_children():
+            self.sets_tree.delete(item)
+
+        loaded_count = 0
+        for set_id in set_ids:
+            backup_set = self.backup_sets[set_id]
+            # backup_set 데이터 유효성 검사 강화
+            if isinstance(backup_set, dict) and all(k in backup_set for k in ["id", "date", "description", "files"]) and isinstance(backup_set["files"], list):
+                try:
+                    file_count = len(backup_set["files"])
+                    damaged = backup_set.get("damaged")
+                    self.sets_tree.insert(
+                        "", "end",
+                        iid=set_id, # iid는 고유해야 함 (set_id 사용)
+                        values=(
+                            backup_set["date"],
+                            f"[손상] {backup_set['description']}" if damaged else backup_set["description"],
+                            f"{file_count} (손상 {len(damaged)})" if damaged else file_count # 파일 개수 표시
+                        ),
+                        tags=("damaged",) if damaged else ()
+                    )
+                    loaded_count += 1
+                except Exception as insert_error:
+                     print(f"Treeview 삽입 오류 (set_id: {set_id}): {insert_error}")
+            else:
+                print(f"경고: 잘못된 백업 세트 데이터 (set_id: {set_id}) - 건너뜀: {backup_set}")
+        # 다음에 같은 카탈로그와 검색 조건으로 표시할 때 그대로 재사용
+        self._view.tree_catalog = self.backup_sets
+        self._view.tree_filters = self._search_filters()
+        return loaded_count
+
+    def _search_filters(self):
+        """현재 검색 조건 (검색어, 시작 날짜, 끝 날짜, 파일 필터)을 반환합니다."""
+        return tuple(entry.get().strip() for entry in (
+            self.search_entry, self.date_from_entry, self.date_to_entry, self.file_filter_entry
+        ))
+
+    def _search_set_ids(self):
+        """현재 검색 조건에 맞는 백업 세트 ID 목록을 반환합니다."""
+        if self.search_index is None:
+            return []
+        return self.search_index.search(
+            self.search_entry.get(),
+            date_from=self.date_from_entry.get().strip() or None,
+            date_to=self.date_to_entry.get().strip() or None,
+            file_filter=self.file_filter_entry.get().strip() or None,
+        )
+
+    def _schedule_search(self, event=None):
+        """입력이 잠시 멈추면 검색을 실행합니다."""
+        if self._search_job is not None:
+            self.root.after_cancel(self._search_job)
+        self._search_job = self.root.after(150, self._apply_search)
+
+    def _apply_search(self):
+        """검색 조건으로 트리뷰를 필터링합니다."""
+        self._search_job = None
+        if self.search_index is None:
+            return
+        set_ids = self._search_set_ids()
+        self.details_listbox.delete(0, tk.END)
+        shown = self._populate_sets_tree(set_ids)
+        self.status_label.config(text=f"검색 결과: {shown}/{len(self.search_index)}개 백업 세트")
+
+    def _clear_search(self):
+        """검색 조건을 초기화하고 전체 목록을 표시합니다."""
+        for entry in (self.search_entry, self.date_from_entry, self.date_to_entry, self.file_filter_entry):
+            entry.delete(0, tk.END)
+        self._apply_search()
+
 
     def on_backup_set_selected(self, event):
         """백업 세트 선택 시 상세 정보 표시"""
@@ -638,6 +1097,14 @@ class SaveManagerGUI:
                  self.details_listbox.insert(tk.END, "(파일 목록 로드 오류)")
 
 
+    def _selected_detail_paths(self):
+        """상세 목록에서 선택된 파일들의 원본 경로 목록을 반환합니다."""
+        selected_items = self.sets_tree.selection()
+        if not selected_items or selected_items[0] not in self.backup_sets:
+            return []
+        original_paths = get_set_original_paths(self.backup_sets[selected_items[0]])
+        return [original_paths[i] for i in self.details_listbox.curselection() if i < len(original_paths)]
+
     def update_progress(self, current, total):
         """진행 상태 업데이트"""
         if total > 0: # 0으로 나누기 방지
@@ -650,8 +1117,21 @@ class SaveManagerGUI:
         self.root.update_idletasks()
 
 
+    def _transfer_running(self):
+        """백업/복원 작업 스레드가 실행 중이면 알리고 True를 반환합니다."""
+        if self.transfer_thread is not None and self.transfer_thread.is_alive():
+            messagebox.showinfo("알림", "백업 또는 복원이 진행 중입니다. 끝난 뒤 다시 시도해주세요.")
+            return True
+        return False
+
+    def _post_progress(self, current, total):
+        """작업 스레드에서 진행 상태를 UI 스레드로 전달합니다."""
+        self.root.after(0, self.update_progress, current, total)
+
     def backup_files(self):
-        """선택한 세이브 파일들을 백업"""
+        """선택한 세이브 파일들을 백업 (복사는 작업 스레드에서 수행)"""
+        if self._transfer_running():
+            return
         # 활성 프로필 & 폴더 유효성 검사
         if not self.active_profile_name:
              messagebox.showwarning("프로필 필요", "백업을 진행하려면 먼저 프로필을 선택하거나 생성해주세요.")
@@ -675,77 +1155,165 @@ class SaveManagerGUI:
             messagebox.showwarning("파일 선택 필요", "백업할 파일을 선택해주세요.")
             return
 
-        try:
-            self.progress_bar["value"] = 0
-            self.status_label.config(text="백업 준비 중...")
-            self.root.update_idletasks()
-
-            # 새 백업 세트를 위한 타임스탬프 생성
-            timestamp = get_timestamp()
-            backup_paths = []  # 실제 백업된 파일의 전체 경로 저장
-            error_files = []
-
-            total_files = len(selected_files)
-            for idx, file_path in enumerate(selected_files, 1):
-                self.update_progress(idx, total_files)
-                try:
-                    # 모든 파일에 동일한 타임스탬프 적용
-                    backup_path = backup_save_file(file_path, self.backup_folder, timestamp)
-                    backup_paths.append(backup_path)  # 성공한 경로만 추가
-                except FileNotFoundError:
-                    error_msg = f"파일 없음: {os.path.basename(file_path)}"
-                    print(f"경고: {error_msg}")
-                    error_files.append(error_msg)
-                except PermissionError:
-                     error_msg = f"권한 오류: {os.path.basename(file_path)}"
-                     print(f"경고: {error_msg}")
-                     error_files.append(error_msg)
-                except Exception as backup_err:
-                    error_msg = f"{os.path.basename(file_path)}: {backup_err}"
-                    print(f"오류: '{os.path.basename(file_path)}' 백업 중 오류 발생 - {backup_err}")
-                    error_files.append(error_msg)
-
-            # 실제로 백업된 파일이 있을 경우에만 세트 정보 저장
-            if not backup_paths:
-                 message = "선택된 파일을 백업하지 못했습니다."
-                 if error_files:
-                      message += "\n\n오류 목록:\n" + "\n".join(error_files)
-                 messagebox.showwarning("백업 실패", message)
-                 self.status_label.config(text="백업 실패")
-                 return
-
-            # 백업 세트 설명 가져오기
-            description = self.desc_entry.get().strip()
+        self.progress_bar["value"] = 0
+        self.status_label.config(text="백업 준비 중...")
+
+        # 작업 스레드에서는 위젯을 읽지 않도록 필요한 값을 미리 모아 둠
+        job = {
+            "profile": self.active_profile_name,
+            "backup_folder": self.backup_folder,
+            "save_folder": self.save_folder,
+            "files": selected_files,
+            "description": self.desc_entry.get().strip(),
+            # 태그 (쉼표로 구분)
+            "tags": [tag.strip() for tag in self.tags_entry.get().split(',') if tag.strip()],
+            "io_policy": self._current_io_policy(),
+            "durability": resolve_durability(self.config_data.get("profiles", {}).get(self.active_profile_name)),
+        }
+
+        def worker():
+            try:
+                result = self._run_backup(job)
+            except Exception as e:
+                self.root.after(0, self._on_backup_finished, job, None, e)
+                return
+            self.root.after(0, self._on_backup_finished, job, result, None)
+
+        # 저부하 모드의 속도 제한과 우선순위 낮추기는 작업 스레드에서만 적용됨 (UI는 멈추지 않음)
+        self.transfer_thread = threading.Thread(target=worker, daemon=True)
+        self.transfer_thread.start()
+
+    @profiled("gui.backup_files")
+    def _run_backup(self, job):
+        """
+        백업 작업 스레드: 백그라운드 서비스에 맡기거나, 직접 파일을 복사하고 백업 세트를 저장합니다.
+
+        Returns:
+        dict: {"description", "backed_up": 백업한 파일 수, "errors": [메시지]}
+        """
+        if self.daemon is not None:
+            self.root.after(0, lambda: self.status_label.config(text="백그라운드 서비스에서 백업 중..."))
+            # 같은 프로필의 다른 요청과 순서대로 처리됨 (서비스 오류는 DaemonError로 전달)
+            result = self._daemon_request(
+                "backup",
+                profile=job["profile"],
+                files=[os.path.relpath(path, job["save_folder"]) for path in job["files"]],
+                description=job["description"],
+                tags=job["tags"],
+            )
+            if result is not None:
+                description = job["description"]
+                if not description and result.get("set_id"):
+                    description = self._default_backup_description(result["set_id"])
+                return {"description": description, "backed_up": result["backed_up"], "errors": result["errors"]}
+            # 서비스에 연결할 수 없으면 직접 백업
+
+        backup_folder = job["backup_folder"]
+        # 새 백업 세트를 위한 타임스탬프 생성
+        timestamp = allocate_set_id(backup_folder)
+        backup_paths = []  # 실제 백업된 파일의 전체 경로 저장
+        source_paths = []  # 백업에 성공한 원본 파일 경로 (매니페스트용)
+        copied_files = {}  # 복사하면서 기록한 내용 해시와 원본 수정 시각 (매니페스트 작성 때 다시 읽지 않도록)
+        error_files = []
+
+        total_files = len(job["files"])
+        for idx, file_path in enumerate(job["files"], 1):
+            self._post_progress(idx, total_files)
+            try:
+                # 모든 파일에 동일한 타임스탬프 적용
+                backup_path = backup_save_file(file_path, backup_folder, timestamp, job["io_policy"], job["durability"],
+                                               copied_files)
+                backup_paths.append(backup_path)  # 성공한 경로만 추가
+                source_paths.append(file_path)
+            except FileNotFoundError:
+                error_msg = f"파일 없음: {os.path.basename(file_path)}"
+                print(f"경고: {error_msg}")
+                error_files.append(error_msg)
+            except PermissionError:
+                 error_msg = f"권한 오류: {os.path.basename(file_path)}"
+                 print(f"경고: {error_msg}")
+                 error_files.append(error_msg)
+            except Exception as backup_err:
+                error_msg = f"{os.path.basename(file_path)}: {backup_err}"
+                print(f"오류: '{os.path.basename(file_path)}' 백업 중 오류 발생 - {backup_err}")
+                error_files.append(error_msg)
+
+        description = job["description"]
+        # 실제로 백업된 파일이 있을 경우에만 세트 정보 저장
+        if backup_paths:
             if not description:  # 기본 설명 생성
-                try:
-                    current_time_obj = datetime.strptime(timestamp, "%y%m%d_%H%M%S")
-                    current_time_str = current_time_obj.strftime("%Y-%m-%d %H:%M:%S")
-                    description = f"백업 ({current_time_str})"
-                except ValueError:
-                    description = f"백업 ({timestamp})"
+                description = self._default_backup_description(timestamp)
 
             # 백업 세트 정보 저장
-            save_backup_set(self.backup_folder, timestamp, backup_paths, description)
-
-            # 백업 세트 목록 갱신
-            self.load_backup_sets()
-
-            self.status_label.config(text="백업 완료")
-            success_message = f"{len(backup_paths)}개의 파일이 '{description}' 백업 세트에 저장되었습니다."
-            if error_files:
-                 success_message += f"\n\n{len(error_files)}개 파일 백업 실패/건너뜀."
-                 print("백업 실패/건너뜀 상세:", error_files)
-                 messagebox.showwarning("백업 완료 (일부 오류)", success_message)
-            else:
-                 messagebox.showinfo("성공", success_message)
-
-        except Exception as e:
+            save_backup_set(backup_folder, timestamp, backup_paths, description, job["tags"],
+                            source_paths=source_paths, source_root=job["save_folder"], durability=job["durability"],
+                            copied_files=copied_files)
+        return {"description": description, "backed_up": len(backup_paths), "errors": error_files}
+
+    @staticmethod
+    def _default_backup_description(timestamp):
+        """설명 없이 백업한 세트의 기본 설명을 만듭니다."""
+        try:
+            current_time_obj = parse_set_id(timestamp)
+            current_time_str = current_time_obj.strftime("%Y-%m-%d %H:%M:%S")
+            return f"백업 ({current_time_str})"
+        except ValueError:
+            return f"백업 ({timestamp})"
+
+    def _on_backup_finished(self, job, result, error):
+        """백업 결과를 표시합니다. (UI 스레드)"""
+        if error is not None:
             self.status_label.config(text="백업 중 오류 발생")
-            messagebox.showerror("오류", f"백업 작업 중 예상치 못한 오류 발생:\n{e}")
+            messagebox.showerror("오류", f"백업 작업 중 예상치 못한 오류 발생:\n{error}")
+            return
+
+        error_files = result["errors"]
+        if not result["backed_up"]:
+             message = "선택된 파일을 백업하지 못했습니다."
+             if error_files:
+                  message += "\n\n오류 목록:\n" + "\n".join(error_files)
+             messagebox.showwarning("백업 실패", message)
+             self.status_label.config(text="백업 실패")
+             return
 
+        # 백업 세트 목록 갱신 (작업 중 다른 프로필로 바꿨으면 그 프로필의 목록은 그대로)
+        if self.backup_folder == job["backup_folder"]:
+            self.load_backup_sets()
 
-    def restore_backup_set(self):
-        """선택한 백업 세트의 모든 파일 복원"""
+        self.status_label.config(text="백업 완료")
+        success_message = f"{result['backed_up']}개의 파일이 '{result['description']}' 백업 세트에 저장되었습니다."
+        if error_files:
+             success_message += f"\n\n{len(error_files)}개 파일 백업 실패/건너뜀."
+             print("백업 실패/건너뜀 상세:", error_files)
+             messagebox.showwarning("백업 완료 (일부 오류)", success_message)
+        else:
+             messagebox.showinfo("성공", success_message)
+
+    def _daemon_request(self, op, **params):
+        """
+        백그라운드 서비스에 요청을 보냅니다.
+        서비스에 연결되어 있지 않거나 연결이 끊어지면 None을 반환하며, 이후에는 직접 처리합니다.
+        서비스가 보낸 오류는 DaemonError로 전달됩니다.
+        """
+        if self.daemon is None:
+            return None
+        # 서비스는 설정 파일에서 프로필을 읽으므로 예약된 설정 저장을 먼저 마침
+        self.config_store.flush()
+        try:
+            return self.daemon.request(op, **params)
+        except OSError as e:
+            print(f"경고: 백그라운드 서비스 연결이 끊어져 직접 처리합니다: {e}")
+            self.daemon.close()
+            self.daemon = None
+            return None
+
+    def restore_backup_set(self, selected_only=False):
+        """
+        선택한 백업 세트의 파일 복원 (복사는 작업 스레드에서 수행)
+        selected_only가 True면 상세 목록에서 선택한 파일만 복원합니다.
+        """
+        if self._transfer_running():
+            return
          # 활성 프로필 & 폴더 유효성 검사
         if not self.active_profile_name:
              messagebox.showwarning("프로필 필요", "복원을 진행하려면 먼저 프로필을 선택하거나 생성해주세요.")
@@ -783,12 +1351,31 @@ class SaveManagerGUI:
              messagebox.showinfo("알림", "선택한 백업 세트에는 복원할 파일이 없습니다.")
              return
 
+        # 선택 복원: 상세 목록에서 고른 파일만 복원
+        names = None
+        if selected_only:
+            names = self._selected_detail_paths()
+            if not names:
+                messagebox.showinfo("알림", "복원할 파일을 상세 목록에서 선택해주세요.\n(Ctrl/Shift로 여러 개 선택)")
+                return
+
         # 복원 확인
-        file_count = len(files_in_set)
+        file_count = len(files_in_set) if names is None else len(names)
+        damaged_warning = ""
+        if backup_set.get("damaged"):
+            damaged_warning = f"경고: 이 세트에는 손상되었거나 사라진 파일이 {len(backup_set['damaged'])}개 있습니다.\n\n"
+        selected_list = ""
+        if names is not None:
+            selected_list = "\n".join(f"  - {name}" for name in names[:10])
+            if len(names) > 10:
+                selected_list += f"\n  ... 외 {len(names) - 10}개"
+            selected_list += "\n\n"
         confirm = messagebox.askyesno(
             "복원 확인",
             f"'{backup_set['description']}' 백업 세트의 {file_count}개 파일을 복원하시겠습니까?\n\n"
+            + selected_list +
             f"대상 폴더:\n{self.save_folder}\n\n"
+            + damaged_warning +
             "주의: 대상 폴더에 같은 이름의 파일이 있다면 덮어씁니다!",
             icon='warning', # 경고 아이콘 추가
             parent=self.root
@@ -797,94 +1384,69 @@ class SaveManagerGUI:
         if not confirm:
             return
 
-        try:
-            self.progress_bar["value"] = 0
-            self.status_label.config(text="복원 준비 중...")
-            self.root.update_idletasks()
-
-            # 백업 세트에 속한 파일 경로 가져오기
-            backup_files_paths = get_backup_set_files(self.backup_folder, set_id)
-
-            total_files = len(backup_files_paths)
-            restored_count = 0
-            skipped_count = 0
-            error_details = [] # 오류 상세 정보 저장
-
-            for idx, backup_file_path in enumerate(backup_files_paths, 1):
-                self.update_progress(idx, total_files)
-                backup_file_name = os.path.basename(backup_file_path) # 오류 보고용
-
-                if not isinstance(backup_file_path, str) or not backup_file_path:
-                     msg = f"잘못된 경로 데이터: {backup_file_path}"
-                     print(f"경고: {msg}")
-                     error_details.append(msg)
-                     skipped_count += 1
-                     continue
-
-                if os.path.exists(backup_file_path):
-                    try:
-                        original_file_name = get_original_filename(backup_file_name)
-                        if not original_file_name:
-                            msg = f"{backup_file_name}: 원본 파일명 추출 불가"
-                            print(f"경고: {msg}")
-                            error_details.append(msg)
-                            skipped_count += 1
-                            continue
-
-                        # 대상 경로 생성
-                        destination_path = os.path.join(self.save_folder, original_file_name)
-
-                        # (선택사항) 대상 파일이 이미 존재하고, 백업 파일과 동일한 경우 건너뛰기
-                        # if os.path.exists(destination_path) and filecmp.cmp(backup_file_path, destination_path, shallow=False):
-                        #     restored_count += 1 # 동일해도 복원된 것으로 간주하거나, 별도 카운트
-                        #     continue
-
-                        # 파일 복원
-                        restore_save_file(backup_file_path, self.save_folder, original_file_name)
-                        restored_count += 1
-
-                    except FileNotFoundError:
-                         msg = f"{backup_file_name}: 복원 중 파일 없음"
-                         print(f"경고: {msg}")
-                         error_details.append(msg)
-                         skipped_count += 1
-                    except PermissionError:
-                         msg = f"{backup_file_name}: 대상 폴더 쓰기 권한 없음"
-                         print(f"오류: {msg}")
-                         error_details.append(msg)
-                         skipped_count += 1
-                    except Exception as restore_err:
-                         msg = f"{backup_file_name}: {restore_err}"
-                         print(f"오류: '{backup_file_name}' 복원 중 오류 발생 - {restore_err}")
-                         error_details.append(msg)
-                         skipped_count += 1
-                else:
-                    msg = f"{backup_file_name}: 백업 파일 없음"
-                    print(f"경고: {msg}")
-                    error_details.append(msg)
-                    skipped_count += 1
-
-
-            # 복원 결과 요약
-            result_title = "복원 완료"
-            result_message = f"{restored_count}개의 파일이 성공적으로 복원되었습니다."
-            if skipped_count > 0:
-                result_title += " (일부 실패/건너뜀)"
-                result_message += f"\n{skipped_count}개의 파일 복원에 실패했거나 건너뛰었습니다."
-                print("\n--- 복원 실패/건너뜀 상세 ---")
-                for detail in error_details:
-                    print(f"- {detail}")
-                print("----------------------------\n")
-                # 사용자에게도 간략히 알림
-                messagebox.showwarning(result_title, result_message + "\n\n자세한 내용은 콘솔 로그를 확인하세요.", parent=self.root)
-            else:
-                 messagebox.showinfo(result_title, result_message, parent=self.root)
+        self.progress_bar["value"] = 0
+        self.status_label.config(text="복원 준비 중...")
+        job = {
+            "profile": self.active_profile_name,
+            "backup_folder": self.backup_folder,
+            "save_folder": self.save_folder,
+            "set_id": set_id,
+            "names": names,
+            "io_policy": self._current_io_policy(),
+        }
+
+        def worker():
+            try:
+                result = self._run_restore(job)
+            except Exception as e:
+                self.root.after(0, self._on_restore_finished, None, e)
+                return
+            self.root.after(0, self._on_restore_finished, result, None)
+
+        self.transfer_thread = threading.Thread(target=worker, daemon=True)
+        self.transfer_thread.start()
+
+    @profiled("gui.restore_backup_set")
+    def _run_restore(self, job):
+        """복원 작업 스레드: 서비스에 맡기거나 직접 복원합니다."""
+        result = self._daemon_request("restore", profile=job["profile"], set_id=job["set_id"], names=job["names"])
+        if result is None:
+            result = restore_backup_files(
+                job["backup_folder"], job["set_id"], job["save_folder"],
+                names=job["names"], io_policy=job["io_policy"], progress_callback=self._post_progress
+            )
+        return result
+
+    def _on_restore_finished(self, result, error):
+        """복원 결과를 표시합니다. (UI 스레드)"""
+        if error is not None:
+            self.status_label.config(text="복원 중 오류 발생")
+            messagebox.showerror("치명적 오류", f"복원 작업 중 예상치 못한 오류 발생:\n{error}", parent=self.root)
+            return
 
-            self.status_label.config(text=result_title)
+        restored_count = result["restored"]
+        unchanged_count = result["unchanged"] # 이미 같은 내용이라 건너뛴 파일 수
+        error_details = result["errors"] + [f"{name}: 세트에 없는 파일" for name in result["unmatched"]]
+        skipped_count = len(error_details)
+
+        # 복원 결과 요약
+        result_title = "복원 완료"
+        result_message = f"{restored_count}개의 파일이 성공적으로 복원되었습니다."
+        if unchanged_count > 0:
+            result_message += f"\n(이 중 {unchanged_count}개는 이미 같은 내용이라 복사하지 않았습니다.)"
+        if skipped_count > 0:
+            result_title += " (일부 실패/건너뜀)"
+            result_message += f"\n{skipped_count}개의 파일 복원에 실패했거나 건너뛰었습니다."
+            print("\n--- 복원 실패/건너뜀 상세 ---")
+            for detail in error_details:
+                print(f"- {detail}")
+            print("----------------------------\n")
+            # 사용자에게도 간략히 알림
+            messagebox.showwarning(result_title, result_message + "\n\n자세한 내용은 콘솔 로그를 확인하세요.", parent=self.root)
+        else:
+             messagebox.showinfo(result_title, result_message, parent=self.root)
 
-        except Exception as e:
-            self.status_label.config(text="복원 중 오류 발생")
-            messagebox.showerror("치명적 오류", f"복원 작업 중 예상치 못한 오류 발생:\n{e}", parent=self.root)
+        self.status_label.config(text=result_title)
 
     def delete_backup_set(self):
         """선택한 백업 세트를 삭제합니다."""
@@ -928,47 +1490,32 @@ class SaveManagerGUI:
             self.status_label.config(text="삭제 준비 중...")
             self.root.update_idletasks()
 
-            # 백업 세트에 속한 파일 경로 가져오기
-            backup_files_paths = get_backup_set_files(self.backup_folder, set_id)
-
-            total_files = len(backup_files_paths)
             deleted_count = 0
             error_count = 0
             error_details = []
 
-            for idx, backup_file_path in enumerate(backup_files_paths, 1):
-                self.update_progress(idx, total_files)
-                try:
-                    if os.path.exists(backup_file_path):
-                        os.remove(backup_file_path)
-                        deleted_count += 1
-                    else:
-                        error_msg = f"파일 없음: {os.path.basename(backup_file_path)}"
-                        print(f"경고: {error_msg}")
-                        error_details.append(error_msg)
-                        error_count += 1
-                except Exception as e:
-                    error_msg = f"{os.path.basename(backup_file_path)}: {str(e)}"
-                    print(f"오류: {error_msg}")
+            # 세트 폴더를 폴더째 삭제 (콜드 보관된 압축 사본 포함)
+            try:
+                deleted_count, missing_files = delete_backup_set_files(self.backup_folder, set_id)
+                for file in missing_files:
+                    error_msg = f"파일 없음: {file}"
+                    print(f"경고: {error_msg}")
                     error_details.append(error_msg)
                     error_count += 1
+            except Exception as e:
+                error_msg = f"{set_id}: {str(e)}"
+                print(f"오류: {error_msg}")
+                error_details.append(error_msg)
+                error_count += 1
+            self.update_progress(1, 1)
 
             # backup_sets.json에서 해당 세트 정보 삭제
-            backup_sets_file = os.path.join(self.backup_folder, "backup_sets.json")
-            if os.path.exists(backup_sets_file):
-                try:
-                    with open(backup_sets_file, 'r', encoding='utf-8') as f:
-                        backup_sets_data = json.load(f)
-                    
-                    if set_id in backup_sets_data:
-                        del backup_sets_data[set_id]
-                        
-                        with open(backup_sets_file, 'w', encoding='utf-8') as f:
-                            json.dump(backup_sets_data, f, ensure_ascii=False, indent=4)
-                except Exception as e:
-                    print(f"백업 세트 정보 파일 업데이트 중 오류: {e}")
-                    error_details.append(f"백업 세트 정보 파일 업데이트 실패: {e}")
-                    error_count += 1
+            try:
+                delete_backup_set_records(self.backup_folder, [set_id])
+            except Exception as e:
+                print(f"백업 세트 정보 파일 업데이트 중 오류: {e}")
+                error_details.append(f"백업 세트 정보 파일 업데이트 실패: {e}")
+                error_count += 1
 
             # 백업 세트 목록 갱신
             self.load_backup_sets()
@@ -994,6 +1541,783 @@ class SaveManagerGUI:
             self.status_label.config(text="삭제 중 오류 발생")
             messagebox.showerror("치명적 오류", f"삭제 작업 중 예상치 못한 오류 발생:\n{e}", parent=self.root)
 
+    def _open_file_history(self):
+        """파일 하나의 모든 백업 버전을 보여주고, 원하는 버전을 복원할 수 있는 창을 띄웁니다."""
+        if not self.active_profile_name:
+            messagebox.showwarning("프로필 필요", "먼저 프로필을 선택하거나 생성해주세요.")
+            return
+        if not self.backup_folder or not os.path.isdir(self.backup_folder):
+            messagebox.showerror("오류", "백업 폴더 경로가 유효하지 않습니다.")
+            return
+
+        try:
+            file_names = sorted(get_file_index(self.backup_folder))
+        except Exception as e:
+            messagebox.showerror("오류", f"파일 인덱스를 불러오는 중 오류 발생:\n{e}")
+            return
+        if not file_names:
+            messagebox.showinfo("알림", "백업된 파일이 없습니다.")
+            return
+
+        # 상세 목록에서 선택한 파일이 있으면 그 파일부터 표시
+        initial_name = file_names[0]
+        selected_paths = self._selected_detail_paths()
+        if selected_paths and selected_paths[0] in file_names:
+            initial_name = selected_paths[0]
+
+        dialog = tk.Toplevel(self.root)
+        dialog.title("파일 기록")
+        dialog.geometry("560x320")
+        dialog.transient(self.root)
+        dialog.configure(bg=self.bg_color)
+
+        frame = ttk.Frame(dialog, padding=10)
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        select_frame = ttk.Frame(frame)
+        select_frame.pack(fill=tk.X)
+        ttk.Label(select_frame, text="파일:").pack(side=tk.LEFT, padx=(0, 5))
+        file_combobox = ttk.Combobox(select_frame, state="readonly", values=file_names)
+        file_combobox.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        file_combobox.set(initial_name)
+
+        tree_frame = ttk.Frame(frame)
+        tree_frame.pack(fill=tk.BOTH, expand=True, pady=5)
+        versions_tree = ttk.Treeview(tree_frame, columns=("date", "size", "hash", "description"), show="headings")
+        versions_tree.heading("date", text="날짜")
+        versions_tree.heading("size", text="크기")
+        versions_tree.heading("hash", text="해시")
+        versions_tree.heading("description", text="설명")
+        versions_tree.column("date", width=130, anchor=tk.W)
+        versions_tree.column("size", width=80, anchor=tk.E)
+        versions_tree.column("hash", width=90, anchor=tk.W)
+        versions_tree.column("description", width=200, anchor=tk.W)
+        versions_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        versions_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=versions_tree.yview)
+        versions_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        versions_tree.config(yscrollcommand=versions_scrollbar.set)
+
+        def show_versions(event=None):
+            for item in versions_tree.get_children():
+                versions_tree.delete(item)
+            for version in get_file_versions(self.backup_folder, file_combobox.get()):
+                size = version.get("size")
+                versions_tree.insert(
+                    "", "end",
+                    iid=version["set_id"],
+                    values=(
+                        version["date"],
+                        f"{size:,} B" if size is not None else "?",
+                        (version.get("hash") or "")[:10],
+                        version["description"],
+                    )
+                )
+        file_combobox.bind('<<ComboboxSelected>>', show_versions)
+
+        def restore_selected_version():
+            selected_items = versions_tree.selection()
+            if not selected_items:
+                messagebox.showinfo("알림", "복원할 버전을 선택해주세요.", parent=dialog)
+                return
+            if not self.save_folder or not os.path.isdir(self.save_folder):
+                messagebox.showerror("오류", "세이브 폴더 경로가 유효하지 않습니다.", parent=dialog)
+                return
+            set_id = selected_items[0]
+            file_name = file_combobox.get()
+            if not messagebox.askyesno(
+                "복원 확인",
+                f"'{file_name}' 파일을 {versions_tree.set(set_id, 'date')} 버전으로 복원하시겠습니까?\n\n"
+                "주의: 대상 폴더에 같은 이름의 파일이 있다면 덮어씁니다!",
+                icon='warning',
+                parent=dialog
+            ):
+                return
+            # 세트 잠금을 기다리거나 속도 제한/압축 해제/조립으로 오래 걸릴 수 있으므로 주 복원과 같은 작업 스레드에서 복원
+            if self._transfer_running():
+                return
+            job = (self.backup_folder, set_id, file_name, self.save_folder, self._current_io_policy())
+            self.status_label.config(text=f"'{file_name}' 복원 중...")
+
+            def worker():
+                try:
+                    restore_file_version(*job)
+                except Exception as e:
+                    self.root.after(0, on_version_restored, file_name, e)
+                    return
+                self.root.after(0, on_version_restored, file_name, None)
+
+            self.transfer_thread = threading.Thread(target=worker, daemon=True)
+            self.transfer_thread.start()
+
+        def on_version_restored(file_name, error):
+            # 복원하는 동안 창이 닫혔으면 기본 창에 알림
+            parent = dialog if dialog.winfo_exists() else self.root
+            if error is not None:
+                self.status_label.config(text="복원 중 오류 발생")
+                messagebox.showerror("오류", f"복원 중 오류 발생:\n{error}", parent=parent)
+                return
+            self.status_label.config(text=f"'{file_name}' 복원 완료")
+            messagebox.showinfo("복원 완료", f"'{file_name}' 파일이 복원되었습니다.", parent=parent)
+
+        ttk.Button(frame, text="선택한 버전 복원", command=restore_selected_version).pack(pady=(5, 0))
+        show_versions()
+
+    def _open_compare_dialog(self):
+        """선택한 백업 세트를 현재 세이브 폴더 또는 다른 세트와 비교하는 창을 띄웁니다."""
+        if not self.backup_folder or not os.path.isdir(self.backup_folder):
+            messagebox.showerror("오류", "백업 폴더 경로가 유효하지 않습니다.")
+            return
+        selected_items = self.sets_tree.selection()
+        if not selected_items or selected_items[0] not in self.backup_sets:
+            messagebox.showinfo("알림", "비교할 백업 세트를 목록에서 선택해주세요.")
+            return
+        set_id = selected_items[0]
+
+        # 비교 대상: 현재 세이브 폴더 + 다른 백업 세트들
+        live_label = "현재 세이브 폴더"
+        target_labels = [live_label]
+        target_ids = {live_label: None}
+        for other_id in sorted(self.backup_sets, reverse=True):
+            other_set = self.backup_sets[other_id]
+            if other_id == set_id or not isinstance(other_set, dict):
+                continue
+            label = f"{other_set.get('date', other_id)} - {other_set.get('description', '')}"
+            target_labels.append(label)
+            target_ids[label] = other_id
+
+        dialog = tk.Toplevel(self.root)
+        dialog.title(f"비교 - {self.backup_sets[set_id].get('description', set_id)}")
+        dialog.geometry("600x360")
+        dialog.transient(self.root)
+        dialog.configure(bg=self.bg_color)
+
+        frame = ttk.Frame(dialog, padding=10)
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        target_frame = ttk.Frame(frame)
+        target_frame.pack(fill=tk.X)
+        ttk.Label(target_frame, text="비교 대상:").pack(side=tk.LEFT, padx=(0, 5))
+        target_combobox = ttk.Combobox(target_frame, state="readonly", values=target_labels)
+        target_combobox.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        target_combobox.set(live_label)
+
+        tree_frame = ttk.Frame(frame)
+        tree_frame.pack(fill=tk.BOTH, expand=True, pady=5)
+        result_tree = ttk.Treeview(tree_frame, columns=("status", "path", "size", "delta"), show="headings")
+        result_tree.heading("status", text="상태")
+        result_tree.heading("path", text="파일")
+        result_tree.heading("size", text="백업 크기")
+        result_tree.heading("delta", text="차이 (바이트)")
+        result_tree.column("status", width=90, anchor=tk.W)
+        result_tree.column("path", width=250, anchor=tk.W)
+        result_tree.column("size", width=100, anchor=tk.E)
+        result_tree.column("delta", width=100, anchor=tk.E)
+        result_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        result_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=result_tree.yview)
+        result_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        result_tree.config(yscrollcommand=result_scrollbar.set)
+
+        summary_label = ttk.Label(frame, text="")
+        summary_label.pack(anchor=tk.W)
+
+        status_texts = {
+            "added": "복원 시 추가",
+            "removed": "대상에만 있음",
+            "changed": "변경됨",
+            "identical": "동일",
+            "ambiguous": "확인 중...",
+        }
+        state = {"stop": None, "result": None}
+
+        def update_summary():
+            result = state["result"]
+            # 세이브 폴더와 비교할 때는 세트에 있는 파일만 비교하므로 '대상에만 있음'은 표시하지 않음
+            keys = ("added", "changed", "identical") if result["live"] else ("added", "removed", "changed", "identical")
+            counts = ", ".join(f"{status_texts[key]} {len(result[key])}" for key in keys)
+            if result["ambiguous"]:
+                counts += f", 확인 중 {len(result['ambiguous'])}"
+            summary_label.config(text=counts)
+
+        def run_compare(event=None):
+            # 이전 비교의 백그라운드 해시 작업 중단
+            if state["stop"] is not None:
+                state["stop"].set()
+            for item in result_tree.get_children():
+                result_tree.delete(item)
+
+            other_set_id = target_ids.get(target_combobox.get())
+            if other_set_id is None and (not self.save_folder or not os.path.isdir(self.save_folder)):
+                summary_label.config(text="세이브 폴더 경로가 유효하지 않습니다.")
+                return
+            try:
+                result = compare_backup_set(self.backup_folder, set_id, self.save_folder, other_set_id)
+            except Exception as e:
+                summary_label.config(text=f"비교 중 오류 발생: {e}")
+                return
+
+            state["result"] = result
+            for key in ("changed", "ambiguous", "added", "removed", "identical"):
+                for item in result[key]:
+                    result_tree.insert(
+                        "", "end",
+                        iid=item["path"],
+                        values=(
+                            status_texts[key],
+                            item["path"],
+                            f"{item['size']:,}" if item["size"] is not None else "-",
+                            f"{item['delta']:+,}",
+                        )
+                    )
+            update_summary()
+
+            # 크기/수정 시각만으로 판단할 수 없는 파일만 백그라운드에서 해시 비교
+            if result["ambiguous"]:
+                stop_event = threading.Event()
+                state["stop"] = stop_event
+
+                def on_resolved(item, status):
+                    def apply():
+                        # 창이 닫혔거나 다른 대상으로 다시 비교한 경우 무시
+                        if stop_event.is_set() or not result_tree.exists(item["path"]):
+                            return
+                        result_tree.set(item["path"], "status", status_texts[status])
+                        update_summary()
+                    self.root.after(0, apply)
+
+                threading.Thread(
+                    target=resolve_ambiguous,
+                    args=(self.backup_folder, result, on_resolved, stop_event),
+                    daemon=True
+                ).start()
+
+        def on_close():
+            if state["stop"] is not None:
+                state["stop"].set()
+            dialog.destroy()
+
+        target_combobox.bind('<<ComboboxSelected>>', run_compare)
+        dialog.protocol("WM_DELETE_WINDOW", on_close)
+        ttk.Button(frame, text="닫기", command=on_close).pack(pady=(5, 0))
+        run_compare()
+
+    def _toggle_scrub(self):
+        """무결성 검사를 시작하거나, 실행 중이면 중단합니다."""
+        if self.scrub_thread is not None and self.scrub_thread.is_alive():
+            if messagebox.askyesno("검사 중단", "무결성 검사를 중단하시겠습니까?\n다음에 검사하면 중단한 지점부터 이어서 진행합니다."):
+                self.scrub_stop_event.set()
+            return
+
+        if not self.active_profile_name:
+            messagebox.showwarning("프로필 필요", "먼저 프로필을 선택하거나 생성해주세요.")
+            return
+        if not self.backup_folder or not os.path.isdir(self.backup_folder):
+            messagebox.showerror("오류", "백업 폴더 경로가 유효하지 않습니다.")
+            return
+
+        profile_data = self.config_data.get("profiles", {}).get(self.active_profile_name, {})
+        max_mbps = simpledialog.askfloat(
+            "무결성 검사",
+            "최대 읽기 속도 (MB/s, 0 = 제한 없음):",
+            initialvalue=profile_data.get("scrub_max_mbps", 50),
+            minvalue=0,
+            parent=self.root
+        )
+        if max_mbps is None:
+            return
+        profile_data["scrub_max_mbps"] = max_mbps
+        self._save_config()
+
+        backup_folder = self.backup_folder
+        io_policy = resolve_io_policy(profile_data)
+        self.scrub_stop_event = threading.Event()
+        self.scrub_btn.config(text="검사 중단")
+        self.status_label.config(text="무결성 검사 중...")
+
+        def on_progress(checked, total):
+            self.root.after(0, lambda: self.status_label.config(text=f"무결성 검사 중... ({checked}/{total})"))
+
+        def worker():
+            try:
+                result = scrub_backup_folder(
+                    backup_folder,
+                    max_mbps=max_mbps or None,
+                    stop_event=self.scrub_stop_event,
+                    progress_callback=on_progress,
+                    io_policy=io_policy
+                )
+            except Exception as e:
+                self.root.after(0, self._on_scrub_finished, backup_folder, None, e)
+                return
+            self.root.after(0, self._on_scrub_finished, backup_folder, result, None)
+
+        self.scrub_thread = threading.Thread(target=worker, daemon=True)
+        self.scrub_thread.start()
+
+    def _rebuild_catalog(self, confirm=True):
+        """백업 폴더의 파일을 스캔하여 카탈로그에 없는 백업 세트를 복구합니다. (백그라운드 스레드)"""
+        if self.rebuild_thread is not None and self.rebuild_thread.is_alive():
+            messagebox.showinfo("카탈로그 복구", "카탈로그 복구가 이미 진행 중입니다.")
+            return
+        if not self.active_profile_name:
+            messagebox.showwarning("프로필 필요", "먼저 프로필을 선택하거나 생성해주세요.")
+            return
+        if not self.backup_folder or not os.path.isdir(self.backup_folder):
+            messagebox.showerror("오류", "백업 폴더 경로가 유효하지 않습니다.")
+            return
+        if confirm and not messagebox.askyesno(
+            "카탈로그 복구",
+            "백업 폴더의 파일을 스캔하여 목록에 없는 백업 세트를 복구하시겠습니까?\n"
+            "기존 세트의 설명과 태그는 그대로 유지됩니다."):
+            return
+
+        backup_folder = self.backup_folder
+        self.rebuild_btn.config(state=tk.DISABLED)
+        self.status_label.config(text="카탈로그 복구 중...")
+
+        def on_progress(done, total):
+            self.root.after(0, lambda: self.status_label.config(text=f"카탈로그 복구 중... ({done}/{total})"))
+
+        def worker():
+            try:
+                result = rebuild_backup_sets(backup_folder, progress_callback=on_progress)
+            except Exception as e:
+                self.root.after(0, self._on_rebuild_finished, backup_folder, None, e)
+                return
+            self.root.after(0, self._on_rebuild_finished, backup_folder, result, None)
+
+        self.rebuild_thread = threading.Thread(target=worker, daemon=True)
+        self.rebuild_thread.start()
+
+    def _on_rebuild_finished(self, backup_folder, result, error):
+        """카탈로그 복구 결과를 표시합니다."""
+        self.rebuild_btn.config(state=tk.NORMAL)
+        if error is not None:
+            self.status_label.config(text="카탈로그 복구 중 오류 발생")
+            messagebox.showerror("오류", f"카탈로그 복구 중 오류 발생:\n{error}")
+            return
+
+        if self.backup_folder == backup_folder:
+            self.load_backup_sets()
+
+        message = f"전체 {result['sets']}개 세트 중 {result['recovered']}개 세트 ({result['files']}개 파일)를 복구했습니다."
+        if result["skipped"]:
+            message += f"\n백업 세트 형식이 아니어서 건너뛴 파일: {result['skipped']}개"
+        if result["catalog_corrupt"]:
+            message += "\n\n손상된 카탈로그는 'backup_sets.json.corrupt'로 보관했습니다."
+        self.status_label.config(text=f"카탈로그 복구 완료 ({result['recovered']}개 세트 복구)")
+        messagebox.showinfo("카탈로그 복구", message)
+
+    def _check_bundle_ready(self):
+        """번들 작업을 시작할 수 있는지 확인합니다."""
+        if self.bundle_thread is not None and self.bundle_thread.is_alive():
+            messagebox.showinfo("번들", "내보내기/가져오기가 이미 진행 중입니다.")
+            return False
+        if not self.active_profile_name:
+            messagebox.showwarning("프로필 필요", "먼저 프로필을 선택하거나 생성해주세요.")
+            return False
+        if not self.backup_folder or not os.path.isdir(self.backup_folder):
+            messagebox.showerror("오류", "백업 폴더 경로가 유효하지 않습니다.")
+            return False
+        return True
+
+    def _export_bundle(self):
+        """선택한 백업 세트(선택이 없으면 모든 세트)를 번들 파일로 내보냅니다. (백그라운드 스레드)"""
+        if not self._check_bundle_ready():
+            return
+        set_ids = list(self.sets_tree.selection())
+        if not set_ids:
+            if not self.backup_sets:
+                messagebox.showinfo("내보내기", "내보낼 백업 세트가 없습니다.")
+                return
+            if not messagebox.askyesno("내보내기", f"선택한 세트가 없습니다. 모든 백업 세트({len(self.backup_sets)}개)를 내보내시겠습니까?"):
+                return
+            set_ids = None
+        output_path = filedialog.asksaveasfilename(
+            title="번들 저장", defaultextension=BUNDLE_EXTENSION,
+            initialfile=f"{self.active_profile_name}{BUNDLE_EXTENSION}",
+            filetypes=[("게임 세이버 번들", f"*{BUNDLE_EXTENSION}"), ("모든 파일", "*.*")])
+        if not output_path:
+            return
+
+        backup_folder = self.backup_folder
+        self._run_bundle_task("내보내기", lambda progress: export_backup_sets(
+            backup_folder, output_path, set_ids, progress_callback=progress), backup_folder)
+
+    def _import_bundle(self):
+        """번들 파일의 백업 세트를 현재 프로필의 백업 폴더로 가져옵니다. (백그라운드 스레드)"""
+        if not self._check_bundle_ready():
+            return
+        bundle_path = filedialog.askopenfilename(
+            title="가져올 번들 선택",
+            filetypes=[("게임 세이버 번들", f"*{BUNDLE_EXTENSION}"), ("모든 파일", "*.*")])
+        if not bundle_path:
+            return
+
+        backup_folder = self.backup_folder
+        self._run_bundle_task("가져오기", lambda progress: import_bundle(
+            backup_folder, bundle_path, progress_callback=progress), backup_folder)
+
+    def _run_bundle_task(self, title, task, backup_folder):
+        self.export_btn.config(state=tk.DISABLED)
+        self.import_btn.config(state=tk.DISABLED)
+        self.status_label.config(text=f"{title} 중...")
+
+        def on_progress(done, total):
+            self.root.after(0, lambda: self.status_label.config(text=f"{title} 중... ({done}/{total})"))
+
+        def worker():
+            try:
+                result = task(on_progress)
+            except Exception as e:
+                self.root.after(0, self._on_bundle_finished, title, backup_folder, None, e)
+                return
+            self.root.after(0, self._on_bundle_finished, title, backup_folder, result, None)
+
+        self.bundle_thread = threading.Thread(target=worker, daemon=True)
+        self.bundle_thread.start()
+
+    def _on_bundle_finished(self, title, backup_folder, result, error):
+        """번들 내보내기/가져오기 결과를 표시합니다."""
+        self.export_btn.config(state=tk.NORMAL)
+        self.import_btn.config(state=tk.NORMAL)
+        if error is not None:
+            self.status_label.config(text=f"{title} 중 오류 발생")
+            messagebox.showerror("오류", f"{title} 중 오류 발생:\n{error}")
+            return
+
+        if title == "내보내기":
+            message = (f"백업 세트 {result['sets']}개 (파일 {result['files']}개)를 내보냈습니다.\n"
+                       f"번들 크기: {format_size(result['bytes'])}")
+            self.status_label.config(text=f"내보내기 완료 ({result['sets']}개 세트)")
+        else:
+            if self.backup_folder == backup_folder:
+                self.load_backup_sets()
+            message = f"백업 세트 {len(result['sets'])}개 (파일 {result['files']}개)를 가져왔습니다."
+            if result["skipped_sets"]:
+                message += f"\n이미 있어 건너뛴 세트: {result['skipped_sets']}개"
+            if result["chunks_skipped"]:
+                message += f"\n이미 있던 조각: {result['chunks_skipped']}개"
+            self.status_label.config(text=f"가져오기 완료 ({len(result['sets'])}개 세트)")
+        messagebox.showinfo(title, message)
+
+    def _on_scrub_finished(self, backup_folder, result, error):
+        """무결성 검사 결과를 표시합니다."""
+        self.scrub_btn.config(text="무결성 검사")
+        if error is not None:
+            self.status_label.config(text="무결성 검사 중 오류 발생")
+            messagebox.showerror("오류", f"무결성 검사 중 오류 발생:\n{error}")
+            return
+
+        if self.backup_folder == backup_folder:
+            self.load_backup_sets()
+
+        if not result["completed"]:
+            self.status_label.config(text=f"무결성 검사 중단됨 ({result['checked']}/{result['total']})")
+            return
+
+        message = f"{result['total']}개 파일 중 {result['ok']}개 정상"
+        if result["unverifiable"]:
+            message += f"\n해시 정보가 없어 검사하지 못한 파일: {result['unverifiable']}개"
+        if result["damaged"]:
+            for set_id, files in result["damaged"].items():
+                print(f"손상된 백업 세트 {set_id}: {files}")
+            self.status_label.config(text="무결성 검사 완료 (손상 발견)")
+            messagebox.showwarning(
+                "무결성 검사 완료",
+                message + f"\n\n{len(result['damaged'])}개의 백업 세트에서 손상되었거나 사라진 파일이 발견되었습니다.\n"
+                "해당 세트는 목록에 [손상]으로 표시됩니다."
+            )
+        else:
+            self.status_label.config(text="무결성 검사 완료")
+            messagebox.showinfo("무결성 검사 완료", message)
+
+    def _configure_mirrors(self, profile_name, profile_data, initial_sync=False):
+        """프로필의 미러 설정을 복제 관리자에 적용합니다."""
+        if self.daemon is not None:
+            return # 백그라운드 서비스가 설정 파일을 다시 읽어 복제함
+        mirrors = profile_data.get("mirrors", [])
+        if not mirrors and self.mirror_manager.get(get_backup_folder_path(profile_name)) is None:
+            return
+        self.mirror_manager.configure(
+            get_backup_folder_path(profile_name),
+            mirrors,
+            max_mbps=profile_data.get("mirror_max_mbps") or None,
+            initial_sync=initial_sync
+        )
+
+    def _open_mirror_dialog(self):
+        """현재 프로필의 백업을 복제할 보조 폴더를 설정하는 창을 띄웁니다."""
+        if not self.active_profile_name:
+            messagebox.showwarning("프로필 필요", "먼저 프로필을 선택하거나 생성해주세요.")
+            return
+        profile_name = self.active_profile_name
+        profile_data = self.config_data.get("profiles", {}).get(profile_name)
+        if profile_data is None:
+            return
+
+        dialog = tk.Toplevel(self.root)
+        dialog.title(f"미러 설정 - {profile_name}")
+        dialog.transient(self.root)
+        dialog.configure(bg=self.bg_color)
+
+        frame = ttk.Frame(dialog, padding=10)
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        ttk.Label(frame, text="백업을 복제할 보조 폴더 (다른 디스크, NAS 등):").pack(anchor=tk.W)
+        mirrors_listbox = tk.Listbox(frame, height=5, width=60)
+        mirrors_listbox.pack(fill=tk.BOTH, expand=True, pady=5)
+        for mirror in profile_data.get("mirrors", []):
+            mirrors_listbox.insert(tk.END, mirror)
+
+        def add_mirror():
+            folder = filedialog.askdirectory(title="보조 백업 폴더 선택", parent=dialog)
+            if not folder:
+                return
+            if os.path.normcase(os.path.abspath(folder)).startswith(os.path.normcase(os.path.abspath(self.backup_folder))):
+                messagebox.showerror("오류", "백업 폴더 안의 폴더는 미러로 사용할 수 없습니다.", parent=dialog)
+                return
+            if folder not in mirrors_listbox.get(0, tk.END):
+                mirrors_listbox.insert(tk.END, folder)
+
+        def remove_mirror():
+            for index in reversed(mirrors_listbox.curselection()):
+                mirrors_listbox.delete(index)
+
+        list_buttons = ttk.Frame(frame)
+        list_buttons.pack(fill=tk.X)
+        ttk.Button(list_buttons, text="추가", command=add_mirror).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(list_buttons, text="제거", command=remove_mirror).pack(side=tk.LEFT)
+
+        speed_frame = ttk.Frame(frame)
+        speed_frame.pack(fill=tk.X, pady=(10, 0))
+        ttk.Label(speed_frame, text="최대 전송 속도 (MB/s, 0 = 제한 없음):").pack(side=tk.LEFT, padx=(0, 5))
+        speed_entry = ttk.Entry(speed_frame, width=8)
+        speed_entry.insert(0, str(profile_data.get("mirror_max_mbps", 20)))
+        speed_entry.pack(side=tk.LEFT)
+
+        replicator = self.mirror_manager.get(self.backup_folder)
+        if replicator is not None:
+            ttk.Label(frame, text=f"대기 중인 복제 작업: {replicator.pending_count()}개").pack(anchor=tk.W, pady=(5, 0))
+
+        def save_mirrors():
+            try:
+                max_mbps = float(speed_entry.get().strip() or 0)
+            except ValueError:
+                messagebox.showerror("입력 오류", "전송 속도는 숫자로 입력해주세요.", parent=dialog)
+                return
+            old_mirrors = profile_data.get("mirrors", [])
+            mirrors = list(mirrors_listbox.get(0, tk.END))
+            profile_data["mirrors"] = mirrors
+            profile_data["mirror_max_mbps"] = max_mbps
+            self._save_config()
+            # 새로 추가된 미러가 있으면 기존 세트 전체를 복제
+            self._configure_mirrors(profile_name, profile_data, initial_sync=bool(set(mirrors) - set(old_mirrors)))
+            dialog.destroy()
+
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(pady=(10, 0))
+        ttk.Button(button_frame, text="저장", command=save_mirrors).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="취소", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+
+    def _current_io_policy(self):
+        """현재 프로필 설정과 게임 실행 여부에 따른 I/O 정책을 반환합니다. (최대 속도면 None)"""
+        if not self.active_profile_name:
+            return None
+        return resolve_io_policy(self.config_data.get("profiles", {}).get(self.active_profile_name))
+
+    def _open_io_settings_dialog(self):
+        """게임 실행 중 백업/복원/검사의 디스크 부하를 줄이는 설정 창을 띄웁니다."""
+        if not self.active_profile_name:
+            messagebox.showwarning("프로필 필요", "먼저 프로필을 선택하거나 생성해주세요.")
+            return
+        profile_name = self.active_profile_name
+        profile_data = self.config_data.get("profiles", {}).get(profile_name)
+        if profile_data is None:
+            return
+
+        dialog = tk.Toplevel(self.root)
+        dialog.title(f"I/O 설정 - {profile_name}")
+        dialog.transient(self.root)
+        dialog.configure(bg=self.bg_color)
+
+        frame = ttk.Frame(dialog, padding=10)
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        ttk.Label(frame, text="백업/복원/무결성 검사의 디스크 사용 방식:").pack(anchor=tk.W)
+        mode_var = tk.StringVar(value=profile_data.get("io_mode", IO_MODE_AUTO))
+        for value, text in (
+            (IO_MODE_AUTO, "자동 (게임 실행 중에만 저부하 모드)"),
+            (IO_MODE_LOW, "항상 저부하 모드"),
+            (IO_MODE_NORMAL, "항상 최대 속도"),
+        ):
+            ttk.Radiobutton(frame, text=text, variable=mode_var, value=value).pack(anchor=tk.W, padx=5, pady=2)
+
+        ttk.Label(frame, text="게임 프로세스 이름 (쉼표로 구분, 예: eldenring.exe):").pack(anchor=tk.W, pady=(10, 0))
+        process_entry = ttk.Entry(frame, width=50)
+        process_entry.insert(0, ", ".join(profile_data.get("game_processes", [])))
+        process_entry.pack(fill=tk.X, pady=5)
+
+        speed_frame = ttk.Frame(frame)
+        speed_frame.pack(fill=tk.X)
+        ttk.Label(speed_frame, text="저부하 모드 최대 속도 (MB/s, 0 = 제한 없음):").pack(side=tk.LEFT, padx=(0, 5))
+        speed_entry = ttk.Entry(speed_frame, width=8)
+        speed_entry.insert(0, str(profile_data.get("io_limit_mbps", 20)))
+        speed_entry.pack(side=tk.LEFT)
+
+        ttk.Label(frame, text="백업 내구성 (전원이 꺼졌을 때의 안전성):").pack(anchor=tk.W, pady=(10, 0))
+        durability_var = tk.StringVar(value=resolve_durability(profile_data))
+        for value, text in (
+            (DURABILITY_NONE, "기본 (가장 빠름, 정전 시 최근 세트가 손상될 수 있음)"),
+            (DURABILITY_SET, "세트 단위 (세트의 파일을 한꺼번에 디스크에 기록한 뒤 등록)"),
+            (DURABILITY_PARANOID, "최대 (파일마다 즉시 디스크에 기록, 가장 느림)"),
+        ):
+            ttk.Radiobutton(frame, text=text, variable=durability_var, value=value).pack(anchor=tk.W, padx=5, pady=2)
+
+        def save_io_settings():
+            try:
+                limit_mbps = float(speed_entry.get().strip() or 0)
+            except ValueError:
+                messagebox.showerror("입력 오류", "최대 속도는 숫자로 입력해주세요.", parent=dialog)
+                return
+            profile_data["io_mode"] = mode_var.get()
+            profile_data["game_processes"] = [name.strip() for name in process_entry.get().split(",") if name.strip()]
+            profile_data["io_limit_mbps"] = limit_mbps
+            profile_data["durability"] = durability_var.get()
+            self._save_config()
+            dialog.destroy()
+
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(pady=(10, 0))
+        ttk.Button(button_frame, text="저장", command=save_io_settings).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="취소", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+
+    def _open_storage_dashboard(self):
+        """프로필별 저장 공간 사용량과 가장 큰 백업 세트, 증가 추세를 보여주는 창을 띄웁니다."""
+        profiles = self.config_data.get("profiles", {})
+        if not profiles:
+            messagebox.showinfo("알림", "프로필이 없습니다.")
+            return
+
+        # 통계 파일만 읽으므로 백업 폴더를 탐색하지 않음
+        summaries = {}
+        for profile_name in profiles:
+            try:
+                summaries[profile_name] = get_storage_summary(get_backup_folder_path(profile_name))
+            except Exception as e:
+                print(f"저장 공간 통계 로드 오류 ({profile_name}): {e}")
+
+        dialog = tk.Toplevel(self.root)
+        dialog.title("저장 공간")
+        dialog.geometry("560x480")
+        dialog.transient(self.root)
+        dialog.configure(bg=self.bg_color)
+
+        frame = ttk.Frame(dialog, padding=10)
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        ttk.Label(frame, text="프로필별 사용량", style='Header.TLabel').pack(anchor=tk.W)
+        profiles_tree = ttk.Treeview(frame, columns=("sets", "logical", "physical", "savings"), show="tree headings", height=6)
+        profiles_tree.heading("#0", text="프로필")
+        profiles_tree.heading("sets", text="세트 수")
+        profiles_tree.heading("logical", text="원본 크기")
+        profiles_tree.heading("physical", text="디스크 사용량")
+        profiles_tree.heading("savings", text="절약")
+        profiles_tree.column("#0", width=140, anchor=tk.W)
+        profiles_tree.column("sets", width=60, anchor=tk.E)
+        profiles_tree.column("logical", width=100, anchor=tk.E)
+        profiles_tree.column("physical", width=100, anchor=tk.E)
+        profiles_tree.column("savings", width=90, anchor=tk.E)
+        profiles_tree.pack(fill=tk.X, pady=5)
+
+        total_physical = 0
+        for profile_name, summary in summaries.items():
+            total_physical += summary["physical"]
+            profiles_tree.insert(
+                "", "end",
+                iid=profile_name,
+                text=profile_name,
+                values=(
+                    summary["sets"],
+                    format_size(summary["logical"]),
+                    format_size(summary["physical"]),
+                    format_size(summary["savings"]),
+                )
+            )
+        ttk.Label(frame, text=f"전체 디스크 사용량: {format_size(total_physical)}").pack(anchor=tk.W)
+
+        growth_label = ttk.Label(frame, text="")
+        growth_label.pack(anchor=tk.W, pady=(10, 0))
+
+        ttk.Label(frame, text="가장 큰 백업 세트", style='Header.TLabel').pack(anchor=tk.W, pady=(10, 0))
+        largest_tree = ttk.Treeview(frame, columns=("date", "description", "physical"), show="headings", height=8)
+        largest_tree.heading("date", text="날짜")
+        largest_tree.heading("description", text="설명")
+        largest_tree.heading("physical", text="디스크 사용량")
+        largest_tree.column("date", width=130, anchor=tk.W)
+        largest_tree.column("description", width=260, anchor=tk.W)
+        largest_tree.column("physical", width=100, anchor=tk.E)
+        largest_tree.pack(fill=tk.BOTH, expand=True, pady=5)
+
+        def show_profile(event=None):
+            selected = profiles_tree.selection()
+            if not selected or selected[0] not in summaries:
+                return
+            profile_name = selected[0]
+            summary = summaries[profile_name]
+            growth_per_day = summary["growth_per_day"]
+            cold_entry.delete(0, tk.END)
+            cold_entry.insert(0, f"{profiles[profile_name].get('cold_after_days', 0):g}")
+            growth_label.config(
+                text=f"'{profile_name}' 증가 추세 (최근 30일 기준): 하루 {format_size(growth_per_day)}, "
+                     f"한 달 예상 {format_size(growth_per_day * 30)}"
+            )
+            backup_sets = get_backup_sets(get_backup_folder_path(profile_name))
+            for item in largest_tree.get_children():
+                largest_tree.delete(item)
+            for set_id, entry in summary["largest"]:
+                backup_set = backup_sets.get(set_id, {})
+                largest_tree.insert(
+                    "", "end",
+                    iid=set_id,
+                    values=(entry.get("date", ""), backup_set.get("description", ""), format_size(entry["physical"]))
+                )
+
+        cold_frame = ttk.Frame(frame)
+        cold_frame.pack(fill=tk.X, pady=(5, 0))
+        ttk.Label(cold_frame, text="압축 보관: 지난 일수 (0 = 사용 안 함)").pack(side=tk.LEFT, padx=(0, 5))
+        cold_entry = ttk.Entry(cold_frame, width=6)
+        cold_entry.pack(side=tk.LEFT)
+
+        def save_cold_setting():
+            selected = profiles_tree.selection()
+            if not selected or selected[0] not in profiles:
+                return
+            profile_name = selected[0]
+            try:
+                days = float(cold_entry.get().strip() or 0)
+            except ValueError:
+                messagebox.showerror("입력 오류", "일수는 숫자로 입력해주세요.", parent=dialog)
+                return
+            profile_data = profiles[profile_name]
+            profile_data["cold_after_days"] = days
+            self._save_config()
+            if days:
+                backup_folder = get_backup_folder_path(profile_name)
+                threading.Thread(target=self._run_cold_storage, args=(backup_folder, profile_data), daemon=True).start()
+                messagebox.showinfo(
+                    "압축 보관",
+                    f"{days:g}일이 지난 백업 세트를 백그라운드에서 압축합니다.\n압축된 세트도 평소처럼 복원할 수 있습니다.",
+                    parent=dialog
+                )
+
+        ttk.Button(cold_frame, text="적용", command=save_cold_setting).pack(side=tk.LEFT, padx=5)
+
+        profiles_tree.bind("<<TreeviewSelect>>", show_profile)
+        initial = self.active_profile_name if self.active_profile_name in summaries else next(iter(summaries), None)
+        if initial:
+            profiles_tree.selection_set(initial)
+            show_profile()
+
     def start_auto_refresh(self):
         """파일 목록 자동 새로고침 시작"""
         if self.refresh_thread is None or not self.refresh_thread.is_alive():
@@ -1018,93 +2342,102 @@ class SaveManagerGUI:
                 self.last_refresh_time = current_time
             time.sleep(1)
 
-    def _refresh_file_list(self):
-        """파일 목록 새로고침"""
+    @profiled("gui.refresh_file_list")
+    def _refresh_file_list(self, force=True):
+        """
+        파일 목록 새로고침
+        
+        Parameters:
+        force (bool): False면 폴더 내용과 카탈로그가 바뀌지 않은 경우 캐시된 목록과 검사 결과를 사용 (프로필 전환용)
+        """
         if not self.save_folder or not os.path.isdir(self.save_folder):
             return
 
+        view = self._view
         try:
-            # 현재 선택된 파일들 저장
-            selected_files = [filename for filename, var in self.checkbox_vars.items() if var.get()]
+            names = view.list_save_folder(self.save_folder, force)
+            self.save_files = [os.path.join(self.save_folder, file) for file in names]
+            rendered = (self.save_folder, tuple(names))
 
-            # 기존 체크박스들 제거
-            for widget in self.checkbox_frame.winfo_children():
-                widget.destroy()
-            self.checkbox_vars.clear()
-            self.save_files = []
-
-            # 새로운 파일 목록 추가
-            for file in os.listdir(self.save_folder):
-                if os.path.isfile(os.path.join(self.save_folder, file)):
-                    self.save_files.append(os.path.join(self.save_folder, file))
-                    
-                    # 체크박스 변수 생성
-                    var = tk.BooleanVar(value=file in selected_files)
-                    self.checkbox_vars[file] = var
-                    
-                    # 체크박스와 파일명을 담을 프레임
-                    file_frame = ttk.Frame(self.checkbox_frame)
-                    file_frame.pack(fill=tk.X, padx=5, pady=2)
-                    
-                    # 체크박스 생성
-                    checkbox = ttk.Checkbutton(
-                        file_frame, 
-                        text=file,
-                        variable=var,
-                        style='TCheckbutton'
-                    )
-                    checkbox.pack(side=tk.LEFT, anchor=tk.W)
-                    
-                    # 체크박스 프레임에도 마우스 휠 이벤트 바인딩
-                    def _on_checkbox_mousewheel(event):
-                        self.checkbox_frame.event_generate("<MouseWheel>", delta=event.delta)
-                        return "break"  # 이벤트 전파 중지
-                    file_frame.bind("<MouseWheel>", _on_checkbox_mousewheel)
-                    checkbox.bind("<MouseWheel>", _on_checkbox_mousewheel)
+            # 파일 목록이 그대로면 체크박스(선택 상태 포함)를 다시 만들지 않음
+            if rendered != view.rendered_files:
+                self._render_file_checkboxes(names)
+                view.rendered_files = rendered
 
             # 백업 세트 정보 업데이트
             if self.backup_folder and os.path.isdir(self.backup_folder):
-                backup_sets_file = os.path.join(self.backup_folder, "backup_sets.json")
-                if os.path.exists(backup_sets_file):
-                    try:
-                        with open(backup_sets_file, 'r', encoding='utf-8') as f:
-                            backup_sets_data = json.load(f)
+                try:
+                    backup_sets_data = get_backup_sets(self.backup_folder)
+                    # 최근에 같은 카탈로그를 검사했으면 백업 파일 존재 여부 확인을 건너뜀
+                    if (not force and view.validated_catalog is backup_sets_data
+                            and time.time() - view.validated_at < self.refresh_interval):
+                        return
+                    
+                    # 각 백업 세트의 파일 존재 여부 확인
+                    missing_files = {}
+                    for set_id, backup_set in backup_sets_data.items():
+                        if "files" in backup_set:
+                            missing = [
+                                file for file in backup_set["files"]
+                                if not backup_file_exists(get_backup_file_path(self.backup_folder, file))
+                            ]
+                            if missing:
+                                missing_files[set_id] = missing
+                    
+                    # 파일이 사라진 세트는 삭제하지 않고 손상으로 표시
+                    newly_damaged = mark_damaged_sets(self.backup_folder, missing_files) if missing_files else []
+                    view.validated_catalog = get_backup_sets(self.backup_folder)
+                    view.validated_at = time.time()
                         
-                        # 각 백업 세트의 파일 존재 여부 확인
-                        sets_to_remove = []
-                        for set_id, backup_set in backup_sets_data.items():
-                            if "files" in backup_set:
-                                files_exist = True
-                                for file in backup_set["files"]:
-                                    file_path = os.path.join(self.backup_folder, file)
-                                    if not os.path.exists(file_path):
-                                        files_exist = False
-                                        break
-                                if not files_exist:
-                                    sets_to_remove.append(set_id)
+                    if newly_damaged:
+                        # UI 업데이트
+                        self.load_backup_sets()
                         
-                        # 존재하지 않는 파일이 있는 세트 제거
-                        if sets_to_remove:
-                            for set_id in sets_to_remove:
-                                del backup_sets_data[set_id]
-                            
-                            # 변경된 내용 저장
-                            with open(backup_sets_file, 'w', encoding='utf-8') as f:
-                                json.dump(backup_sets_data, f, ensure_ascii=False, indent=4)
-                            
-                            # UI 업데이트
-                            self.load_backup_sets()
-                            
-                            # 삭제된 세트가 있음을 사용자에게 알림
-                            if len(sets_to_remove) > 0:
-                                messagebox.showinfo(
-                                    "백업 세트 정리",
-                                    f"{len(sets_to_remove)}개의 백업 세트가 삭제되었습니다.\n"
-                                    "삭제된 세트의 파일이 더 이상 존재하지 않습니다."
-                                )
-                    except Exception as e:
-                        print(f"백업 세트 정보 업데이트 중 오류: {e}")
+                        # 새로 손상된 세트가 있음을 사용자에게 알림
+                        messagebox.showwarning(
+                            "백업 세트 손상",
+                            f"{len(newly_damaged)}개의 백업 세트에서 백업 파일이 사라졌습니다.\n"
+                            "해당 세트는 목록에 [손상]으로 표시됩니다."
+                        )
+                except Exception as e:
+                    print(f"백업 세트 정보 업데이트 중 오류: {e}")
 
         except Exception as e:
             print(f"파일 목록 새로고침 중 오류 발생: {e}")
 
+    def _render_file_checkboxes(self, names):
+        """세이브 폴더 파일 목록으로 체크박스를 다시 만듭니다. 기존 선택 상태는 유지합니다."""
+        # 현재 선택된 파일들 저장
+        selected_files = [filename for filename, var in self.checkbox_vars.items() if var.get()]
+
+        # 기존 체크박스들 제거
+        for widget in self.checkbox_frame.winfo_children():
+            widget.destroy()
+        self.checkbox_vars.clear()
+
+        # 새로운 파일 목록 추가
+        for file in names:
+            # 체크박스 변수 생성
+            var = tk.BooleanVar(value=file in selected_files)
+            self.checkbox_vars[file] = var
+
+            # 체크박스와 파일명을 담을 프레임
+            file_frame = ttk.Frame(self.checkbox_frame)
+            file_frame.pack(fill=tk.X, padx=5, pady=2)
+
+            # 체크박스 생성
+            checkbox = ttk.Checkbutton(
+                file_frame, 
+                text=file,
+                variable=var,
+                style='TCheckbutton'
+            )
+            checkbox.pack(side=tk.LEFT, anchor=tk.W)
+
+            # 체크박스 프레임에도 마우스 휠 이벤트 바인딩
+            def _on_checkbox_mousewheel(event):
+                self.checkbox_frame.event_generate("<MouseWheel>", delta=event.delta)
+                return "break"  # 이벤트 전파 중지
+            file_frame.bind("<MouseWheel>", _on_checkbox_mousewheel)
+            checkbox.bind("<MouseWheel>", _on_checkbox_mousewheel)
+
@@ -0,0 +1,180 @@
+import os
+import sys
+import time
+import ctypes
+import platform
+import threading
+import subprocess
+from contextlib import contextmanager
+
+from utils import RateLimiter
+
+# 프로필 설정의 io_mode 값
+IO_MODE_NORMAL = "normal"  # 항상 최대 속도
+IO_MODE_LOW = "low"        # 항상 저부하 모드
+IO_MODE_AUTO = "auto"      # 설정한 게임이 실행 중일 때만 저부하 모드
+
+class IOPolicy:
+    """
+    파일 복사/읽기 속도를 조절하는 정책입니다.
+
+    저부하 모드에서는 토큰 버킷으로 대역폭을 제한하고, 작은 단위로 나누어 읽으며
+    단위마다 잠시 쉬어 게임의 디스크 스트리밍과 경쟁하지 않도록 합니다.
+    low_priority가 True면 작업 스레드의 CPU/I/O 우선순위도 낮춥니다. (UI 스레드는 제외)
+    """
+
+    def __init__(self, max_mbps=None, chunk_size=1024 * 1024, pause=0.0, low_priority=False):
+        self.max_mbps = max_mbps
+        self.limiter = RateLimiter.from_mbps(max_mbps)
+        self.chunk_size = chunk_size
+        self.pause = pause
+        self.low_priority = low_priority
+
+    @classmethod
+    def low_impact(cls, max_mbps=20):
+        """게임 실행 중에 사용할 저부하 정책을 만듭니다."""
+        return cls(max_mbps=max_mbps or None, chunk_size=256 * 1024, pause=0.002, low_priority=True)
+
+    @property
+    def is_throttled(self):
+        return bool(self.max_mbps or self.pause or self.low_priority)
+
+    def throttle(self, nbytes):
+        """nbytes를 읽거나 쓴 뒤 호출하여 속도 제한과 휴식을 적용합니다."""
+        self.limiter.consume(nbytes)
+        if self.pause:
+            time.sleep(self.pause)
+
+    @contextmanager
+    def priority(self):
+        """low_priority인 경우 블록 안에서 현재 작업 스레드의 우선순위를 낮춥니다."""
+        if not self.low_priority or threading.current_thread() is threading.main_thread():
+            yield
+            return
+        restore = _lower_thread_priority()
+        try:
+            yield
+        finally:
+            if restore:
+                restore()
+
+def _lower_thread_priority():
+    """
+    현재 스레드의 CPU/I/O 우선순위를 낮추고, 원래대로 되돌리는 함수를 반환합니다.
+    지원하지 않는 환경에서는 아무것도 하지 않고 None을 반환합니다.
+    """
+    try:
+        if sys.platform == "win32":
+            # THREAD_MODE_BACKGROUND_BEGIN은 CPU와 I/O 우선순위를 함께 낮춤
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.GetCurrentThread()
+            if kernel32.SetThreadPriority(handle, 0x00010000):
+                return lambda: kernel32.SetThreadPriority(handle, 0x00020000)
+            return None
+
+        if sys.platform.startswith("linux"):
+            tid = threading.get_native_id()
+            old_nice = os.getpriority(os.PRIO_PROCESS, tid)
+            os.setpriority(os.PRIO_PROCESS, tid, 19)
+            restore_io = _set_linux_idle_ioprio(tid)
+
+            def restore():
+                if restore_io:
+                    restore_io()
+                try:
+                    os.setpriority(os.PRIO_PROCESS, tid, old_nice)
+                except OSError:
+                    pass # 권한이 없으면 우선순위를 다시 올릴 수 없음 - 스레드 종료 시 사라짐
+            return restore
+    except (OSError, AttributeError):
+        pass
+    return None
+
+# ioprio_get/ioprio_set 시스템 콜 번호
+_IOPRIO_SYSCALLS = {"x86_64": (252, 251), "aarch64": (31, 30)}
+_IOPRIO_WHO_PROCESS = 1
+_IOPRIO_CLASS_IDLE = 3
+_IOPRIO_CLASS_SHIFT = 13
+
+def _set_linux_idle_ioprio(tid):
+    """리눅스에서 스레드의 I/O 스케줄링 클래스를 idle로 바꾸고, 복원 함수를 반환합니다."""
+    numbers = _IOPRIO_SYSCALLS.get(platform.machine())
+    if numbers is None:
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        get_nr, set_nr = numbers
+        old = libc.syscall(get_nr, _IOPRIO_WHO_PROCESS, tid)
+        if old < 0:
+            return None
+        if libc.syscall(set_nr, _IOPRIO_WHO_PROCESS, tid, _IOPRIO_CLASS_IDLE << _IOPRIO_CLASS_SHIFT) != 0:
+            return None
+        return lambda: libc.syscall(set_nr, _IOPRIO_WHO_PROCESS, tid, old)
+    except (OSError, AttributeError):
+        return None
+
+_process_cache = {"time": 0.0, "names": frozenset()}
+_process_cache_lock = threading.Lock()
+
+def _running_process_names():
+    """실행 중인 프로세스 이름(소문자) 집합을 반환합니다."""
+    names = set()
+    if sys.platform == "win32":
+        output = subprocess.run(
+            ["tasklist", "/fo", "csv", "/nh"],
+            capture_output=True, text=True, creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0)
+        ).stdout
+        for line in output.splitlines():
+            if line.startswith('"'):
+                names.add(line.split('","', 1)[0].strip('"').lower())
+    elif os.path.isdir("/proc"):
+        for pid in os.listdir("/proc"):
+            if not pid.isdigit():
+                continue
+            try:
+                with open(f"/proc/{pid}/comm", 'r', encoding='utf-8', errors='replace') as f:
+                    names.add(f.read().strip().lower())
+            except OSError:
+                pass
+    else:
+        output = subprocess.run(["ps", "-axo", "comm="], capture_output=True, text=True).stdout
+        names.update(os.path.basename(line.strip()).lower() for line in output.splitlines())
+    return frozenset(names)
+
+def is_any_process_running(process_names, max_age=5.0):
+    """
+    주어진 이름의 프로세스 중 하나라도 실행 중인지 확인합니다.
+    프로세스 목록은 max_age초 동안 캐시합니다.
+    """
+    wanted = {name.strip().lower() for name in process_names if name.strip()}
+    if not wanted:
+        return False
+    with _process_cache_lock:
+        if time.monotonic() - _process_cache["time"] > max_age:
+            try:
+                _process_cache["names"] = _running_process_names()
+            except Exception as e:
+                print(f"프로세스 목록 확인 중 오류: {e}")
+                _process_cache["names"] = frozenset()
+            _process_cache["time"] = time.monotonic()
+        running = _process_cache["names"]
+    # 리눅스의 comm은 15자로 잘리므로 앞부분 일치도 허용
+    return any(name in running or (len(name) > 15 and name[:15] in running) for name in wanted)
+
+def resolve_io_policy(profile_data):
+    """
+    프로필 설정에 따라 사용할 I/O 정책을 반환합니다. 최대 속도로 진행할 때는 None을 반환합니다.
+
+    프로필 설정:
+    io_mode (str): "normal", "low", "auto" (기본값 "auto")
+    game_processes (list): 감지할 게임 프로세스 이름 (예: ["eldenring.exe"])
+    io_limit_mbps (float): 저부하 모드의 최대 속도 (MB/s)
+    """
+    if not profile_data:
+        return None
+    mode = profile_data.get("io_mode", IO_MODE_AUTO)
+    if mode == IO_MODE_NORMAL:
+        return None
+    if mode == IO_MODE_AUTO and not is_any_process_running(profile_data.get("game_processes", [])):
+        return None
+    return IOPolicy.low_impact(profile_data.get("io_limit_mbps", 20))
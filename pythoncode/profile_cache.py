@@ -0,0 +1,114 @@
+import os
+import threading
+from collections import OrderedDict
+
+from file_manager import add_catalog_listener, remove_catalog_listener
+
+def _folder_key(folder):
+    return os.path.normcase(os.path.abspath(folder))
+
+class ProfileState:
+    """
+    프로필 하나의 화면 상태입니다.
+
+    프로필을 다시 선택할 때 카탈로그를 다시 읽거나 트리뷰/체크박스를 다시 만들지 않도록
+    백업 폴더 경로, 세이브 폴더 파일 목록, 검색 인덱스, 프로필 전용 위젯을 보관합니다.
+    """
+
+    def __init__(self, profile_name, backup_folder):
+        self.profile_name = profile_name
+        self.backup_folder = backup_folder
+
+        # 세이브 폴더 파일 목록 캐시: ((폴더, 폴더 mtime_ns), [파일명])
+        self.listing_key = None
+        self.listing = []
+
+        # 백업 세트 목록 화면 (프로필 전용 트리뷰)
+        self.sets_tree = None
+        self.search_index = None
+        self.tree_catalog = None  # 트리뷰를 채울 때 사용한 카탈로그 객체
+        self.tree_filters = None  # 트리뷰를 채울 때의 검색 조건
+
+        # 백업할 파일 선택 화면 (프로필 전용 체크박스 프레임)
+        self.checkbox_frame = None
+        self.checkbox_vars = {}
+        self.rendered_files = None  # 체크박스를 만든 (세이브 폴더, 파일명 목록)
+
+        # 백업 파일 존재 여부 검사 결과
+        self.validated_catalog = None
+        self.validated_at = 0.0
+
+    def invalidate_view(self):
+        """카탈로그가 바뀌었으므로 다음 표시 때 트리뷰와 파일 검사를 다시 하도록 표시합니다."""
+        self.tree_catalog = None
+        self.validated_catalog = None
+        self.validated_at = 0.0
+
+    def list_save_folder(self, save_folder, force=False):
+        """
+        세이브 폴더 바로 아래의 파일명 목록을 반환합니다.
+        폴더의 수정 시각이 그대로면 (파일 추가/삭제/이름 변경이 없으면) 캐시된 목록을 사용합니다.
+        force가 True면 항상 폴더를 다시 읽습니다. (수정 시각 해상도가 낮은 파일 시스템 대비)
+        """
+        key = (save_folder, os.stat(save_folder).st_mtime_ns)
+        if force or key != self.listing_key:
+            self.listing = [
+                file for file in os.listdir(save_folder)
+                if os.path.isfile(os.path.join(save_folder, file))
+            ]
+            self.listing_key = key
+        return self.listing
+
+class ProfileStateCache:
+    """
+    최근에 사용한 프로필 상태를 LRU 순서로 보관합니다.
+
+    백업 세트가 추가/삭제/변경되면 (카탈로그 리스너) 해당 백업 폴더의 상태를 무효화하고,
+    용량을 넘으면 가장 오래 사용하지 않은 상태를 on_evict로 넘긴 뒤 버립니다. (위젯 정리용)
+    """
+
+    def __init__(self, capacity=12, on_evict=None):
+        self.capacity = capacity
+        self.on_evict = on_evict
+        self._states = OrderedDict()
+        self._lock = threading.Lock()
+        add_catalog_listener(self._on_catalog_change)
+
+    def get(self, profile_name):
+        """프로필 상태를 반환하고 가장 최근 사용으로 표시합니다. 없으면 None."""
+        with self._lock:
+            state = self._states.get(profile_name)
+            if state is not None:
+                self._states.move_to_end(profile_name)
+            return state
+
+    def put(self, state):
+        """프로필 상태를 추가합니다. 용량을 넘으면 가장 오래된 상태를 내보냅니다."""
+        evicted = []
+        with self._lock:
+            self._states[state.profile_name] = state
+            self._states.move_to_end(state.profile_name)
+            while len(self._states) > self.capacity:
+                evicted.append(self._states.popitem(last=False)[1])
+        for old in evicted:
+            if self.on_evict:
+                self.on_evict(old)
+        return state
+
+    def discard(self, profile_name):
+        """프로필 상태를 제거합니다. (프로필 삭제 등)"""
+        with self._lock:
+            state = self._states.pop(profile_name, None)
+        if state is not None and self.on_evict:
+            self.on_evict(state)
+
+    def close(self):
+        remove_catalog_listener(self._on_catalog_change)
+
+    def _on_catalog_change(self, backup_folder, event, set_id, backup_set):
+        # 백업/복제/압축 스레드에서도 호출되므로 표시만 하고 위젯은 건드리지 않음
+        key = _folder_key(backup_folder)
+        with self._lock:
+            for state in self._states.values():
+                if _folder_key(state.backup_folder) == key:
+                    state.invalidate_view()
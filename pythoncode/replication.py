@@ -0,0 +1,347 @@
+import os
+import json
+import shutil
+import tempfile
+import threading
+
+from file_manager import (
+    get_backup_sets, get_set_manifest, add_catalog_listener, remove_catalog_listener,
+    resolve_backup_file, get_backup_file_path, backup_file_locations, collect_chunk_garbage,
+    BACKUP_SETS_FILE, COLD_SUFFIX, SETS_DIR
+)
+from chunk_store import ChunkStore, CHUNKED_SUFFIX, read_recipe, recipe_digests
+from utils import RateLimiter, atomic_write_bytes, atomic_write_json, sparse_map, iter_data_chunks
+
+MIRROR_QUEUE_FILE = "mirror_queue.jsonl"
+MIRROR_OFFSET_FILE = "mirror_queue.offset"
+
+def _folder_key(backup_folder):
+    return os.path.normcase(os.path.abspath(backup_folder))
+
+def _mirror_folder(mirror_root, backup_folder):
+    """미러 루트 아래에 프로필 백업 폴더와 같은 이름의 폴더를 사용합니다."""
+    return os.path.join(mirror_root, os.path.basename(os.path.normpath(backup_folder)))
+
+# 미러 파일의 수정 시각 비교 허용 오차 (FAT 등 시각을 2초 단위로 기록하는 파일 시스템)
+_MTIME_TOLERANCE_NS = 2 * 1000 * 1000 * 1000
+
+def _same_file(src, dst):
+    """
+    미러의 파일이 백업 파일과 같은지 크기와 수정 시각으로 확인합니다.
+    미러에는 수정 시각까지 복사하므로(copystat), 크기가 같아도 수정 시각이 다르면 다른 파일로 봅니다.
+    """
+    try:
+        src_stat = os.stat(src)
+        dst_stat = os.stat(dst)
+    except OSError:
+        return False
+    return (src_stat.st_size == dst_stat.st_size
+            and abs(src_stat.st_mtime_ns - dst_stat.st_mtime_ns) <= _MTIME_TOLERANCE_NS)
+
+def _copy_throttled(src, dst, limiter, chunk_size=1024 * 1024, stop_event=None):
+    """
+    제한 속도로 파일을 임시 파일에 복사한 뒤 rename하여, 미러에 반쯤 쓰인 파일이 남지 않게 합니다.
+    희소 파일은 데이터 구간만 전송하고 미러에도 구멍을 남깁니다.
+    임시 파일은 복사마다 다른 이름을 사용하므로 같은 파일을 동시에 복사해도 서로의 임시 파일을 덮어쓰지 않습니다.
+    stop_event가 설정되면 복사를 중단하고 임시 파일을 지운 뒤 False를 반환합니다. 복사를 마치면 True.
+    """
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(dst) + ".", suffix=".part", dir=os.path.dirname(dst))
+    stopped = False
+    try:
+        with open(src, 'rb') as fsrc, os.fdopen(fd, 'wb') as fdst:
+            layout = sparse_map(fsrc)
+            for offset, chunk in iter_data_chunks(fsrc, chunk_size, layout):
+                if stop_event is not None and stop_event.is_set():
+                    stopped = True
+                    break
+                limiter.consume(len(chunk))
+                if offset != fdst.tell():
+                    fdst.seek(offset)
+                fdst.write(chunk)
+            if layout is not None and not stopped:
+                fdst.truncate(layout[0])
+        if stopped:
+            os.remove(tmp_path)
+            return False
+        shutil.copystat(src, tmp_path)
+        os.replace(tmp_path, dst)
+        return True
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+class MirrorReplicator:
+    """
+    한 프로필의 백업 폴더를 하나 이상의 보조 폴더(두 번째 디스크, NAS 등)로 비동기 복제합니다.
+
+    새 백업 세트와 삭제 내역은 백업 폴더의 mirror_queue.jsonl에 한 줄씩 추가만 하므로
+    백업 작업 자체는 느려지지 않습니다. 백그라운드 스레드가 큐를 순서대로 처리하며,
+    처리 위치는 mirror_queue.offset에 저장되어 프로그램을 다시 시작해도 이어서 진행합니다.
+    미러에 이미 같은 크기와 수정 시각의 파일이 있으면 다시 전송하지 않습니다.
+    콜드 보관된 세트는 압축 사본을 복제하고, 미러에 남은 압축 전 파일은 지웁니다.
+    """
+
+    def __init__(self, backup_folder, mirror_roots, max_mbps=None, retry_interval=30.0):
+        self.backup_folder = backup_folder
+        self.mirror_roots = list(mirror_roots)
+        self.limiter = RateLimiter.from_mbps(max_mbps)
+        self.retry_interval = retry_interval
+        self.queue_file = os.path.join(backup_folder, MIRROR_QUEUE_FILE)
+        self.offset_file = os.path.join(backup_folder, MIRROR_OFFSET_FILE)
+        self._queue_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """복제 스레드를 시작합니다. 남아 있는 큐가 있으면 바로 처리합니다."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        self._wake.set()
+
+    def stop(self, timeout=1.0):
+        """
+        복제 스레드를 중지합니다. 처리하지 못한 항목은 큐에 남습니다.
+        전송 중인 파일은 다음 조각을 복사하기 전에 중단합니다. timeout이 None이면 스레드가 끝날 때까지 기다립니다.
+        """
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+
+    def enqueue(self, op, set_id=None, files=None):
+        """
+        복제 작업을 큐에 추가합니다.
+
+        Parameters:
+        op (str): "put" (세트 복제), "delete" (세트 파일 삭제), "sync" (전체 세트 복제)
+        set_id (str, optional): 백업 세트 ID
+        files (list, optional): 삭제할 백업 파일 목록 ("delete"일 때)
+        """
+        event = {"op": op, "set_id": set_id}
+        if files is not None:
+            event["files"] = files
+        line = json.dumps(event, ensure_ascii=False) + "\n"
+        with self._queue_lock:
+            with open(self.queue_file, 'a', encoding='utf-8') as f:
+                f.write(line)
+        self._wake.set()
+
+    def pending_count(self):
+        """아직 처리되지 않은 큐 항목 수를 반환합니다."""
+        with self._queue_lock:
+            return len(self._read_pending()[0])
+
+    def _read_offset(self):
+        try:
+            with open(self.offset_file, 'r', encoding='utf-8') as f:
+                return int(json.load(f))
+        except (OSError, ValueError, TypeError):
+            return 0
+
+    def _read_pending(self):
+        """(처리할 (다음 오프셋, 이벤트) 목록, 시작 오프셋)을 반환합니다."""
+        offset = self._read_offset()
+        events = []
+        try:
+            with open(self.queue_file, 'rb') as f:
+                f.seek(offset)
+                position = offset
+                for raw in f:
+                    position += len(raw)
+                    if not raw.endswith(b"\n"):
+                        break # 아직 다 쓰이지 않은 줄
+                    try:
+                        events.append((position, json.loads(raw.decode('utf-8'))))
+                    except ValueError:
+                        events.append((position, None)) # 손상된 줄은 건너뜀
+        except FileNotFoundError:
+            pass
+        return events, offset
+
+    def _compact(self):
+        """모든 항목을 처리했으면 큐 파일을 비웁니다."""
+        with self._queue_lock:
+            events, offset = self._read_pending()
+            if not events and offset > 0:
+                with open(self.queue_file, 'w', encoding='utf-8'):
+                    pass
+                atomic_write_json(self.offset_file, 0)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(timeout=self.retry_interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            try:
+                self._process_queue()
+            except Exception as e:
+                # 미러가 연결되지 않은 경우 등 - 다음 주기에 다시 시도
+                print(f"미러 복제 중 오류 (다음에 재시도): {e}")
+
+    def _process_queue(self):
+        with self._queue_lock:
+            events, _ = self._read_pending()
+        for next_offset, event in events:
+            if self._stop.is_set():
+                return
+            if event is not None:
+                self._apply(event)
+                if self._stop.is_set():
+                    return # 중간에 중단된 항목은 다음 복제기가 처음부터 다시 처리
+            atomic_write_json(self.offset_file, next_offset)
+        if events:
+            self._sync_catalogs()
+            self._compact()
+
+    def _apply(self, event):
+        op = event.get("op")
+        backup_sets = get_backup_sets(self.backup_folder)
+        if op == "sync":
+            for backup_set in list(backup_sets.values()):
+                if isinstance(backup_set, dict):
+                    self._put_set(backup_set)
+        elif op == "put":
+            backup_set = backup_sets.get(event.get("set_id"))
+            if isinstance(backup_set, dict): # 이미 삭제된 세트는 건너뜀
+                self._put_set(backup_set)
+        elif op == "delete":
+            self._delete_files(event.get("set_id"), event.get("files") or [])
+
+    def _put_set(self, backup_set):
+        for entry in get_set_manifest(self.backup_folder, backup_set, with_hash=False):
+            src = resolve_backup_file(get_backup_file_path(self.backup_folder, entry["file"]))
+            if not os.path.exists(src):
+                continue
+            # 미러에도 백업 폴더와 같은 위치(세트 폴더 또는 이전 형식)와 형태(원본 또는 콜드 보관 사본)로 저장
+            stored_file = os.path.relpath(src, self.backup_folder)
+            for mirror_root in self.mirror_roots:
+                if self._stop.is_set():
+                    return
+                mirror_folder = _mirror_folder(mirror_root, self.backup_folder)
+                dst = os.path.join(mirror_folder, stored_file)
+                # 미러에 이미 같은 파일(크기와 수정 시각)이 있으면 전송하지 않음
+                if _same_file(src, dst):
+                    continue
+                # 위치나 형태가 바뀐 파일은 미러에 남은 이전 사본을 지움
+                for location in backup_file_locations(entry["file"]):
+                    for name in (location, location + COLD_SUFFIX, location + CHUNKED_SUFFIX):
+                        if name == stored_file:
+                            continue
+                        try:
+                            os.remove(os.path.join(mirror_folder, name))
+                        except FileNotFoundError:
+                            pass
+                # 조각으로 저장된 파일은 미러에 없는 조각을 먼저 복제한 뒤 레시피를 복제
+                if src.endswith(CHUNKED_SUFFIX) and not self._put_chunks(src, mirror_folder):
+                    return
+                os.makedirs(os.path.dirname(dst), exist_ok=True)
+                if not _copy_throttled(src, dst, self.limiter, stop_event=self._stop):
+                    return
+
+    def _put_chunks(self, recipe_path, mirror_folder):
+        """미러에 없는 조각을 복제합니다. 중지 요청으로 중단하면 False를 반환합니다."""
+        store = ChunkStore(self.backup_folder)
+        mirror_store = ChunkStore(mirror_folder)
+        for digest in recipe_digests(read_recipe(recipe_path)):
+            if mirror_store.touch(digest):
+                continue
+            dst = mirror_store.path(digest)
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            if not _copy_throttled(store.path(digest), dst, self.limiter, stop_event=self._stop):
+                return False
+        return True
+
+    def _delete_files(self, set_id, files):
+        for mirror_root in self.mirror_roots:
+            mirror_folder = _mirror_folder(mirror_root, self.backup_folder)
+            # 세트 폴더는 폴더째 삭제하고, 이전 형식으로 저장된 파일만 하나씩 삭제
+            if set_id:
+                set_folder = os.path.join(mirror_folder, SETS_DIR, set_id)
+                try:
+                    chunked = any(name.endswith(CHUNKED_SUFFIX) for name in os.listdir(set_folder))
+                except OSError:
+                    chunked = False
+                shutil.rmtree(set_folder, ignore_errors=True)
+                if chunked:
+                    collect_chunk_garbage(mirror_folder)
+            for file in files:
+                for name in (file, file + COLD_SUFFIX):
+                    try:
+                        os.remove(os.path.join(mirror_folder, name))
+                    except FileNotFoundError:
+                        pass
+
+    def _sync_catalogs(self):
+        """현재 카탈로그를 미러에 원자적으로 기록합니다."""
+        catalog = os.path.join(self.backup_folder, BACKUP_SETS_FILE)
+        if not os.path.exists(catalog):
+            return
+        with open(catalog, 'rb') as f:
+            data = f.read()
+        for mirror_root in self.mirror_roots:
+            mirror_folder = _mirror_folder(mirror_root, self.backup_folder)
+            os.makedirs(mirror_folder, exist_ok=True)
+            atomic_write_bytes(os.path.join(mirror_folder, BACKUP_SETS_FILE), data)
+
+class MirrorManager:
+    """
+    프로필별 MirrorReplicator를 관리하고, 백업 세트 추가/삭제를 각 복제기의 큐로 전달합니다.
+    """
+
+    def __init__(self):
+        self._replicators = {}
+        self._lock = threading.Lock()
+        self._configure_lock = threading.Lock() # 설정 변경을 하나씩 적용 (이전 복제기가 끝난 뒤 새 복제기 시작)
+        add_catalog_listener(self._on_catalog_change)
+
+    def configure(self, backup_folder, mirror_roots, max_mbps=None, initial_sync=False):
+        """
+        백업 폴더의 미러 설정을 적용합니다. mirror_roots가 비어 있으면 복제를 중지합니다.
+        initial_sync가 True면 기존 세트 전체를 미러에 복제합니다.
+        """
+        key = _folder_key(backup_folder)
+        with self._configure_lock:
+            with self._lock:
+                old = self._replicators.pop(key, None)
+            # 이전 복제기가 완전히 끝난 뒤 시작해야 같은 미러에 두 복제기가 동시에 기록하지 않음
+            # (복제 스레드가 카탈로그 알림으로 get을 호출할 수 있으므로 _lock 밖에서 기다림)
+            if old is not None:
+                old.stop(timeout=None)
+            if not mirror_roots:
+                return None
+            replicator = MirrorReplicator(backup_folder, mirror_roots, max_mbps)
+            with self._lock:
+                self._replicators[key] = replicator
+        if initial_sync:
+            replicator.enqueue("sync")
+        replicator.start()
+        return replicator
+
+    def get(self, backup_folder):
+        with self._lock:
+            return self._replicators.get(_folder_key(backup_folder))
+
+    def stop_all(self):
+        with self._lock:
+            replicators = list(self._replicators.values())
+            self._replicators.clear()
+        for replicator in replicators:
+            replicator.stop()
+        remove_catalog_listener(self._on_catalog_change)
+
+    def _on_catalog_change(self, backup_folder, event, set_id, backup_set):
+        replicator = self.get(backup_folder)
+        if replicator is None:
+            return
+        if event in ("added", "updated"):
+            replicator.enqueue("put", set_id)
+        elif event == "removed":
+            files = [entry["file"] for entry in get_set_manifest(backup_folder, backup_set, with_hash=False)]
+            replicator.enqueue("delete", set_id, files)
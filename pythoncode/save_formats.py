@@ -0,0 +1,117 @@
+import struct
+import zipfile
+
+# 형식을 확인하기 위해 읽는 파일 앞부분의 크기
+HEADER_SIZE = 100
+# SQLite 페이지를 묶어 조각 하나로 저장하는 크기 (작은 페이지마다 파일을 만들지 않도록)
+SQLITE_CHUNK_SIZE = 64 * 1024
+
+class SaveFormatError(ValueError):
+    """세이브 파일을 형식에 맞게 나눌 수 없을 때 발생합니다. (일반 복사로 백업)"""
+
+class SaveFormatHandler:
+    """
+    압축 컨테이너 세이브 파일의 형식 처리기입니다.
+
+    split은 파일을 원래 바이트 순서대로 ("raw", 데이터) 조각으로 나누며, 빠뜨리거나 겹치는 바이트가 없습니다.
+    따라서 조각을 차례로 이어 붙이면 원본과 바이트 단위로 같은 파일이 되고,
+    조각의 해시만으로 원본 전체의 해시를 계산할 수 있습니다.
+    """
+    name = None
+
+    def detect(self, header):
+        """파일 앞부분(HEADER_SIZE 바이트)으로 이 형식인지 확인합니다."""
+        raise NotImplementedError
+
+    def split(self, f):
+        """열린 파일을 조각으로 나누어 차례로 반환합니다. 나눌 수 없으면 SaveFormatError가 발생합니다."""
+        raise NotImplementedError
+
+def _read_exact(f, offset, length):
+    f.seek(offset)
+    data = f.read(length)
+    if len(data) != length:
+        raise SaveFormatError("파일이 예상보다 짧습니다.")
+    return data
+
+class ZipHandler(SaveFormatHandler):
+    """
+    zip 컨테이너 세이브입니다. 항목 경계에서 나누어, 항목 하나만 바뀌어도 파일 전체가 새 조각이 되지 않게 합니다.
+    항목은 압축된 원래 바이트 그대로 저장합니다. (압축을 풀어 저장하면 복원할 때 다시 압축한 결과가
+    zlib 빌드(zlib-ng, 다른 배포판/운영체제)에 따라 달라져 다른 컴퓨터에서 복원하지 못할 수 있음)
+    바뀌지 않은 항목은 압축된 바이트도 같으므로 이전 백업의 조각을 그대로 함께 사용합니다.
+    """
+    name = "zip"
+
+    def detect(self, header):
+        return header.startswith(b"PK\x03\x04")
+
+    def split(self, f):
+        try:
+            with zipfile.ZipFile(f) as archive:
+                infos = sorted(archive.infolist(), key=lambda info: info.header_offset)
+        except (zipfile.BadZipFile, OSError, EOFError) as e:
+            raise SaveFormatError(f"zip 파일을 읽을 수 없습니다: {e}")
+
+        cursor = 0
+        for info in infos:
+            start = info.header_offset
+            header = _read_exact(f, start, 30)
+            # 앞에 다른 데이터가 붙은 파일 등 오프셋이 맞지 않으면 나누지 않음
+            if start < cursor or header[:4] != b"PK\x03\x04":
+                raise SaveFormatError(f"zip 항목 위치가 올바르지 않습니다: {info.filename}")
+            name_length, extra_length = struct.unpack_from("<HH", header, 26)
+            data_start = start + 30 + name_length + extra_length
+            # 이전 항목 뒤의 데이터 디스크립터와 이번 항목의 로컬 헤더
+            yield ("raw", _read_exact(f, cursor, data_start - cursor))
+            yield ("raw", _read_exact(f, data_start, info.compress_size))
+            cursor = data_start + info.compress_size
+
+        # 마지막 항목 뒤 (중앙 디렉터리, 주석)
+        f.seek(cursor)
+        yield ("raw", f.read())
+
+class SQLiteHandler(SaveFormatHandler):
+    """
+    SQLite 데이터베이스 세이브입니다. 페이지 경계에 맞춰 나누므로 바뀐 페이지가 있는 조각만 새로 저장됩니다.
+    (헤더의 변경 카운터가 있는 첫 조각은 저장할 때마다 바뀜)
+    """
+    name = "sqlite"
+
+    def detect(self, header):
+        return header.startswith(b"SQLite format 3\x00")
+
+    def split(self, f):
+        header = _read_exact(f, 0, HEADER_SIZE)
+        page_size = struct.unpack_from(">H", header, 16)[0]
+        if page_size == 1:
+            page_size = 65536
+        if page_size < 512 or page_size & (page_size - 1):
+            raise SaveFormatError(f"SQLite 페이지 크기가 올바르지 않습니다: {page_size}")
+        chunk_size = max(page_size, SQLITE_CHUNK_SIZE // page_size * page_size)
+        f.seek(0)
+        while True:
+            data = f.read(chunk_size)
+            if not data:
+                break
+            yield ("raw", data)
+
+_handlers = []
+
+def register_format_handler(handler):
+    """형식 처리기를 등록합니다. 먼저 등록한 처리기를 먼저 확인합니다."""
+    _handlers.append(handler)
+
+def detect_save_format(file_path):
+    """
+    세이브 파일의 형식 처리기를 반환합니다. 나누어 저장할 형식이 아니면 None.
+    """
+    with open(file_path, 'rb') as f:
+        header = f.read(HEADER_SIZE)
+    for handler in _handlers:
+        if handler.detect(header):
+            return handler
+    return None
+
+register_format_handler(ZipHandler())
+register_format_handler(SQLiteHandler())
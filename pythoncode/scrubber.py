@@ -0,0 +1,194 @@
+import os
+import time
+import json
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from file_manager import (
+    get_backup_sets, mark_damaged_sets, open_backup_file, get_backup_file_path, resolve_backup_file, backup_set_lock
+)
+from chunk_store import ChunkedReader
+from utils import RateLimiter, atomic_write_json, advise_sequential, drop_page_cache, iter_content_chunks
+
+SCRUB_STATE_FILE = "scrub_state.json"
+# 검사하는 동안 파일이 옮겨지거나 바뀌었을 때 다시 검사하는 횟수 (넘으면 다음 검사로 미룸)
+_CHECK_ATTEMPTS = 3
+
+def _stored_identity(backup_folder, file):
+    """
+    백업 파일의 경로와, 실제로 저장된 경로(콜드 보관 사본, 레시피 포함)의 (경로, inode, 크기, 수정 시각)을 반환합니다.
+    없으면 FileNotFoundError가 발생합니다. (backup_set_lock 안에서 호출)
+    """
+    file_path = get_backup_file_path(backup_folder, file)
+    stored_path = resolve_backup_file(file_path)
+    st = os.stat(stored_path)
+    return file_path, (stored_path, st.st_ino, st.st_size, st.st_mtime_ns)
+
+def _hash_limited(file_path, limiter, chunk_size, stop_event, io_policy=None):
+    """
+    제한 속도로 파일을 순차적으로 읽어 SHA-256 해시를 계산합니다. 중단되면 None을 반환합니다.
+    콜드 보관된 파일은 압축을 푼 내용으로 계산하고, 희소 파일의 구멍은 읽지 않습니다. (속도 제한에서도 제외)
+    조각으로 저장된 파일은 조립한 내용으로 계산하며, 조각이 손상되었으면 ChunkCorruptError(OSError)가 발생합니다.
+    """
+    hasher = hashlib.sha256()
+    with open_backup_file(file_path) as f:
+        # 조립해서 읽는 파일은 캐시를 조절할 파일 디스크립터가 없음
+        fd = None if isinstance(f, ChunkedReader) else f.fileno()
+        # 백업 폴더 전체를 읽어도 페이지 캐시가 밀려나지 않도록 읽은 파일은 캐시에서 내보냄
+        if fd is not None:
+            advise_sequential(fd)
+        for chunk, from_disk in iter_content_chunks(f, chunk_size):
+            if stop_event is not None and stop_event.is_set():
+                if fd is not None:
+                    drop_page_cache(fd)
+                return None
+            if from_disk:
+                limiter.consume(len(chunk))
+                if io_policy is not None:
+                    io_policy.throttle(len(chunk))
+            hasher.update(chunk)
+        if fd is not None:
+            drop_page_cache(fd)
+    return hasher.hexdigest()
+
+def load_scrub_state(backup_folder):
+    """마지막 검사 상태(체크포인트)를 불러옵니다. 없으면 None을 반환합니다."""
+    try:
+        with open(os.path.join(backup_folder, SCRUB_STATE_FILE), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def scrub_backup_folder(backup_folder, max_mbps=None, workers=4, chunk_size=4 * 1024 * 1024,
+                        stop_event=None, progress_callback=None, checkpoint_interval=5.0, io_policy=None):
+    """
+    백업 파일을 다시 읽어 매니페스트에 기록된 해시와 비교하는 무결성 검사를 실행합니다.
+    
+    - 여러 스레드가 큰 단위로 순차 읽기를 하며, 전체 읽기 속도는 max_mbps로 제한합니다.
+    - 진행 상태를 scrub_state.json에 주기적으로 기록하므로, 중단된 검사는 다음 실행 시 이어서 진행합니다.
+    - 손상되거나 사라진 파일이 있는 세트는 카탈로그에서 지우지 않고 "damaged"로 표시합니다.
+    
+    Parameters:
+    backup_folder (str): 백업 폴더 경로
+    max_mbps (float, optional): 최대 읽기 속도 (MB/s). None이면 제한 없음
+    workers (int): 동시에 검사할 파일 수
+    chunk_size (int): 한 번에 읽을 바이트 수
+    stop_event (threading.Event, optional): 설정되면 체크포인트를 남기고 중단
+    progress_callback (callable, optional): (검사한 파일 수, 전체 파일 수)로 호출
+    checkpoint_interval (float): 체크포인트 기록 간격 (초)
+    io_policy (IOPolicy, optional): 게임 실행 중 적용할 저부하 I/O 정책 (작업 스레드 우선순위도 낮춤)
+    
+    Returns:
+    dict: {"completed", "checked", "total", "ok", "damaged": {세트 ID: [파일]}, "unverifiable"}
+    """
+    state_file = os.path.join(backup_folder, SCRUB_STATE_FILE)
+    backup_sets = get_backup_sets(backup_folder)
+
+    # 검사할 파일 목록 (같은 백업 파일은 한 번만 검사)
+    tasks = {}
+    unverifiable = 0
+    for set_id, backup_set in backup_sets.items():
+        # 매니페스트가 없는 이전 형식의 세트는 변환(migrate_backup_sets) 후 검사 가능
+        if not isinstance(backup_set, dict) or not isinstance(backup_set.get("manifest"), list):
+            continue
+        for entry in backup_set["manifest"]:
+            if not entry.get("hash"):
+                unverifiable += 1
+                continue
+            task = tasks.setdefault(entry["file"], {"hash": entry["hash"], "sets": []})
+            task["sets"].append(set_id)
+
+    # 이전에 완료되지 않은 검사가 있으면 이어서 진행
+    state = load_scrub_state(backup_folder)
+    if not state or state.get("completed", True):
+        state = {"started": time.time(), "completed": False, "results": {}}
+    results = state["results"]
+    pending = [file for file in tasks if file not in results]
+
+    limiter = RateLimiter.from_mbps(max_mbps)
+    lock = threading.Lock()
+    last_checkpoint = [time.monotonic()]
+    total = len(tasks)
+
+    def save_checkpoint():
+        try:
+            atomic_write_json(state_file, state)
+        except Exception as e:
+            print(f"검사 상태 저장 중 오류: {e}")
+
+    def check(file):
+        if stop_event is not None and stop_event.is_set():
+            return
+        # 속도 제한으로 오래 걸리는 해시 계산 동안에는 세트 잠금을 잡지 않음 (삭제/복원이 기다리지 않도록)
+        # 대신 위치는 잠금 안에서 확인하고, 계산한 뒤 파일이 옮겨지거나(세트 폴더, 콜드 보관) 바뀌었으면 다시 검사
+        for _ in range(_CHECK_ATTEMPTS):
+            try:
+                with backup_set_lock(backup_folder, [file]):
+                    file_path, identity = _stored_identity(backup_folder, file)
+            except FileNotFoundError:
+                status = "missing" # 잠금 안에서도 없으면 정말 없는 파일
+                break
+            try:
+                if io_policy is not None:
+                    with io_policy.priority():
+                        actual = _hash_limited(file_path, limiter, min(chunk_size, io_policy.chunk_size), stop_event, io_policy)
+                else:
+                    actual = _hash_limited(file_path, limiter, chunk_size, stop_event)
+            except FileNotFoundError:
+                continue # 계산하는 동안 옮겨지거나 지워짐 - 잠금 안에서 다시 확인
+            except OSError:
+                status = "unreadable"
+                break
+            if actual is None:
+                return # 중단됨 - 결과를 남기지 않아 다음에 다시 검사
+            try:
+                with backup_set_lock(backup_folder, [file]):
+                    unchanged = _stored_identity(backup_folder, file)[1] == identity
+            except FileNotFoundError:
+                unchanged = False
+            if unchanged:
+                status = "ok" if actual == tasks[file]["hash"] else "corrupt"
+                break
+        else:
+            return # 검사할 때마다 바뀜 - 결과를 남기지 않아 다음에 다시 검사
+        with lock:
+            results[file] = status
+            checked = len(results)
+            if time.monotonic() - last_checkpoint[0] >= checkpoint_interval:
+                last_checkpoint[0] = time.monotonic()
+                save_checkpoint()
+        if progress_callback:
+            progress_callback(checked, total)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        list(executor.map(check, pending))
+
+    completed = all(file in results for file in tasks)
+    damaged = {}
+    current_sets = get_backup_sets(backup_folder) # 검사하는 동안 삭제된 세트는 보고하지 않음
+    for file, task in tasks.items():
+        if results.get(file, "ok") != "ok":
+            for set_id in task["sets"]:
+                if set_id in current_sets:
+                    damaged.setdefault(set_id, []).append(file)
+
+    if completed:
+        # 전체 검사가 끝났으면 모든 세트의 손상 표시를 새 결과로 교체
+        damaged_by_set = {set_id: [] for set_id in backup_sets}
+        damaged_by_set.update(damaged)
+        mark_damaged_sets(backup_folder, damaged_by_set, replace=True)
+        state["completed"] = True
+        state["finished"] = time.time()
+    elif damaged:
+        mark_damaged_sets(backup_folder, damaged)
+    save_checkpoint()
+
+    return {
+        "completed": completed,
+        "checked": len([file for file in tasks if file in results]),
+        "total": total,
+        "ok": sum(1 for file in tasks if results.get(file) == "ok"),
+        "damaged": damaged,
+        "unverifiable": unverifiable,
+    }
@@ -0,0 +1,140 @@
+import re
+import bisect
+import fnmatch
+
+from file_manager import get_set_original_paths
+
+_TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+def tokenize(text):
+    """문자열을 소문자 토큰 목록으로 분리합니다. (한글 포함)"""
+    return _TOKEN_PATTERN.findall(str(text).lower())
+
+class BackupSetIndex:
+    """
+    백업 세트 검색을 위한 메모리 인덱스입니다.
+
+    설명, 날짜, 파일명, 태그를 토큰 단위로 색인하고, 검색어의 각 단어를
+    접두어로 취급하여 모든 단어를 포함하는 세트만 반환합니다.
+    카탈로그를 다시 읽지 않고 메모리에서만 검색하므로 입력할 때마다 바로 필터링할 수 있습니다.
+    """
+
+    def __init__(self, backup_sets):
+        # 인덱스를 만든 카탈로그 (캐시된 카탈로그가 바뀌지 않았으면 인덱스를 재사용)
+        self.source = backup_sets
+        # 토큰 -> 세트 ID 집합
+        self._postings = {}
+        # 접두어 검색을 위한 정렬된 토큰 목록
+        self._tokens = []
+        # (날짜, 세트 ID) 정렬 목록 - 날짜 범위 검색용
+        self._dates = []
+        # 원본 파일명(소문자) -> 세트 ID 집합 - 파일명 필터용
+        self._file_names = {}
+        # 최신순 세트 ID 목록 (결과 정렬용)
+        self.order = []
+        self._prefix_cache = {}
+
+        for set_id, backup_set in backup_sets.items():
+            if not isinstance(backup_set, dict):
+                continue
+            self.order.append(set_id)
+
+            date = str(backup_set.get("date", ""))
+            self._dates.append((date, set_id))
+
+            tokens = set(tokenize(backup_set.get("description", "")))
+            tokens.update(tokenize(date))
+            # 날짜는 "2025-04-01" 형태로도 검색 가능하도록 추가
+            if date:
+                tokens.add(date[:10])
+            for tag in backup_set.get("tags", []) or []:
+                tokens.update(tokenize(tag))
+            for file_name in get_set_original_paths(backup_set):
+                lowered = file_name.lower()
+                self._file_names.setdefault(lowered, set()).add(set_id)
+                tokens.add(lowered)
+                tokens.update(tokenize(lowered))
+
+            for token in tokens:
+                self._postings.setdefault(token, set()).add(set_id)
+
+        self.order.sort(reverse=True)
+        self._dates.sort()
+        self._tokens = sorted(self._postings)
+
+    def __len__(self):
+        return len(self.order)
+
+    def _match_prefix(self, prefix):
+        """접두어로 시작하는 토큰을 가진 세트 ID 집합을 반환합니다."""
+        cached = self._prefix_cache.get(prefix)
+        if cached is not None:
+            return cached
+
+        result = set()
+        start = bisect.bisect_left(self._tokens, prefix)
+        for i in range(start, len(self._tokens)):
+            token = self._tokens[i]
+            if not token.startswith(prefix):
+                break
+            result |= self._postings[token]
+
+        # 입력 중 반복되는 접두어 검색을 위해 최근 결과만 보관
+        if len(self._prefix_cache) > 256:
+            self._prefix_cache.clear()
+        self._prefix_cache[prefix] = result
+        return result
+
+    def _match_dates(self, date_from, date_to):
+        """날짜 범위(YYYY-MM-DD 문자열, 양 끝 포함)에 해당하는 세트 ID 집합을 반환합니다."""
+        lo = bisect.bisect_left(self._dates, (date_from or "",))
+        if date_to:
+            # 해당 날짜의 마지막 시각까지 포함
+            hi = bisect.bisect_right(self._dates, (date_to + "\uffff",))
+        else:
+            hi = len(self._dates)
+        return {set_id for _, set_id in self._dates[lo:hi]}
+
+    def _match_file(self, pattern):
+        """파일명 필터(부분 문자열 또는 * ? 와일드카드)에 해당하는 세트 ID 집합을 반환합니다."""
+        pattern = pattern.lower()
+        use_glob = any(ch in pattern for ch in "*?[")
+        result = set()
+        for file_name, set_ids in self._file_names.items():
+            if (fnmatch.fnmatchcase(file_name, pattern) if use_glob else pattern in file_name):
+                result |= set_ids
+        return result
+
+    def search(self, query="", date_from=None, date_to=None, file_filter=None):
+        """
+        조건에 맞는 백업 세트 ID 목록을 최신순으로 반환합니다.
+
+        Parameters:
+        query (str): 검색어 (공백으로 구분된 각 단어를 접두어로 검색)
+        date_from (str, optional): 시작 날짜 (YYYY-MM-DD)
+        date_to (str, optional): 종료 날짜 (YYYY-MM-DD)
+        file_filter (str, optional): 파일명 필터
+
+        Returns:
+        list: 세트 ID 목록
+        """
+        candidates = None
+        for token in sorted(set(tokenize(query)), key=len, reverse=True):
+            matched = self._match_prefix(token)
+            candidates = set(matched) if candidates is None else candidates & matched
+            if not candidates:
+                return []
+
+        filters = []
+        if date_from or date_to:
+            filters.append(self._match_dates(date_from, date_to))
+        if file_filter:
+            filters.append(self._match_file(file_filter))
+        for matched in filters:
+            candidates = set(matched) if candidates is None else candidates & matched
+            if not candidates:
+                return []
+
+        if candidates is None:
+            return list(self.order)
+        return [set_id for set_id in self.order if set_id in candidates]
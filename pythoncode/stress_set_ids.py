@@ -0,0 +1,91 @@
+"""
+짧은 간격으로 반복되는 백업에서 세트 ID와 백업 파일이 겹치지 않는지 확인하는 스트레스 테스트입니다.
+
+여러 스레드가 같은 백업 폴더에 동시에 백업을 만들고, 끝난 뒤 카탈로그의 세트 수,
+세트 ID 중복 여부, 백업 파일 수, ID 정렬 순서를 검사합니다.
+
+사용법:
+    python stress_set_ids.py [--backups 500] [--threads 4]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+from file_manager import allocate_set_id, backup_save_file, save_backup_set, get_backup_sets
+
+def run(backup_count, thread_count, work_dir):
+    save_folder = os.path.join(work_dir, "save")
+    backup_folder = os.path.join(work_dir, "backup")
+    os.makedirs(save_folder)
+    os.makedirs(backup_folder)
+    save_file = os.path.join(save_folder, "slot1.sav")
+    with open(save_file, 'wb') as f:
+        f.write(os.urandom(4096))
+
+    created = []
+    created_lock = threading.Lock()
+    remaining = iter(range(backup_count))
+    remaining_lock = threading.Lock()
+
+    def worker():
+        while True:
+            with remaining_lock:
+                if next(remaining, None) is None:
+                    return
+            set_id = allocate_set_id(backup_folder)
+            backup_path = backup_save_file(save_file, backup_folder, set_id)
+            save_backup_set(backup_folder, set_id, [backup_path], "스트레스 테스트",
+                            source_paths=[save_file], source_root=save_folder)
+            with created_lock:
+                created.append(set_id)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    backup_sets = get_backup_sets(backup_folder)
+    backup_files = [name for name in os.listdir(backup_folder) if name.startswith("slot1_")]
+    set_ids = sorted(backup_sets)
+
+    print(f"백업 {len(created)}개 / {elapsed:.2f}초 ({len(created) / elapsed:.0f}개/초, 스레드 {thread_count}개)")
+    problems = []
+    if len(set(created)) != len(created):
+        problems.append(f"중복된 세트 ID: {len(created) - len(set(created))}개")
+    if len(backup_sets) != backup_count:
+        problems.append(f"카탈로그 세트 수 {len(backup_sets)} != {backup_count}")
+    if len(backup_files) != backup_count:
+        problems.append(f"백업 파일 수 {len(backup_files)} != {backup_count}")
+    # 같은 스레드에서 만든 ID는 항상 증가해야 하며, 날짜순 정렬이 ID 정렬과 같아야 함
+    dates = [backup_sets[set_id]["date"] for set_id in set_ids]
+    if dates != sorted(dates):
+        problems.append("세트 ID 순서와 날짜 순서가 다릅니다.")
+
+    for problem in problems:
+        print(f"실패: {problem}")
+    if not problems:
+        print("성공: 모든 세트 ID와 백업 파일이 고유합니다.")
+    return not problems
+
+def main():
+    parser = argparse.ArgumentParser(description="백업 세트 ID 충돌 스트레스 테스트")
+    parser.add_argument("--backups", type=int, default=500, help="만들 백업 세트 수")
+    parser.add_argument("--threads", type=int, default=4, help="동시에 백업하는 스레드 수")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="set_id_stress_")
+    try:
+        ok = run(args.backups, args.threads, work_dir)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 테스트는 pythoncode 폴더의 모듈을 바로 가져옴 (패키지가 아님)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
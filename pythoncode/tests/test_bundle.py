@@ -0,0 +1,79 @@
+import io
+import json
+import os
+import tarfile
+
+import pytest
+
+from bundle import export_backup_sets, import_bundle, BUNDLE_MANIFEST
+from file_manager import backup_save_file, save_backup_set, get_backup_sets, get_set_manifest
+from utils import new_set_id
+
+
+@pytest.fixture
+def bundle_path(tmp_path):
+    save_folder = tmp_path / "save"
+    save_folder.mkdir()
+    (save_folder / "slot1.sav").write_bytes(os.urandom(4096))
+    backup_folder = str(tmp_path / "backup")
+    set_id = new_set_id()
+    source = str(save_folder / "slot1.sav")
+    backup_path = backup_save_file(source, backup_folder, set_id)
+    save_backup_set(backup_folder, set_id, [backup_path], "테스트", source_paths=[source],
+                    source_root=str(save_folder))
+    path = str(tmp_path / "export.gsbundle")
+    export_backup_sets(backup_folder, path)
+    return path
+
+
+def _rewrite_manifest(src, dst, change):
+    """번들 설명(bundle.json)만 바꾸어 새 번들로 기록합니다."""
+    with tarfile.open(src, 'r:*') as tar, tarfile.open(dst, 'w:gz') as out:
+        for member in tar:
+            data = tar.extractfile(member).read()
+            if member.name == BUNDLE_MANIFEST:
+                manifest = json.loads(data)
+                change(manifest)
+                data = json.dumps(manifest).encode('utf-8')
+            member.size = len(data)
+            out.addfile(member, io.BytesIO(data))
+
+
+def test_import_round_trip(tmp_path, bundle_path):
+    backup_folder = str(tmp_path / "imported")
+    result = import_bundle(backup_folder, bundle_path)
+
+    assert len(result["sets"]) == 1
+    backup_set = get_backup_sets(backup_folder)[result["sets"][0]]
+    assert [entry["path"] for entry in get_set_manifest(backup_folder, backup_set)] == ["slot1.sav"]
+
+    # 이미 있는 세트는 다시 가져오지 않음
+    again = import_bundle(backup_folder, bundle_path)
+    assert again["sets"] == [] and again["skipped_sets"] == 1
+
+
+def test_import_rejects_file_of_another_set(tmp_path, bundle_path):
+    def move_to_other_set(manifest):
+        (set_id, record), = manifest["sets"].items()
+        other = "250101_000000_000000"
+        record["id"] = other
+        manifest["sets"] = {other: record}
+
+    tampered = str(tmp_path / "tampered.gsbundle")
+    _rewrite_manifest(bundle_path, tampered, move_to_other_set)
+    backup_folder = tmp_path / "imported"
+    with pytest.raises(ValueError):
+        import_bundle(str(backup_folder), tampered)
+    assert get_backup_sets(str(backup_folder)) == {}
+    assert not (backup_folder / "sets").exists()
+
+
+def test_import_rejects_restore_path_outside_save_folder(tmp_path, bundle_path):
+    def escape(manifest):
+        for record in manifest["sets"].values():
+            record["manifest"][0]["path"] = "../outside.sav"
+
+    tampered = str(tmp_path / "tampered.gsbundle")
+    _rewrite_manifest(bundle_path, tampered, escape)
+    with pytest.raises(ValueError):
+        import_bundle(str(tmp_path / "imported"), tampered)
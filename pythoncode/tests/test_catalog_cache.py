@@ -0,0 +1,50 @@
+import json
+import os
+
+from file_manager import get_backup_sets, write_backup_sets, invalidate_backup_sets_cache, BACKUP_SETS_FILE
+
+
+def _record(description):
+    return {"id": "250401_152655", "files": [], "description": description}
+
+
+def _write_behind_cache(catalog, backup_sets, replace):
+    """캐시를 거치지 않고 같은 크기, 같은 수정 시각으로 카탈로그를 고쳐 씁니다. (다른 프로세스의 기록)"""
+    st = os.stat(catalog)
+    data = json.dumps(backup_sets, indent=4).encode('utf-8')
+    assert len(data) == st.st_size
+    target = catalog + ".new" if replace else catalog
+    with open(target, 'wb') as f:
+        f.write(data)
+    os.utime(target, ns=(st.st_atime_ns, st.st_mtime_ns))
+    if replace:
+        os.replace(target, catalog)
+
+
+def test_catalog_replaced_by_another_process_is_reloaded(tmp_path):
+    backup_folder = str(tmp_path)
+    write_backup_sets(backup_folder, {"250401_152655": _record("first")})
+    assert get_backup_sets(backup_folder)["250401_152655"]["description"] == "first"
+
+    # 크기와 수정 시각이 같아도 rename으로 교체된 파일은 다시 읽음
+    _write_behind_cache(os.path.join(backup_folder, BACKUP_SETS_FILE),
+                        {"250401_152655": _record("other")}, replace=True)
+    assert get_backup_sets(backup_folder)["250401_152655"]["description"] == "other"
+
+
+def test_invalidate_drops_cached_catalog(tmp_path):
+    backup_folder = str(tmp_path)
+    write_backup_sets(backup_folder, {"250401_152655": _record("first")})
+    get_backup_sets(backup_folder)
+
+    _write_behind_cache(os.path.join(backup_folder, BACKUP_SETS_FILE),
+                        {"250401_152655": _record("other")}, replace=False)
+    invalidate_backup_sets_cache(backup_folder)
+    assert get_backup_sets(backup_folder)["250401_152655"]["description"] == "other"
+
+
+def test_missing_catalog_is_empty(tmp_path):
+    backup_folder = str(tmp_path)
+    write_backup_sets(backup_folder, {"250401_152655": _record("first")})
+    os.remove(os.path.join(backup_folder, BACKUP_SETS_FILE))
+    assert get_backup_sets(backup_folder) == {}
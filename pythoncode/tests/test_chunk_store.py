@@ -0,0 +1,68 @@
+import os
+import zipfile
+
+import pytest
+
+from chunk_store import ChunkStore, ChunkCorruptError, CHUNKED_SUFFIX, read_recipe, recipe_digests
+from file_manager import backup_save_file, restore_save_file
+from utils import new_set_id
+
+
+def _write_zip_save(path, members):
+    with zipfile.ZipFile(path, 'w') as zf:
+        for name, data, compression in members:
+            zf.writestr(name, data, compress_type=compression)
+
+
+@pytest.fixture
+def zip_save(tmp_path):
+    save_folder = tmp_path / "save"
+    save_folder.mkdir()
+    path = save_folder / "world.zip"
+    _write_zip_save(path, [
+        ("level.dat", os.urandom(200 * 1024), zipfile.ZIP_STORED),
+        ("players.json", b'{"name": "player"}' * 4096, zipfile.ZIP_DEFLATED),
+    ])
+    return path
+
+
+def test_zip_save_round_trip(tmp_path, zip_save):
+    backup_folder = str(tmp_path / "backup")
+    backup_path = backup_save_file(str(zip_save), backup_folder, new_set_id())
+
+    # 형식에 맞게 나누어 저장하면 원래 이름 대신 레시피만 남음
+    assert not os.path.exists(backup_path)
+    recipe = read_recipe(backup_path + CHUNKED_SUFFIX)
+    assert recipe["size"] == os.path.getsize(zip_save)
+
+    original = zip_save.read_bytes()
+    zip_save.write_bytes(b"overwritten")
+    restored = restore_save_file(backup_path, str(zip_save.parent), "world.zip")
+    assert open(restored, 'rb').read() == original
+
+
+def test_unchanged_save_reuses_chunks(tmp_path, zip_save):
+    backup_folder = str(tmp_path / "backup")
+    first = backup_save_file(str(zip_save), backup_folder, new_set_id())
+    second = backup_save_file(str(zip_save), backup_folder, new_set_id())
+
+    assert read_recipe(first + CHUNKED_SUFFIX)["stored"] > 0
+    assert read_recipe(second + CHUNKED_SUFFIX)["stored"] == 0
+
+
+def test_corrupt_chunk_leaves_save_untouched(tmp_path, zip_save):
+    backup_folder = str(tmp_path / "backup")
+    backup_path = backup_save_file(str(zip_save), backup_folder, new_set_id())
+    store = ChunkStore(backup_folder)
+    digest = recipe_digests(read_recipe(backup_path + CHUNKED_SUFFIX))[0]
+    chunk_path = store.path(digest)
+    data = bytearray(open(chunk_path, 'rb').read())
+    data[-1] ^= 0xFF
+    with open(chunk_path, 'wb') as f:
+        f.write(data)
+
+    zip_save.write_bytes(b"current save")
+    with pytest.raises(ChunkCorruptError):
+        restore_save_file(backup_path, str(zip_save.parent), "world.zip")
+    assert zip_save.read_bytes() == b"current save"
+    assert not os.path.exists(str(zip_save) + ".part")
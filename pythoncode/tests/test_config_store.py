@@ -0,0 +1,46 @@
+import json
+
+from config_store import ConfigStore
+
+
+def _store(tmp_path):
+    return ConfigStore(str(tmp_path / "config.json"), delay=60)
+
+
+def test_save_writes_primary_and_backup(tmp_path):
+    store = _store(tmp_path)
+    data = {"active_profile": "엘든링", "profiles": {"엘든링": {"save_folder": "C:/saves"}}}
+    store.save(data)
+    store.flush()
+
+    assert json.loads((tmp_path / "config.json").read_text(encoding='utf-8')) == data
+    assert json.loads((tmp_path / "config.json.bak").read_text(encoding='utf-8')) == data
+    assert store.load() == (data, "primary")
+
+
+def test_corrupt_primary_falls_back_to_backup(tmp_path):
+    store = _store(tmp_path)
+    data = {"active_profile": None, "profiles": {"a": {}}}
+    store.save(data)
+    store.flush()
+
+    (tmp_path / "config.json").write_bytes(b'{"profiles": {"a": ')
+    assert store.load() == (data, "backup")
+
+    # 형식은 JSON이지만 구조가 잘못된 경우도 사본 사용
+    (tmp_path / "config.json").write_text('{"profiles": []}', encoding='utf-8')
+    assert store.load() == (data, "backup")
+
+
+def test_latest_pending_save_wins(tmp_path):
+    store = _store(tmp_path)
+    store.save({"profiles": {"old": {}}})
+    store.save({"profiles": {"new": {}}})
+    store.flush()
+    assert store.load() == ({"profiles": {"new": {}}}, "primary")
+
+
+def test_nothing_to_load(tmp_path):
+    store = _store(tmp_path)
+    assert store.load() == (None, None)
+    assert not store.exists()
@@ -0,0 +1,60 @@
+import re
+
+import pytest
+
+from utils import new_set_id, parse_set_id
+from file_manager import allocate_set_id, write_backup_sets, _parse_backup_file_name
+
+SET_ID_PATTERN = re.compile(r"\d{6}_\d{6}_\d{6}")
+
+
+def test_set_id_format():
+    set_id = new_set_id()
+    assert SET_ID_PATTERN.fullmatch(set_id)
+    assert parse_set_id(set_id).strftime("%y%m%d_%H%M%S_%f") == set_id
+
+
+def test_legacy_set_id_still_parses():
+    assert parse_set_id("250401_152655").strftime("%Y-%m-%d %H:%M:%S") == "2025-04-01 15:26:55"
+    with pytest.raises(ValueError):
+        parse_set_id("not_a_set")
+
+
+def test_set_ids_are_unique_and_ordered():
+    set_ids = [new_set_id() for _ in range(2000)]
+    assert len(set(set_ids)) == len(set_ids)
+    assert set_ids == sorted(set_ids)
+    # 같은 초의 기존 형식 ID보다 뒤에 정렬됨
+    assert set_ids[0][:13] < set_ids[0]
+
+
+def test_taken_set_ids_are_skipped():
+    class Taken:
+        """처음 확인한 세 ID는 이미 사용 중이라고 답합니다."""
+        def __init__(self):
+            self.checked = []
+
+        def __contains__(self, set_id):
+            self.checked.append(set_id)
+            return len(self.checked) <= 3
+
+    taken = Taken()
+    set_id = new_set_id(taken)
+    assert set_id not in taken.checked[:3]
+    assert taken.checked == sorted(taken.checked)
+    assert new_set_id() > set_id
+
+
+def test_allocate_set_id_avoids_catalog(tmp_path):
+    backup_folder = str(tmp_path)
+    first = allocate_set_id(backup_folder)
+    write_backup_sets(backup_folder, {first: {"id": first, "files": []}})
+    assert allocate_set_id(backup_folder) != first
+
+
+def test_backup_file_name_carries_set_id():
+    set_id = new_set_id()
+    for suffix in ("", ".xz", ".chunks"):
+        assert _parse_backup_file_name(f"slot1_{set_id}.sav{suffix}")[0] == set_id
+    assert _parse_backup_file_name("slot1_250401_152655.sav")[0] == "250401_152655"
+    assert _parse_backup_file_name("slot1.sav")[0] is None
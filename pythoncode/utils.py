@@ -1,5 +1,299 @@
 import datetime
+import errno
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError: # 윈도우
+    fcntl = None
+    import msvcrt
 
 def get_timestamp():
     """현재 시간을 YYMMDD_HHMMSS 형식으로 반환"""
     return datetime.datetime.now().strftime("%y%m%d_%H%M%S")
+
+# 백업 세트 ID 형식: 기존 "YYMMDD_HHMMSS"와 마이크로초까지 포함한 "YYMMDD_HHMMSS_ffffff"
+SET_ID_FORMAT = "%y%m%d_%H%M%S_%f"
+LEGACY_SET_ID_FORMAT = "%y%m%d_%H%M%S"
+
+_last_set_time = None
+_set_id_lock = threading.Lock()
+
+def new_set_id(taken=()):
+    """
+    새 백업 세트 ID(YYMMDD_HHMMSS_ffffff)를 만듭니다.
+    
+    같은 프로세스 안에서는 항상 이전 ID보다 큰 값을 반환하므로(같은 마이크로초이거나 시계가
+    뒤로 가면 1마이크로초씩 증가) 1초에 여러 번 백업해도 ID와 백업 파일명이 겹치지 않습니다.
+    문자열 순서가 시간 순서와 같으며, 기존 형식 ID와 섞여도 올바르게 정렬됩니다.
+    
+    Parameters:
+    taken (container, optional): 이미 사용 중인 ID (예: 카탈로그). 겹치면 다음 값을 사용
+    
+    Returns:
+    str: 백업 세트 ID
+    """
+    global _last_set_time
+    step = datetime.timedelta(microseconds=1)
+    with _set_id_lock:
+        current = datetime.datetime.now()
+        if _last_set_time is not None and current <= _last_set_time:
+            current = _last_set_time + step
+        set_id = current.strftime(SET_ID_FORMAT)
+        while set_id in taken:
+            current += step
+            set_id = current.strftime(SET_ID_FORMAT)
+        _last_set_time = current
+        return set_id
+
+def parse_set_id(set_id):
+    """
+    백업 세트 ID를 datetime으로 변환합니다. 기존 형식(YYMMDD_HHMMSS)도 지원합니다.
+    형식이 맞지 않으면 ValueError가 발생합니다.
+    """
+    fmt = SET_ID_FORMAT if set_id.count("_") == 2 else LEGACY_SET_ID_FORMAT
+    return datetime.datetime.strptime(set_id, fmt)
+
+def format_size(num_bytes):
+    """바이트 수를 사람이 읽기 쉬운 문자열로 변환합니다. (예: 1536 -> "1.5 KB")"""
+    size = float(num_bytes)
+    sign = "-" if size < 0 else ""
+    size = abs(size)
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return f"{sign}{size:.0f} {unit}" if unit == "B" else f"{sign}{size:.1f} {unit}"
+        size /= 1024
+    return f"{sign}{size:.1f} TB"
+
+def fsync_file(path):
+    """파일 내용을 디스크에 기록(fsync)합니다. 윈도우는 쓰기 권한으로 열어야 fsync할 수 있습니다."""
+    flags = os.O_RDWR | getattr(os, "O_BINARY", 0) if os.name == "nt" else os.O_RDONLY
+    fd = os.open(path, flags)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def fsync_directory(path):
+    """폴더의 항목 변경(파일 생성, rename)을 디스크에 기록합니다. (윈도우는 지원하지 않아 건너뜀)"""
+    if os.name == "nt":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass # 폴더 fsync를 지원하지 않는 파일 시스템
+    finally:
+        os.close(fd)
+
+def lock_file(path):
+    """
+    잠금 파일을 열고 다른 프로세스와 공유하지 않는 잠금을 잡은 뒤 파일 디스크립터를 반환합니다.
+    다른 프로세스가 잡고 있으면 풀릴 때까지 기다리며, 프로세스가 종료되면 잠금은 자동으로 풀립니다.
+    같은 프로세스 안에서 같은 파일을 두 번 잡으면 기다리게 되므로 호출하는 쪽에서 중첩을 막아야 합니다.
+    """
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:
+            while True:
+                try:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue # LK_LOCK은 10초 동안 다시 시도한 뒤 실패하므로 계속 기다림
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+def unlock_file(fd):
+    """lock_file로 잡은 잠금을 풀고 파일을 닫습니다."""
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    finally:
+        os.close(fd)
+
+def atomic_write_bytes(path, data, fsync=True):
+    """
+    임시 파일에 기록한 뒤 rename하여 파일을 원자적으로 교체합니다.
+    기록 도중 프로그램이 종료되어도 기존 파일은 손상되지 않습니다.
+    fsync가 True면 rename 전에 내용을, rename 후에 폴더를 디스크에 기록하여 전원이 꺼져도 새 내용이 유지됩니다.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp_", dir=directory)
+    try:
+        # mkstemp는 0600 권한으로 생성하므로 기존 파일 권한을 유지
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except OSError:
+            mode = 0o644
+        os.chmod(tmp_path, mode)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    if fsync:
+        fsync_directory(directory)
+
+def atomic_write_json(path, data, indent=None):
+    """JSON 데이터를 원자적으로 파일에 저장합니다."""
+    atomic_write_bytes(path, json.dumps(data, ensure_ascii=False, indent=indent).encode('utf-8'))
+
+# posix_fadvise는 리눅스 등 일부 POSIX 시스템에서만 제공됨
+HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+def advise_sequential(fd):
+    """파일 전체를 순차적으로 읽을 것임을 커널에 알려 미리 읽기(read-ahead)를 늘립니다."""
+    if HAS_FADVISE:
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+def drop_page_cache(fd, offset=0, length=0):
+    """
+    파일의 지정 범위를 페이지 캐시에서 내보내도록 커널에 알립니다. (length=0이면 끝까지)
+    쓰기 파일은 먼저 디스크에 기록(fdatasync)해야 실제로 캐시에서 제거됩니다.
+    """
+    if HAS_FADVISE:
+        try:
+            os.posix_fadvise(fd, offset, length, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+
+# SEEK_DATA/SEEK_HOLE은 리눅스, macOS 등 일부 시스템에서만 제공됨
+HAS_SEEK_HOLE = hasattr(os, "SEEK_DATA") and hasattr(os, "SEEK_HOLE")
+
+def may_be_sparse(st):
+    """stat 결과로 파일에 구멍(hole)이 있을 수 있는지 확인합니다. (할당된 블록이 파일 크기보다 작음)"""
+    return HAS_SEEK_HOLE and getattr(st, "st_blocks", None) is not None and st.st_blocks * 512 < st.st_size
+
+def sparse_map(f):
+    """
+    구멍이 있는 희소 파일이면 (파일 크기, [(데이터 시작 위치, 길이), ...])를 반환합니다.
+    희소 파일이 아니거나, 일반 파일이 아니거나(압축 스트림 등), 파일 시스템이 지원하지 않으면 None을 반환합니다.
+    파일을 읽기 전에 호출해야 합니다.
+    """
+    if not isinstance(f, io.BufferedReader):
+        return None
+    fd = f.fileno()
+    st = os.fstat(fd)
+    # 일반 파일은 추가 시스템 호출 없이 바로 순차 읽기
+    if not may_be_sparse(st):
+        return None
+    extents = []
+    offset = 0
+    try:
+        while offset < st.st_size:
+            try:
+                start = os.lseek(fd, offset, os.SEEK_DATA)
+            except OSError as e:
+                if e.errno == errno.ENXIO:
+                    break # 나머지는 모두 구멍
+                raise
+            if start >= st.st_size:
+                break
+            end = min(os.lseek(fd, start, os.SEEK_HOLE), st.st_size)
+            extents.append((start, end - start))
+            offset = end
+    except OSError:
+        return None # 파일 시스템이 구멍 찾기를 지원하지 않음
+    finally:
+        os.lseek(fd, 0, os.SEEK_SET)
+    return st.st_size, extents
+
+def iter_data_chunks(f, chunk_size, layout=None):
+    """
+    파일을 chunk_size 단위로 읽어 (위치, 데이터)를 차례로 반환합니다.
+    layout(sparse_map의 결과)이 주어지면 데이터 구간만 읽고 구멍은 읽지 않고 건너뜁니다.
+    """
+    if layout is None:
+        offset = 0
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield offset, chunk
+            offset += len(chunk)
+    for start, length in layout[1]:
+        f.seek(start)
+        offset = start
+        end = start + length
+        while offset < end:
+            chunk = f.read(min(chunk_size, end - offset))
+            if not chunk:
+                return # 읽는 도중 파일이 줄어듦
+            yield offset, chunk
+            offset += len(chunk)
+
+def iter_content_chunks(f, chunk_size):
+    """
+    파일 내용을 chunk_size 이하 단위로 차례로 반환합니다. (데이터, 디스크에서 읽었는지 여부)
+    희소 파일의 구멍은 디스크에서 읽지 않고 0으로 채운 데이터를 반환하므로 해시 계산 결과는 같습니다.
+    """
+    layout = sparse_map(f)
+    zeros = memoryview(bytes(chunk_size)) if layout is not None else None
+    position = 0
+    for offset, chunk in iter_data_chunks(f, chunk_size, layout):
+        while position < offset:
+            hole = zeros[:min(chunk_size, offset - position)]
+            yield hole, False
+            position += len(hole)
+        yield chunk, True
+        position = offset + len(chunk)
+    if layout is not None:
+        while position < layout[0]:
+            hole = zeros[:min(chunk_size, layout[0] - position)]
+            yield hole, False
+            position += len(hole)
+
+class RateLimiter:
+    """
+    토큰 버킷 방식의 초당 바이트 제한기입니다.
+    여러 스레드가 하나의 제한기를 공유하면 전체 처리량이 제한됩니다.
+    bytes_per_second가 None 또는 0이면 제한하지 않습니다.
+    """
+
+    def __init__(self, bytes_per_second=None, burst=None):
+        self.rate = bytes_per_second or 0
+        self.burst = burst or max(self.rate, 1)
+        self._tokens = self.burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_mbps(cls, mbps):
+        """MB/s 단위 설정값으로 제한기를 만듭니다."""
+        return cls(int(mbps * 1024 * 1024) if mbps else None)
+
+    def consume(self, amount):
+        """amount 바이트를 사용하고, 제한을 넘으면 필요한 만큼 대기합니다."""
+        if not self.rate:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= amount
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait > 0:
+            time.sleep(wait)